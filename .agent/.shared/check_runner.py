@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Check Runner - how checklist.py and verify_all.py run a check script
+
+Check scripts that define run_check(project_path, url=None) -> dict (with a
+"passed" key) are imported and called directly; others run as a subprocess.
+
+Runners:
+    inprocess   worker threads (the default)
+    fork        a fork()ed process pool, so CPU-bound scans run in parallel
+    subprocess  one interpreter per check, `python <script> <project> [url]`
+
+In-process checkers share one file inventory (file_inventory.py), so each
+project file is read at most once per run (once per worker with fork).
+
+Every runner is bounded by the caller's per-check timeout: CheckPool.wait()
+reports a check that runs past it as timed out. A thread cannot be killed,
+so a timed-out check is abandoned to finish on its own while later checks go
+to a fresh pool; exit_run() then ends the process without waiting for it.
+
+Usage:
+    from check_runner import CheckPool, exit_run, load_plugin, run_plugin
+
+    entry_point = load_plugin(script_path)
+    if entry_point is not None:
+        result = run_plugin(name, entry_point, project_path, url, time.perf_counter())
+"""
+
+import importlib.util
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Optional
+
+CHECK_ENTRY_POINT = "run_check"
+RUNNERS = ("inprocess", "fork", "subprocess")
+DEFAULT_RUNNER = "inprocess"
+
+_PLUGINS = {}
+_PLUGINS_LOCK = threading.Lock()
+
+# Set once a timed-out in-process check is still running when its pool closes
+_ABANDONED_THREADS = False
+
+
+def load_plugin(script_path: Path):
+    """Import a check script once per process and return its entry point (None if it has none)."""
+    key = str(script_path)
+    with _PLUGINS_LOCK:
+        if key not in _PLUGINS:
+            # Only import scripts that opt in: others may do their work at import time
+            source = script_path.read_text(encoding="utf-8", errors="replace")
+            if f"def {CHECK_ENTRY_POINT}(" not in source:
+                _PLUGINS[key] = None
+                return None
+            spec = importlib.util.spec_from_file_location(f"check_{script_path.stem}", script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _PLUGINS[key] = getattr(module, CHECK_ENTRY_POINT, None)
+        return _PLUGINS[key]
+
+
+def run_plugin(name: str, entry_point, project_path: str, url: Optional[str], start: float) -> dict:
+    """Call a check's entry point in this process and wrap its structured result."""
+    try:
+        report = entry_point(project_path, url)
+    except (Exception, SystemExit) as e:
+        return {"name": name, "passed": False, "output": "", "error": f"{type(e).__name__}: {e}", "skipped": False,
+                "duration": time.perf_counter() - start}
+    return {
+        "name": name,
+        "passed": bool(report.get("passed")),
+        "output": "",
+        "error": report.get("error", "") if not report.get("passed") else "",
+        "report": report,
+        "skipped": False,
+        "duration": time.perf_counter() - start
+    }
+
+
+def share_inventory(project_path: Path):
+    """Walk the project once before forking, so every worker inherits the file inventory."""
+    from file_inventory import get_inventory
+    get_inventory(project_path)
+
+
+def make_executor(runner: str, jobs: int):
+    """Worker pool for a runner: a fork()ed process pool for "fork", threads otherwise."""
+    if runner != "fork":
+        return ThreadPoolExecutor(max_workers=jobs)
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    return ProcessPoolExecutor(max_workers=jobs, mp_context=context)
+
+
+class CheckPool:
+    """
+    Worker pool (see make_executor) that stops waiting for checks after `timeout` seconds.
+
+    Callers never submit more than `jobs` checks at once, so a check starts
+    when it is submitted and its deadline is counted from then.
+    """
+
+    def __init__(self, runner: str, jobs: int, timeout: float):
+        self.runner = runner
+        self.jobs = jobs
+        self.timeout = timeout
+        self._pool = make_executor(runner, jobs)
+        self._started = {}
+        self._abandoned = []  # (futures that timed out, the worker processes of their pool)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, fn, *args):
+        future = self._pool.submit(fn, *args)
+        self._started[future] = time.perf_counter()
+        return future
+
+    def wait(self, futures) -> tuple:
+        """Block until one of the futures finishes or passes its deadline; returns (finished, timed_out)."""
+        deadline = min(self._started[future] for future in futures) + self.timeout
+        finished, _ = wait(futures, timeout=max(0.0, deadline - time.perf_counter()), return_when=FIRST_COMPLETED)
+        now = time.perf_counter()
+        timed_out = {future for future in futures
+                     if future not in finished and now - self._started[future] >= self.timeout}
+        for future in finished | timed_out:
+            del self._started[future]
+        if timed_out:
+            # Its worker stays busy: leave the other running checks on this
+            # pool and start new ones on a fresh pool of `jobs` workers
+            processes = list((getattr(self._pool, "_processes", None) or {}).values())  # cleared by shutdown()
+            self._pool.shutdown(wait=False)
+            self._abandoned.append((timed_out, processes))
+            self._pool = make_executor(self.runner, self.jobs)
+        return finished, timed_out
+
+    def close(self):
+        global _ABANDONED_THREADS
+        self._pool.shutdown(wait=True)
+        for timed_out, processes in self._abandoned:
+            if all(future.done() for future in timed_out):
+                continue
+            if self.runner == "fork":
+                # The caller has collected every other check, so only hung workers are left
+                for process in processes:
+                    process.terminate()
+            else:
+                _ABANDONED_THREADS = True
+
+
+def exit_run(code: int):
+    """sys.exit(code), unless a timed-out check's thread is still running: then exit without joining it."""
+    if _ABANDONED_THREADS:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    sys.exit(code)
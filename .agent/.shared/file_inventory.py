@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Project File Inventory - one walk and one read per file, shared by all checkers
+
+The checker scripts in .agent/skills/*/scripts ask get_inventory(project_path)
+for files instead of walking the tree themselves. The first call walks the
+project once (path, extension, size, mtime); file contents are read on first
+use and memoized, so a verification run that imports several checkers into
+one process (checklist.py / verify_all.py) reads each file from disk at most
+once.
+
+Incremental mode (AGENT_INCREMENTAL=1, set by checklist.py / verify_all.py
+--incremental): checkers pass their per-file work through
+inventory.findings(), which keeps each file's findings in
+<project>/.agent/cache keyed by checker version and file content, so only
+changed files are re-audited. Tree-wide work (npm audit, linters) goes
+through inventory.result() and is re-run only when its input files change.
+
+Usage:
+    from file_inventory import get_inventory, read_text
+
+    for entry in get_inventory(project_path).files('.tsx', '.jsx', skip_dirs={'dist', 'build'}):
+        content = read_text(entry)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+# Never inventoried: no checker looks inside these, and they are huge
+PRUNE_DIRS = {'node_modules', '.git'}
+
+# Incremental mode: switched on by this environment variable, so it reaches
+# checkers run in-process, in a forked pool or as subprocesses alike
+INCREMENTAL_ENV = "AGENT_INCREMENTAL"
+CACHE_DIR = ('.agent', 'cache')       # under the inventory root; never inventoried itself
+CACHE_FILE = "findings.sqlite"
+CACHE_VERSION = "1"                   # bump when the stored layout or read_text() semantics change
+TREE_RESULT_MAX_AGE = 24 * 3600       # seconds; tree-wide results (e.g. npm audit) go stale without input changes
+
+
+class FileEntry(NamedTuple):
+    path: Path        # absolute path
+    rel: str          # POSIX path relative to the inventory root
+    dirs: tuple       # directory parts of rel, for skip_dirs filtering
+    ext: str          # lowercased suffix ('' for dotfiles such as .env)
+    size: int
+    mtime: float
+
+
+class FileInventory:
+    """Every file under a root, walked once (contents: see read_text)."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root).resolve()
+        self.entries = self._walk()
+        self._cache = None
+        self._cache_lock = threading.Lock()
+
+    def _walk(self) -> List[FileEntry]:
+        # Same order as os.walk / Path.glob('**/...'): a directory's files, then its subdirectories
+        entries = []
+        pending = [(self.root, ())]
+        while pending:
+            directory, dirs = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    children = list(it)
+            except OSError:
+                continue
+            subdirs = []
+            for child in children:
+                try:
+                    is_dir = child.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if child.name not in PRUNE_DIRS and not child.is_symlink() and dirs + (child.name,) != CACHE_DIR:
+                        subdirs.append((Path(child.path), dirs + (child.name,)))
+                    continue
+                try:
+                    stat = child.stat()
+                    size, mtime = stat.st_size, stat.st_mtime
+                except OSError:
+                    size, mtime = 0, 0.0  # broken symlink; reading it fails later
+                rel = "/".join(dirs + (child.name,))
+                ext = os.path.splitext(child.name)[1].lower()
+                entries.append(FileEntry(Path(child.path), rel, dirs, ext, size, mtime))
+            pending.extend(reversed(subdirs))
+        return entries
+
+    def files(self, *extensions: str, skip_dirs: Iterable[str] = ()) -> List[FileEntry]:
+        """Entries with one of the extensions (all when none given), outside any skip_dirs directory."""
+        wanted = {ext.lower() for ext in extensions}
+        skip = set(skip_dirs)
+        return [entry for entry in self.entries
+                if (not wanted or entry.ext in wanted) and not (skip and skip.intersection(entry.dirs))]
+
+    def named(self, *rels: str) -> List[FileEntry]:
+        """Entries at the given relative paths (e.g. manifests at the project root), skipping missing ones."""
+        wanted = set(rels)
+        return [entry for entry in self.entries if entry.rel in wanted]
+
+    def cache(self) -> Optional['FindingsCache']:
+        """The project's findings cache, or None outside incremental mode."""
+        if os.environ.get(INCREMENTAL_ENV, "") in ("", "0"):
+            return None
+        with self._cache_lock:
+            if self._cache is None:
+                self._cache = FindingsCache(self.root)
+            return self._cache
+
+    def findings(self, checker: str, version: str, entry: FileEntry, compute: Callable[[FileEntry], Any]) -> Any:
+        """compute(entry), or the findings it returned last time if neither the file nor the checker changed."""
+        cache = self.cache()
+        return compute(entry) if cache is None else cache.findings(checker, version, entry, compute)
+
+    def result(self, checker: str, version: str, inputs: List[FileEntry], compute: Callable[[], Any],
+               keep: Callable[[Any], bool] = None) -> Any:
+        """compute() for tree-wide work, or its last result while the input files are unchanged."""
+        cache = self.cache()
+        return compute() if cache is None else cache.result(checker, version, inputs, compute, keep)
+
+    def stats(self) -> dict:
+        stats = {"root": str(self.root), "files": len(self.entries), **read_stats()}
+        if self._cache is not None:
+            stats.update(audited=self._cache.misses, reused=self._cache.hits)
+        return stats
+
+
+def checker_version(script: Union[str, Path]) -> str:
+    """Version of a checker script for cache keys: a hash of its source, so editing it invalidates its findings."""
+    with open(script, 'rb') as f:
+        return hashlib.sha256(CACHE_VERSION.encode('utf-8') + f.read()).hexdigest()[:16]
+
+
+def _git_changed_files(root: Path) -> set:
+    """Paths (relative to root) that git reports as modified or untracked; empty outside a git work tree."""
+    changed = set()
+    for cmd in (["git", "diff", "--name-only", "-z", "--relative", "HEAD"],
+                ["git", "ls-files", "--others", "--exclude-standard", "-z"]):
+        try:
+            proc = subprocess.run(cmd, cwd=str(root), capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            return set()
+        if proc.returncode != 0:
+            return set()
+        changed.update(path for path in proc.stdout.split('\0') if path)
+    return changed
+
+
+class FindingsCache:
+    """
+    SQLite store of checker findings under <root>/.agent/cache.
+
+    Per-file findings are keyed by checker, checker version, file path and
+    the SHA-256 of the file's contents. The hash is remembered by mtime and
+    size, so an unchanged file is neither re-read nor re-audited; files git
+    reports as changed or untracked are always re-hashed. Tree-wide results
+    are keyed by a fingerprint of their input files and expire after
+    TREE_RESULT_MAX_AGE. Any SQLite error is treated as a miss.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root.joinpath(*CACHE_DIR, CACHE_FILE)
+        self.hits = 0
+        self.misses = 0
+        self._changed = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread, and per process after a fork
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        if not self.path.parent.is_dir():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            (self.path.parent / ".gitignore").write_text("*\n", encoding='utf-8')  # keep the cache out of git
+        conn = sqlite3.connect(str(self.path), timeout=10.0)
+        conn.execute("PRAGMA journal_mode = WAL")  # concurrent checkers read while one writes
+        conn.execute("PRAGMA synchronous = OFF")   # a lost write is just a future miss
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime REAL NOT NULL, "
+                         "size INTEGER NOT NULL, sha256 TEXT NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS findings (checker TEXT NOT NULL, path TEXT NOT NULL, "
+                         "version TEXT NOT NULL, sha256 TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (checker, path))")
+            conn.execute("CREATE TABLE IF NOT EXISTS results (checker TEXT PRIMARY KEY, version TEXT NOT NULL, "
+                         "inputs TEXT NOT NULL, value TEXT NOT NULL, created REAL NOT NULL)")
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def changed_files(self) -> set:
+        with self._lock:
+            if self._changed is None:
+                self._changed = _git_changed_files(self.root)
+            return self._changed
+
+    def content_hash(self, conn: sqlite3.Connection, entry: FileEntry) -> str:
+        """SHA-256 of a file, read and hashed only if its mtime or size moved (or git lists it)."""
+        row = conn.execute("SELECT mtime, size, sha256 FROM files WHERE path = ?", (entry.rel,)).fetchone()
+        if row and (row[0], row[1]) == (entry.mtime, entry.size) and entry.rel not in self.changed_files():
+            return row[2]
+        sha = hashlib.sha256(read_bytes(entry)).hexdigest()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (entry.rel, entry.mtime, entry.size, sha))
+        return sha
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def findings(self, checker: str, version: str, entry: FileEntry, compute: Callable[[FileEntry], Any]) -> Any:
+        try:
+            conn = self._connect()
+            sha = self.content_hash(conn, entry)
+            row = conn.execute("SELECT value FROM findings WHERE checker = ? AND path = ? AND version = ? AND sha256 = ?",
+                               (checker, entry.rel, version, sha)).fetchone()
+        except (sqlite3.Error, OSError):
+            return compute(entry)  # cache unusable, or an unreadable file (for the checker to report)
+        self._count(row is not None)
+        if row is not None:
+            return json.loads(row[0])
+        value = compute(entry)
+        try:
+            # Hand back the stored form, so a miss and a later hit look the same to the checker
+            text = json.dumps(value)
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?)", (checker, entry.rel, version, sha, text))
+            return json.loads(text)
+        except (sqlite3.Error, TypeError, ValueError):
+            return value
+
+    def result(self, checker: str, version: str, inputs: List[FileEntry], compute: Callable[[], Any],
+               keep: Callable[[Any], bool] = None) -> Any:
+        try:
+            conn = self._connect()
+            digest = hashlib.sha256()
+            for entry in sorted(inputs, key=lambda e: e.rel):
+                digest.update(f"{entry.rel}\0{self.content_hash(conn, entry)}\n".encode('utf-8'))
+            fingerprint = digest.hexdigest()
+            row = conn.execute("SELECT value FROM results WHERE checker = ? AND version = ? AND inputs = ? AND created > ?",
+                               (checker, version, fingerprint, time.time() - TREE_RESULT_MAX_AGE)).fetchone()
+        except (sqlite3.Error, OSError):
+            return compute()
+        self._count(row is not None)
+        if row is not None:
+            return json.loads(row[0])
+        value = compute()
+        if keep is None or keep(value):
+            try:
+                text = json.dumps(value)
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                                 (checker, version, fingerprint, text, time.time()))
+                return json.loads(text)
+            except (sqlite3.Error, TypeError, ValueError):
+                pass
+        return value
+
+
+_INVENTORIES: Dict[Path, FileInventory] = {}
+_INVENTORIES_LOCK = threading.Lock()
+
+
+def get_inventory(root: Union[str, Path], refresh: bool = False) -> FileInventory:
+    """Process-wide inventory for a project root (walked on first request, or again with refresh)."""
+    key = Path(root).resolve()
+    with _INVENTORIES_LOCK:
+        inventory = _INVENTORIES.get(key)
+        if inventory is None or refresh:
+            inventory = _INVENTORIES[key] = FileInventory(key)
+        return inventory
+
+
+# Contents are memoized per absolute path, so they are shared across roots.
+# _CONTENTS_LOCK only guards the dicts: the read itself holds just its file's
+# lock, so checkers on other threads read other files in parallel.
+_CONTENTS: Dict[str, bytes] = {}
+_FILE_LOCKS: Dict[str, threading.Lock] = {}
+_CONTENTS_LOCK = threading.Lock()
+
+
+def read_bytes(path: Union[FileEntry, Path, str]) -> bytes:
+    """File contents, read from disk on first use (raises OSError like open())."""
+    key = os.path.abspath(path.path if isinstance(path, FileEntry) else path)
+    data = _CONTENTS.get(key)
+    if data is not None:
+        return data
+    with _CONTENTS_LOCK:
+        file_lock = _FILE_LOCKS.setdefault(key, threading.Lock())
+    with file_lock:
+        data = _CONTENTS.get(key)  # read by another thread while this one waited
+        if data is None:
+            with open(key, 'rb') as f:
+                data = f.read()
+            with _CONTENTS_LOCK:
+                data = _CONTENTS.setdefault(key, data)
+        return data
+
+
+def read_text(path: Union[FileEntry, Path, str], errors: str = 'ignore') -> str:
+    """UTF-8 contents with universal newlines, like open(path, encoding='utf-8', errors=errors).read()."""
+    text = read_bytes(path).decode('utf-8', errors)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def read_stats() -> dict:
+    """How many files (and bytes) this process has read from disk."""
+    with _CONTENTS_LOCK:
+        return {"reads": len(_CONTENTS), "bytes_read": sum(len(data) for data in _CONTENTS.values())}
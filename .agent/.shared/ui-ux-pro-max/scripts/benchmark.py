@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - search latency, throughput and ranking checks
+Usage: python benchmark.py suite [--sizes 1000,10000,100000] [--targets style,ux,stack:react] [-o report.json]
+       python benchmark.py relevance
+       python benchmark.py startup [--budget-ms 35]
+       python benchmark.py compare baseline.json report.json [--tolerance 0.1]
+       python benchmark.py backends [--docs 10000] [--queries 1000] [--json]
+
+suite: writes synthetic CSVs with the real column schemas (values drawn from
+each column's real vocabulary) at every size and measures, per target:
+cold start of search.py with and without a cached index, index build and
+cached load, single-query p50/p99, batch throughput and the peak RSS of the
+cold-start process. It also times generate_design_system() on the real data
+and runs the relevance fixture. The JSON report can be diffed across commits
+with compare.
+
+relevance: checks that every query in benchmarks/relevance.csv still returns
+its expected top row (exit code 1 otherwise).
+
+startup: profiles a plain `search.py <query> --json` run with -X importtime
+and fails (exit code 1) when its imports exceed the budget or pull in a
+module that only other commands need (design_system, argparse, hashlib).
+
+backends: compares the pure-Python BM25 with the NumPy/SciPy SparseBM25
+backend on a real CSV and on a synthetic corpus of --docs documents, for a
+single query and for a batch of --queries queries, and checks that both
+return the same ranking.
+"""
+
+import argparse
+import compileall
+import csv
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import core
+from core import BM25, CSV_CONFIG, STACK_CONFIG, DATA_DIR, SYNONYMS_FILE, _STACK_COLS, get_index, search_fields
+
+SEED = 1337
+SCRIPTS_DIR = Path(__file__).parent
+FIXTURE_FILE = SCRIPTS_DIR.parent / "benchmarks" / "relevance.csv"
+SUITE_SIZES = (1000, 10000, 100000)
+SUITE_TARGETS = ("style", "ux", "stack:react")
+SUITE_QUERIES = 200
+STARTUP_BUDGET_MS = 35.0
+STARTUP_FORBIDDEN = ("design_system", "argparse", "hashlib")
+DESIGN_SYSTEM_QUERIES = ("SaaS dashboard", "e-commerce luxury", "healthcare app calm", "fintech crypto dark",
+                         "beauty spa wellness", "gaming esports vibrant", "education kids playful", "portfolio minimal")
+
+
+def _synthetic_documents(vocab: list, n_docs: int, rng: random.Random) -> list:
+    """Documents drawn from a real vocabulary with realistic length spread."""
+    return [" ".join(rng.choice(vocab) for _ in range(rng.randint(8, 40))) for _ in range(n_docs)]
+
+
+def _random_queries(vocab: list, n_queries: int, rng: random.Random) -> list:
+    return [" ".join(rng.choice(vocab) for _ in range(rng.randint(1, 5))) for _ in range(n_queries)]
+
+
+def _time_backend(bm25: BM25, queries: list, k: int, backend: str):
+    """Return (seconds, rankings) for scoring queries with the given backend."""
+    previous = core.SCORING_BACKEND
+    core.SCORING_BACKEND = backend
+    try:
+        start = time.perf_counter()
+        if len(queries) == 1 and backend == "python":
+            rankings = [bm25.top_k(queries[0], k)]
+        else:
+            rankings = bm25.top_k_batch(queries, k)
+        return time.perf_counter() - start, rankings
+    finally:
+        core.SCORING_BACKEND = previous
+
+
+def bench_backends(n_docs: int = 10000, n_queries: int = 1000, k: int = 3) -> dict:
+    """Throughput for 1 and n_queries queries, per backend and corpus."""
+    rng = random.Random(SEED)
+    source = CSV_CONFIG["ux"]
+    _, real = get_index(DATA_DIR / source["file"], search_fields(source))
+    vocab = sorted(real.postings)
+
+    synthetic = BM25()
+    synthetic.fit(_synthetic_documents(vocab, n_docs, rng))
+
+    report = {"sparse_available": core._sparse_modules() is not None, "corpora": {}}
+    for name, bm25 in ((source["file"], real), (f"synthetic-{n_docs}", synthetic)):
+        entry = {"documents": bm25.N}
+        if report["sparse_available"]:
+            start = time.perf_counter()
+            bm25.sparse_backend()
+            entry["sparse_build_s"] = round(time.perf_counter() - start, 4)
+
+        for batch_size in (1, n_queries):
+            queries = _random_queries(vocab, batch_size, rng)
+            row = {}
+            py_time, py_rank = _time_backend(bm25, queries, k, "python")
+            row["python_qps"] = round(batch_size / py_time, 1)
+            if report["sparse_available"]:
+                sp_time, sp_rank = _time_backend(bm25, queries, k, "sparse")
+                row["sparse_qps"] = round(batch_size / sp_time, 1)
+                row["rankings_match"] = sp_rank == py_rank
+            entry[f"batch_{batch_size}"] = row
+        report["corpora"][name] = entry
+    return report
+
+
+# ============ SUITE ============
+def _target_config(target: str) -> dict:
+    """CSV_CONFIG entry for a domain, or the stack schema for "stack:<name>" """
+    if target.startswith("stack:"):
+        return {**_STACK_COLS, "file": STACK_CONFIG[target[6:]]["file"]}
+    return CSV_CONFIG[target]
+
+
+def _percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+
+def _latency(samples: list) -> dict:
+    return {
+        "p50_ms": round(_percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(_percentile(samples, 99) * 1000, 3),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3)
+    }
+
+
+def _column_models(filepath: Path) -> tuple:
+    """(header, {column: (vocabulary, token counts)}) from a real CSV"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        header = list(reader.fieldnames or [])
+        rows = list(reader)
+    models = {}
+    for col in header:
+        values = [str(row.get(col) or "").split() for row in rows]
+        vocab = [word for words in values for word in words] or [""]
+        models[col] = (vocab, [len(words) for words in values] or [0])
+    return header, models
+
+
+def write_synthetic_csv(source: Path, target: Path, n_rows: int, id_col: str, rng: random.Random):
+    """Synthetic CSV with source's columns, word frequencies and value lengths"""
+    header, models = _column_models(source)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(header)
+        for i in range(n_rows):
+            row = []
+            for col in header:
+                if col == id_col:
+                    row.append(str(i + 1))
+                    continue
+                vocab, lengths = models[col]
+                row.append(" ".join(rng.choice(vocab) for _ in range(rng.choice(lengths))))
+            writer.writerow(row)
+
+
+def _suite_queries(filepath: Path, config: dict, n_queries: int, rng: random.Random) -> list:
+    """Queries of 1-4 words drawn from the target's search columns"""
+    _, models = _column_models(filepath)
+    vocab = [w for col in config["search_cols"] for w in models.get(col, ([], []))[0] if w]
+    return [" ".join(rng.choice(vocab) for _ in range(rng.randint(1, 4))) for _ in range(n_queries)]
+
+
+def _run_child(args: list, env: dict) -> tuple:
+    """(seconds, peak RSS in MB or None) for one child process"""
+    start = time.perf_counter()
+    proc = subprocess.Popen(args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    rss = None
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        # ru_maxrss is in KB on Linux and in bytes on macOS
+        rss = round(usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    else:
+        proc.wait()
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {proc.returncode}")
+    return elapsed, rss
+
+
+def _use_data_dir(path: Path):
+    """Point core (this process) at another data directory"""
+    core.DATA_DIR = path
+    core.INDEX_DIR = path / ".index"
+    core.clear_caches()
+
+
+def bench_target(data_dir: Path, target: str, n_rows: int, n_queries: int, rng: random.Random) -> dict:
+    """All measurements for one target at one corpus size (data_dir holds the synthetic CSV)"""
+    config = _target_config(target)
+    filepath = data_dir / config["file"]
+    fields = search_fields(config)
+    queries = _suite_queries(filepath, config, n_queries, rng)
+    entry = {"rows": n_rows}
+
+    # Cold start: a fresh search.py process, first without and then with the on-disk index
+    env = {**os.environ, "UIPRO_DATA_DIR": str(data_dir)}
+    cli = [sys.executable, str(SCRIPTS_DIR / "search.py"), queries[0], "--json"]
+    cli += ["--stack", target[6:]] if target.startswith("stack:") else ["--domain", target]
+    shutil.rmtree(data_dir / ".index", ignore_errors=True)
+    entry["cold_start_build_s"], rss_build = _run_child(cli, env)
+    entry["cold_start_s"], rss_cached = _run_child(cli, env)
+    if rss_build is not None:
+        entry["peak_rss_mb"] = max(rss_build, rss_cached)
+
+    _use_data_dir(data_dir)
+    start = time.perf_counter()
+    core.load_index(filepath, fields, use_cache=False)
+    entry["index_build_s"] = round(time.perf_counter() - start, 4)
+    start = time.perf_counter()
+    core.load_index(filepath, fields)
+    entry["index_load_s"] = round(time.perf_counter() - start, 4)
+    entry["cold_start_build_s"] = round(entry["cold_start_build_s"], 4)
+    entry["cold_start_s"] = round(entry["cold_start_s"], 4)
+
+    get_index(filepath, fields)
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        if target.startswith("stack:"):
+            core.search_stack(query, target[6:])
+        else:
+            core.search(query, target)
+        samples.append(time.perf_counter() - start)
+    entry["query"] = _latency(samples)
+
+    # Warm-up batch first, so a lazily built sparse backend is not part of the timing
+    for batch in (queries[:core.SPARSE_MIN_BATCH], queries):
+        start = time.perf_counter()
+        if target.startswith("stack:"):
+            core.search_stack_batch(batch, target[6:])
+        else:
+            core.search_batch(batch, target)
+    entry["batch_qps"] = round(len(queries) / (time.perf_counter() - start), 1)
+    return entry
+
+
+def bench_design_system(runs: int = 3) -> dict:
+    """
+    generate_design_system() latency on the real data: the first call (index
+    loads included), calls with an empty query-result cache, repeated calls,
+    and hits in the persistent design-system result cache.
+    """
+    from design_system import DesignSystemGenerator, ResultCache, generate_design_system
+    _use_data_dir(DATA_DIR)
+    start = time.perf_counter()
+    generate_design_system(DESIGN_SYSTEM_QUERIES[0], use_cache=False)
+    report = {"first_call_ms": round((time.perf_counter() - start) * 1000, 3)}
+
+    uncached, cached = [], []
+    for _ in range(runs):
+        for query in DESIGN_SYSTEM_QUERIES:
+            with core._registry_lock:
+                core._query_cache.clear()
+            for samples in (uncached, cached):
+                start = time.perf_counter()
+                generate_design_system(query, use_cache=False)
+                samples.append(time.perf_counter() - start)
+    report["uncached"] = _latency(uncached)
+    report["cached"] = _latency(cached)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = DesignSystemGenerator(ResultCache(Path(tmp) / "results.sqlite"))
+        for query in DESIGN_SYSTEM_QUERIES:
+            generator.generate(query)
+        samples = []
+        for _ in range(runs):
+            for query in DESIGN_SYSTEM_QUERIES:
+                start = time.perf_counter()
+                generator.generate(query)
+                samples.append(time.perf_counter() - start)
+        report["result_cache_hit"] = _latency(samples)
+    return report
+
+
+def check_relevance(fixture: Path = FIXTURE_FILE) -> dict:
+    """Run the query -> expected top row fixture against the real data"""
+    _use_data_dir(DATA_DIR)
+    with open(fixture, 'r', encoding='utf-8') as f:
+        cases = list(csv.DictReader(f))
+    failures = []
+    for case in cases:
+        if case.get("Stack"):
+            result = core.search_stack(case["Query"], case["Stack"], 1)
+        else:
+            result = core.search(case["Query"], case["Domain"], 1)
+        top = result.get("results", [{}])[0].get(case["Column"]) if result.get("results") else None
+        if top != case["Expected"]:
+            failures.append({"query": case["Query"], "domain": case.get("Stack") or case["Domain"],
+                             "expected": case["Expected"], "got": top})
+    return {"total": len(cases), "passed": len(cases) - len(failures), "failures": failures}
+
+
+def _import_times(stderr: str) -> list:
+    """(module, self us, cumulative us, depth) for the script's imports in -X importtime output"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+        if name.strip() == "site" and depth == 0:
+            entries = []  # everything up to site is interpreter startup
+    return entries
+
+
+def check_startup(query: str = "glassmorphism", runs: int = 5, budget_ms: float = STARTUP_BUDGET_MS) -> dict:
+    """Import time and wall time of a plain search (best of runs, bytecode compiled)"""
+    compileall.compile_dir(str(SCRIPTS_DIR), maxlevels=0, quiet=1, force=True)
+    cli = [sys.executable, "-X", "importtime", str(SCRIPTS_DIR / "search.py"), query, "--json"]
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(cli, capture_output=True, text=True, check=False)
+        wall = time.perf_counter() - start
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "search.py failed")
+        entries = _import_times(proc.stderr)
+        total = sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+        if best is None or total < best[0]:
+            best = (total, wall, entries)
+    total, wall, entries = best
+    imported = {name for name, _, _, _ in entries}
+    heaviest = sorted(((name, self_us) for name, self_us, _, _ in entries), key=lambda x: -x[1])[:5]
+    report = {
+        "import_ms": round(total / 1000, 2),
+        "budget_ms": budget_ms,
+        "wall_ms": round(wall * 1000, 2),
+        "modules": len(entries),
+        "heaviest": [{"module": name, "self_ms": round(us / 1000, 2)} for name, us in heaviest],
+        "forbidden": [name for name in STARTUP_FORBIDDEN if name in imported]
+    }
+    report["ok"] = report["import_ms"] <= budget_ms and not report["forbidden"]
+    return report
+
+
+def _print_startup(result: dict):
+    status = "OK" if result["ok"] else "FAIL"
+    print(f"startup {status}: imports {result['import_ms']}ms (budget {result['budget_ms']}ms), "
+          f"{result['modules']} modules, wall {result['wall_ms']}ms")
+    print("  heaviest: " + ", ".join(f"{h['module']} {h['self_ms']}ms" for h in result["heaviest"]))
+    if result["forbidden"]:
+        print(f"  imported on the plain-search path: {', '.join(result['forbidden'])}")
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPTS_DIR,
+                             capture_output=True, text=True, check=False)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_suite(sizes=SUITE_SIZES, targets=SUITE_TARGETS, n_queries: int = SUITE_QUERIES) -> dict:
+    """Full benchmark report (see the module docstring)"""
+    rng = random.Random(SEED)
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": SEED,
+            "queries": n_queries,
+            "backend": core.SCORING_BACKEND
+        },
+        "synthetic": {target: {} for target in targets}
+    }
+    with tempfile.TemporaryDirectory(prefix="uipro-bench-") as tmp:
+        data_dir = Path(tmp)
+        if (DATA_DIR / SYNONYMS_FILE).exists():
+            shutil.copy(DATA_DIR / SYNONYMS_FILE, data_dir / SYNONYMS_FILE)
+        try:
+            for size in sizes:
+                for target in targets:
+                    config = _target_config(target)
+                    write_synthetic_csv(DATA_DIR / config["file"], data_dir / config["file"],
+                                        size, config.get("id_col"), rng)
+                    report["synthetic"][target][str(size)] = bench_target(data_dir, target, size, n_queries, rng)
+        finally:
+            _use_data_dir(DATA_DIR)
+    report["design_system"] = bench_design_system()
+    report["startup"] = check_startup()
+    report["relevance"] = check_relevance()
+    return report
+
+
+def _flatten(report: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in report.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[prefix + key] = value
+    return flat
+
+
+def compare_reports(baseline: dict, current: dict, tolerance: float = 0.1) -> list:
+    """(metric, baseline, current, change, regressed) for every shared timing/throughput metric"""
+    rows = []
+    old, new = _flatten(baseline), _flatten(current)
+    for metric in sorted(set(old) & set(new)):
+        if metric.startswith("meta.") or not old[metric]:
+            continue
+        change = (new[metric] - old[metric]) / old[metric]
+        higher_is_better = metric.endswith(("qps", "passed"))
+        regressed = -change > tolerance if higher_is_better else change > tolerance
+        if metric.endswith(("rows", "total")):
+            regressed = False
+        rows.append((metric, old[metric], new[metric], change, regressed))
+    return rows
+
+
+def _print_suite(report: dict):
+    meta = report["meta"]
+    print(f"commit {meta['commit']} | python {meta['python']} | {meta['queries']} queries per target")
+    for target, sizes in report["synthetic"].items():
+        for size, entry in sizes.items():
+            q = entry["query"]
+            print(f"\n{target} @ {size} rows")
+            print(f"  cold start: {entry['cold_start_s']}s cached, {entry['cold_start_build_s']}s building"
+                  + (f" | peak RSS {entry['peak_rss_mb']} MB" if "peak_rss_mb" in entry else ""))
+            print(f"  index: build {entry['index_build_s']}s, cached load {entry['index_load_s']}s")
+            print(f"  query: p50 {q['p50_ms']}ms p99 {q['p99_ms']}ms | batch {entry['batch_qps']} q/s")
+    _print_startup(report["startup"])
+    ds = report["design_system"]
+    print(f"\ngenerate_design_system: first {ds['first_call_ms']}ms | uncached p50 {ds['uncached']['p50_ms']}ms "
+          f"p99 {ds['uncached']['p99_ms']}ms | cached p50 {ds['cached']['p50_ms']}ms "
+          f"| result cache hit p50 {ds['result_cache_hit']['p50_ms']}ms")
+    _print_relevance(report["relevance"])
+
+
+def _print_relevance(result: dict):
+    print(f"relevance: {result['passed']}/{result['total']} passed")
+    for failure in result["failures"]:
+        print(f"  FAIL [{failure['domain']}] {failure['query']!r}: expected {failure['expected']!r}, got {failure['got']!r}")
+
+
+def _print_backends(report: dict):
+    print(f"Sparse backend available: {report['sparse_available']}")
+    for name, entry in report["corpora"].items():
+        print(f"\n{name} ({entry['documents']} docs)")
+        if "sparse_build_s" in entry:
+            print(f"  sparse matrix build: {entry['sparse_build_s']}s")
+        for key, row in entry.items():
+            if key.startswith("batch_"):
+                cells = "  ".join(f"{k}={v}" for k, v in row.items())
+                print(f"  {key.replace('_', ' ')}: {cells}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_backends = sub.add_parser("backends", help="Compare pure-Python and sparse BM25 throughput")
+    p_backends.add_argument("--docs", type=int, default=10000, help="Synthetic corpus size (default: 10000)")
+    p_backends.add_argument("--queries", type=int, default=1000, help="Batch size (default: 1000)")
+    p_backends.add_argument("--json", action="store_true", help="Output as JSON")
+
+    p_suite = sub.add_parser("suite", help="Latency, throughput, memory and relevance report")
+    p_suite.add_argument("--sizes", default=",".join(map(str, SUITE_SIZES)), help="Synthetic row counts (default: 1000,10000,100000)")
+    p_suite.add_argument("--targets", default=",".join(SUITE_TARGETS), help="Domains and stack:<name> targets (default: style,ux,stack:react)")
+    p_suite.add_argument("--queries", type=int, default=SUITE_QUERIES, help=f"Queries per target (default: {SUITE_QUERIES})")
+    p_suite.add_argument("--output", "-o", help="Write the JSON report to this file")
+    p_suite.add_argument("--json", action="store_true", help="Print the JSON report")
+
+    sub.add_parser("relevance", help="Check the query -> expected top row fixture")
+
+    p_startup = sub.add_parser("startup", help="Check the import-time budget of a plain search")
+    p_startup.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS, help=f"Import-time budget (default: {STARTUP_BUDGET_MS})")
+    p_startup.add_argument("--runs", type=int, default=5, help="Runs; the fastest counts (default: 5)")
+
+    p_compare = sub.add_parser("compare", help="Compare two suite reports")
+    p_compare.add_argument("baseline", help="Earlier report")
+    p_compare.add_argument("current", help="New report")
+    p_compare.add_argument("--tolerance", type=float, default=0.1, help="Relative change flagged as a regression (default: 0.1)")
+
+    args = parser.parse_args()
+
+    if args.command == "suite":
+        targets = [t for t in args.targets.split(",") if t]
+        unknown = [t for t in targets if t not in CSV_CONFIG and t[6:] not in STACK_CONFIG]
+        if unknown:
+            parser.error(f"unknown targets: {', '.join(unknown)}")
+        result = run_suite([int(n) for n in args.sizes.split(",") if n], targets, args.queries)
+        if args.output:
+            Path(args.output).write_text(json.dumps(result, indent=2), encoding='utf-8')
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            _print_suite(result)
+        sys.exit(1 if result["relevance"]["failures"] else 0)
+    elif args.command == "relevance":
+        result = check_relevance()
+        _print_relevance(result)
+        sys.exit(1 if result["failures"] else 0)
+    elif args.command == "startup":
+        result = check_startup(runs=args.runs, budget_ms=args.budget_ms)
+        _print_startup(result)
+        sys.exit(0 if result["ok"] else 1)
+    elif args.command == "compare":
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        with open(args.current, encoding='utf-8') as f:
+            current = json.load(f)
+        rows = compare_reports(baseline, current, args.tolerance)
+        for metric, old, new, change, regressed in rows:
+            print(f"{'!!' if regressed else '  '} {metric:<48} {old:>12} -> {new:<12} {change:+.1%}")
+        sys.exit(1 if any(row[4] for row in rows) else 0)
+    elif args.command == "backends":
+        result = bench_backends(args.docs, args.queries)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            _print_backends(result)
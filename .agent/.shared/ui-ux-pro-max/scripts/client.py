@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Client - thin client for server.py with in-process fallback
+Usage: python client.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3] [--mode hybrid]
+       python client.py "<query>" --design-system [-p "Project Name"] [--persist] [--page "dashboard"] [--pages a,b,c]
+       python client.py "<partial>" --suggest [--max-results 8]
+       python client.py "<query>" --compare [--runs 20]
+
+Requests go to the daemon (see server.py) when one is listening on
+$UIPRO_DAEMON_HOST:$UIPRO_DAEMON_PORT (authenticated with the token it wrote
+to DAEMON_TOKEN_FILE); otherwise the same call runs in this process. Only the stdlib is imported until a fallback is actually needed.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+DAEMON_HOST = os.environ.get("UIPRO_DAEMON_HOST", "127.0.0.1")
+DAEMON_PORT = int(os.environ.get("UIPRO_DAEMON_PORT", "8765"))
+# Written by server.py at startup (same default and override as its TOKEN_FILE)
+DAEMON_TOKEN_FILE = os.environ.get("UIPRO_DAEMON_TOKEN_FILE") or str(Path.home() / ".uipro-daemon-{port}.token")
+SCRIPTS_DIR = Path(__file__).parent
+
+
+def _call_daemon(method: str, params: dict, timeout: float = 30.0) -> dict:
+    """POST to the daemon; raises ConnectionError when it is not reachable (or its token is unavailable)."""
+    try:
+        token = Path(DAEMON_TOKEN_FILE.format(port=DAEMON_PORT)).read_text(encoding='utf-8').strip()
+    except OSError as e:
+        raise ConnectionError(f"No daemon token: {e}")
+    url = f"http://{DAEMON_HOST}:{DAEMON_PORT}/{method}"
+    data = json.dumps(params).encode('utf-8')
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json", "X-UIPro-Token": token})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        if e.code in (401, 415):
+            raise ConnectionError(f"Daemon refused the request: HTTP {e.code}")
+        return json.loads(e.read() or b"{}")
+    except (urllib.error.URLError, ConnectionError, OSError) as e:
+        raise ConnectionError(str(e))
+
+
+def _call_local(method: str, params: dict) -> dict:
+    """Run the request in this process (imports the search modules on demand)."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import server
+    return server.METHODS[method](params)
+
+
+def call(method: str, params: dict, use_daemon: bool = True) -> dict:
+    """Call search / search_stack / suggest / generate_design_system, preferring the daemon."""
+    if use_daemon:
+        try:
+            return _call_daemon(method, params)
+        except ConnectionError:
+            pass
+    return _call_local(method, params)
+
+
+def daemon_running() -> bool:
+    """True when a daemon answers /health."""
+    try:
+        with urllib.request.urlopen(f"http://{DAEMON_HOST}:{DAEMON_PORT}/health", timeout=1.0) as response:
+            return json.loads(response.read()).get("status") == "ok"
+    except (urllib.error.URLError, ConnectionError, OSError, ValueError):
+        return False
+
+
+def _summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2)
+    }
+
+
+def compare_latency(query: str, runs: int = 20) -> dict:
+    """Time the same search through the CLI, the daemon and an in-process call."""
+    report = {}
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(SCRIPTS_DIR / "search.py"), query, "--json"],
+                       capture_output=True, check=False)
+        samples.append(time.perf_counter() - start)
+    report["cli"] = _summarize(samples)
+
+    if daemon_running():
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            _call_daemon("search", {"query": query})
+            samples.append(time.perf_counter() - start)
+        report["daemon"] = _summarize(samples)
+    else:
+        report["daemon"] = {"error": f"No daemon on {DAEMON_HOST}:{DAEMON_PORT} (start it with: python server.py)"}
+
+    _call_local("search", {"query": query})  # warm the in-process indexes
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _call_local("search", {"query": query})
+        samples.append(time.perf_counter() - start)
+    report["in_process"] = _summarize(samples)
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Daemon Client")
+    parser.add_argument("query", help="Search query")
+    parser.add_argument("--domain", "-d", help="Search domain")
+    parser.add_argument("--stack", "-s", help="Stack-specific search")
+    parser.add_argument("--max-results", "-n", type=int, default=3, help="Max results (default: 3)")
+    parser.add_argument("--mode", "-m", choices=["bm25", "hybrid", "semantic"], default="bm25", help="Ranking (default: bm25)")
+    parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
+    parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
+    parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    parser.add_argument("--persist", action="store_true", help="Save design system to design-system/")
+    parser.add_argument("--page", type=str, default=None, help="Create page-specific override file")
+    parser.add_argument("--pages", type=str, default=None, help="Comma-separated page names (implies --persist)")
+    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    parser.add_argument("--suggest", action="store_true", help="Typeahead suggestions for a partial term")
+    parser.add_argument("--no-daemon", action="store_true", help="Always run in-process")
+    parser.add_argument("--compare", action="store_true", help="Compare CLI, daemon and in-process latency for the query")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per path for --compare (default: 20)")
+
+    args = parser.parse_args()
+
+    if args.compare:
+        print(json.dumps(compare_latency(args.query, args.runs), indent=2))
+    elif args.design_system:
+        result = call("generate_design_system", {
+            "query": args.query,
+            "project_name": args.project_name,
+            "output_format": args.format,
+            "persist": args.persist,
+            "page": args.page,
+            "pages": [name.strip() for name in args.pages.split(",") if name.strip()] if args.pages else None,
+            # The daemon's cwd is not ours, so always send an absolute directory
+            "output_dir": str(Path(args.output_dir or os.getcwd()).resolve())
+        }, use_daemon=not args.no_daemon)
+        print(result.get("output", f"Error: {result.get('error')}"))
+    elif args.suggest:
+        result = call("suggest", {"query": args.query, "limit": args.max_results},
+                      use_daemon=not args.no_daemon)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    elif args.stack:
+        result = call("search_stack", {"query": args.query, "stack": args.stack, "max_results": args.max_results, "mode": args.mode},
+                      use_daemon=not args.no_daemon)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        result = call("search", {"query": args.query, "domain": args.domain, "max_results": args.max_results, "mode": args.mode},
+                      use_daemon=not args.no_daemon)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -4,70 +4,128 @@
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
+import bisect
 import csv
+import heapq
+import json
+import mmap
+import os
+import pickle
 import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from functools import lru_cache
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from array import array
+from collections import defaultdict, OrderedDict
 
 # ============ CONFIGURATION ============
-DATA_DIR = Path(__file__).parent.parent / "data"
+# UIPRO_DATA_DIR points every script at another knowledge base (e.g. benchmark corpora)
+DATA_DIR = Path(os.environ.get("UIPRO_DATA_DIR") or Path(__file__).parent.parent / "data")
+INDEX_DIR = DATA_DIR / ".index"
+SYNONYMS_FILE = "synonyms.csv"
+INDEX_VERSION = 4
 MAX_RESULTS = 3
+QUERY_CACHE_SIZE = 512
+
+# Edits to a data CSV are applied to its cached index and recorded in a delta
+# segment; the delta is merged into a fresh base index in the background once
+# it touches more than DELTA_MERGE_FRACTION of the rows (and at least DELTA_MERGE_MIN)
+DELTA_MERGE_MIN = 32
+DELTA_MERGE_FRACTION = 0.1
+
+# Scoring backend for batches: "auto" uses the NumPy/SciPy sparse backend when it
+# is installed, the batch has at least SPARSE_MIN_BATCH queries and the corpus at
+# least SPARSE_MIN_DOCS documents (below that pure Python is faster); "python"
+# never uses it; "sparse" uses it for every batch.
+SCORING_BACKEND = os.environ.get("UIPRO_BM25_BACKEND", "auto")
+SPARSE_MIN_BATCH = 8
+SPARSE_MIN_DOCS = 2000
 
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
+        "id_col": "STT",
         "search_cols": ["Style Category", "Keywords", "Best For", "Type"],
-        "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"]
+        "search_weights": {"Style Category": 3.0, "Keywords": 2.0, "Best For": 1.5, "Type": 1.0},
+        "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"],
+        "suggest_cols": ["Style Category"]
     },
     "prompt": {
         "file": "prompts.csv",
+        "id_col": "STT",
         "search_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords"],
+        "search_weights": {"Style Category": 3.0, "AI Prompt Keywords (Copy-Paste Ready)": 1.5, "CSS/Technical Keywords": 1.0},
         "output_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords", "Implementation Checklist"]
     },
     "color": {
         "file": "colors.csv",
+        "id_col": "No",
         "search_cols": ["Product Type", "Keywords", "Notes"],
+        "search_weights": {"Product Type": 3.0, "Keywords": 2.0, "Notes": 0.5},
         "output_cols": ["Product Type", "Keywords", "Primary (Hex)", "Secondary (Hex)", "CTA (Hex)", "Background (Hex)", "Text (Hex)", "Border (Hex)", "Notes"]
     },
     "chart": {
         "file": "charts.csv",
+        "id_col": "No",
         "search_cols": ["Data Type", "Keywords", "Best Chart Type", "Accessibility Notes"],
+        "search_weights": {"Data Type": 3.0, "Keywords": 2.0, "Best Chart Type": 2.0, "Accessibility Notes": 0.5},
         "output_cols": ["Data Type", "Keywords", "Best Chart Type", "Secondary Options", "Color Guidance", "Accessibility Notes", "Library Recommendation", "Interactive Level"]
     },
     "landing": {
         "file": "landing.csv",
+        "id_col": "No",
         "search_cols": ["Pattern Name", "Keywords", "Conversion Optimization", "Section Order"],
+        "search_weights": {"Pattern Name": 3.0, "Keywords": 2.0, "Conversion Optimization": 1.0, "Section Order": 1.0},
         "output_cols": ["Pattern Name", "Keywords", "Section Order", "Primary CTA Placement", "Color Strategy", "Conversion Optimization"]
     },
     "product": {
         "file": "products.csv",
+        "id_col": "No",
         "search_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Key Considerations"],
-        "output_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Secondary Styles", "Landing Page Pattern", "Dashboard Style (if applicable)", "Color Palette Focus"]
+        "search_weights": {"Product Type": 3.0, "Keywords": 2.0, "Primary Style Recommendation": 1.0, "Key Considerations": 0.5},
+        "output_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Secondary Styles", "Landing Page Pattern", "Dashboard Style (if applicable)", "Color Palette Focus"],
+        "suggest_cols": ["Product Type"]
     },
     "ux": {
         "file": "ux-guidelines.csv",
+        "id_col": "No",
         "search_cols": ["Category", "Issue", "Description", "Platform"],
+        "search_weights": {"Category": 2.0, "Issue": 3.0, "Description": 1.0, "Platform": 1.0},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "typography": {
         "file": "typography.csv",
+        "id_col": "STT",
         "search_cols": ["Font Pairing Name", "Category", "Mood/Style Keywords", "Best For", "Heading Font", "Body Font"],
-        "output_cols": ["Font Pairing Name", "Category", "Heading Font", "Body Font", "Mood/Style Keywords", "Best For", "Google Fonts URL", "CSS Import", "Tailwind Config", "Notes"]
+        "search_weights": {"Font Pairing Name": 3.0, "Category": 1.5, "Mood/Style Keywords": 2.0, "Best For": 1.0, "Heading Font": 2.0, "Body Font": 2.0},
+        "output_cols": ["Font Pairing Name", "Category", "Heading Font", "Body Font", "Mood/Style Keywords", "Best For", "Google Fonts URL", "CSS Import", "Tailwind Config", "Notes"],
+        "suggest_cols": ["Font Pairing Name", "Heading Font", "Body Font"]
     },
     "icons": {
         "file": "icons.csv",
+        "id_col": "STT",
         "search_cols": ["Category", "Icon Name", "Keywords", "Best For"],
-        "output_cols": ["Category", "Icon Name", "Keywords", "Library", "Import Code", "Usage", "Best For", "Style"]
+        "search_weights": {"Category": 1.5, "Icon Name": 3.0, "Keywords": 2.0, "Best For": 1.0},
+        "output_cols": ["Category", "Icon Name", "Keywords", "Library", "Import Code", "Usage", "Best For", "Style"],
+        "suggest_cols": ["Icon Name"]
     },
     "react": {
         "file": "react-performance.csv",
+        "id_col": "No",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "search_weights": {"Category": 1.5, "Issue": 3.0, "Keywords": 2.0, "Description": 1.0},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "web": {
         "file": "web-interface.csv",
+        "id_col": "No",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "search_weights": {"Category": 1.5, "Issue": 3.0, "Keywords": 2.0, "Description": 1.0},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     }
 }
@@ -87,76 +145,1106 @@ STACK_CONFIG = {
     "jetpack-compose": {"file": "stacks/jetpack-compose.csv"}
 }
 
-# Common columns for all stacks
+# Common columns for all stacks (search_weights are BM25F field weights)
 _STACK_COLS = {
+    "id_col": "No",
     "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
+    "search_weights": {"Category": 1.5, "Guideline": 3.0, "Description": 1.0, "Do": 0.75, "Don't": 0.5},
     "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
 }
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 
+def search_fields(config):
+    """(column, BM25F weight) pairs for a config; columns without a weight get 1.0"""
+    weights = config.get("search_weights", {})
+    return tuple((col, float(weights.get(col, 1.0))) for col in config["search_cols"])
+
+
+def _normalize_fields(fields):
+    """Accept column names or (column, weight) pairs"""
+    return tuple((f, 1.0) if isinstance(f, str) else (f[0], float(f[1])) for f in fields)
+
+
+# ============ INSTRUMENTATION ============
+# Opt-in profiling: while a Trace is active (start_trace() ... stop_trace()),
+# span(name) times a stage and count(name, n) bumps a counter. With no active
+# trace both are no-ops, so the hooks stay in the hot path. Any module can
+# attach spans to the same trace (design_system.py does).
+_ACTIVE_TRACE = []
+_trace_ids = iter(range(1, 1 << 62))
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, trace, name, attrs):
+        self.trace = trace
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        stack = self.trace._stack()
+        self.parent = stack[-1] if stack else None
+        self.id = next(self.trace._span_ids)
+        stack.append(self.id)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        stack = self.trace._stack()
+        stack.pop()
+        self.trace._record({
+            "type": "span",
+            "trace": self.trace.id,
+            "id": self.id,
+            "parent": self.parent,
+            "name": self.name,
+            "thread": threading.current_thread().name,
+            "start_ms": round((self.start - self.trace.started) * 1000, 4),
+            "duration_ms": round((end - self.start) * 1000, 4),
+            **({"attrs": self.attrs} if self.attrs else {})
+        })
+        return False
+
+
+class Trace:
+    """Timed spans and counters collected while profiling; safe to share across threads."""
+
+    def __init__(self):
+        self.id = f"{os.getpid()}-{next(_trace_ids)}"
+        self.started = time.perf_counter()
+        self.elapsed_ms = None  # set by stop_trace()
+        self.spans = []
+        self.counters = defaultdict(int)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._span_ids = iter(range(1, 1 << 62))
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def summary(self):
+        """{"elapsed_ms", "stages": {name: {"calls", "total_ms"}}, "counters"}; stages in first-seen order"""
+        stages = {}
+        with self._lock:
+            for span in sorted(self.spans, key=lambda s: s["start_ms"]):
+                stage = stages.setdefault(span["name"], {"calls": 0, "total_ms": 0.0})
+                stage["calls"] += 1
+                stage["total_ms"] = round(stage["total_ms"] + span["duration_ms"], 4)
+            return {"elapsed_ms": self.elapsed_ms, "stages": stages, "counters": dict(self.counters)}
+
+    def records(self):
+        """JSON-serializable trace: every span in start order, then the counters"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s["start_ms"])
+            counters = {"type": "counters", "trace": self.id, "elapsed_ms": self.elapsed_ms, "counters": dict(self.counters)}
+        return spans + [counters]
+
+    def write_jsonl(self, out):
+        """Append the trace as JSON lines to a path or an open text file"""
+        if isinstance(out, (str, Path)):
+            with open(out, 'a', encoding='utf-8') as f:
+                return self.write_jsonl(f)
+        for record in self.records():
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def start_trace():
+    """Begin collecting spans and counters process-wide; returns the new Trace"""
+    trace = Trace()
+    _ACTIVE_TRACE[:] = [trace]
+    return trace
+
+
+def stop_trace():
+    """Stop collecting; returns the finished Trace (or None when none was active)"""
+    trace = _ACTIVE_TRACE[0] if _ACTIVE_TRACE else None
+    _ACTIVE_TRACE[:] = []
+    if trace is not None:
+        trace.elapsed_ms = round((time.perf_counter() - trace.started) * 1000, 4)
+    return trace
+
+
+def span(name, **attrs):
+    """Context manager timing a stage of the active trace (a no-op when not profiling)"""
+    if not _ACTIVE_TRACE:
+        return _NULL_SPAN
+    active = _ACTIVE_TRACE[:1]  # stop_trace() may run on another thread
+    return _Span(active[0], name, attrs) if active else _NULL_SPAN
+
+
+def count(name, n=1):
+    """Add n to a counter of the active trace (a no-op when not profiling)"""
+    if _ACTIVE_TRACE:
+        for trace in _ACTIVE_TRACE[:1]:
+            trace.count(name, n)
+
+
+# ============ TEXT ANALYSIS ============
+_NON_WORD = re.compile(r"[^\w\s]")
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have if in into is it its of on or
+so than that the their then there these they this to was were will with
+""".split())
+
+# Query tokens added by synonym expansion count half as much as typed ones
+SYNONYM_WEIGHT = 0.5
+
+
+class Analyzer:
+    """
+    Text analysis pipeline shared by indexing and querying:
+    lowercase -> strip punctuation -> split -> drop stopwords/short tokens ->
+    light stemming -> optional bigrams. Queries are additionally expanded
+    with synonyms (see data/synonyms.csv).
+    """
+
+    def __init__(self, min_length=2, stem=True, bigrams=False, stopwords=STOPWORDS, synonyms_file=None):
+        self.min_length = min_length
+        self.stem = stem
+        self.bigrams = bigrams
+        self.stopwords = stopwords
+        self._stems = {}
+        self.synonyms = self._load_synonyms(synonyms_file) if synonyms_file else {}
+        self.analyze_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._analyze_query)
+
+    def signature(self):
+        """Identifies the index-side behaviour; part of the index cache key"""
+        stop_hash = f"{zlib.crc32(' '.join(sorted(self.stopwords)).encode('utf-8')):08x}"
+        return f"min{self.min_length}-stem{int(self.stem)}-bigrams{int(self.bigrams)}-stop{stop_hash}"
+
+    def _stem(self, word):
+        """S-stemmer (Harman, 1991): folds plural forms onto the singular"""
+        stem = self._stems.get(word)
+        if stem is None:
+            stem = word
+            if len(word) > 3 and not word.isdigit():
+                if word.endswith("ies") and not word.endswith(("eies", "aies")):
+                    stem = word[:-3] + "y"
+                elif word.endswith("es") and not word.endswith(("aes", "ees", "oes")):
+                    stem = word[:-1]
+                elif word.endswith("s") and not word.endswith(("us", "ss")):
+                    stem = word[:-1]
+            self._stems[word] = stem
+        return stem
+
+    def analyze(self, text):
+        """Tokens for a piece of document or query text"""
+        words = _NON_WORD.sub(" ", str(text).lower()).split()
+        tokens = [w for w in words if len(w) >= self.min_length and w not in self.stopwords]
+        if self.stem:
+            tokens = [self._stem(w) for w in tokens]
+        if self.bigrams and len(tokens) > 1:
+            tokens += [f"{a}_{b}" for a, b in zip(tokens, tokens[1:])]
+        return tokens
+
+    def _analyze_query(self, text):
+        """(token, weight) pairs: the analyzed query plus weighted synonym expansions"""
+        tokens = self.analyze(text)
+        weighted = [(token, 1.0) for token in tokens]
+        seen = set(tokens)
+        for token in tokens:
+            for synonym in self.synonyms.get(token, ()):
+                if synonym not in seen:
+                    seen.add(synonym)
+                    weighted.append((synonym, SYNONYM_WEIGHT))
+        return tuple(weighted)
+
+    def _load_synonyms(self, filepath):
+        """Term -> analyzed synonym tokens from a Term,Synonyms CSV (';'-separated)"""
+        synonyms = {}
+        if not Path(filepath).exists():
+            return synonyms
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                terms = self.analyze(row.get("Term", ""))
+                if len(terms) != 1:
+                    continue
+                expansions = synonyms.setdefault(terms[0], [])
+                for phrase in row.get("Synonyms", "").split(";"):
+                    for token in self.analyze(phrase):
+                        if token != terms[0] and token not in expansions:
+                            expansions.append(token)
+        return synonyms
+
+
+_DEFAULT_ANALYZER = []
+
+
+def default_analyzer():
+    """Process-wide Analyzer with the shipped synonym table"""
+    if not _DEFAULT_ANALYZER:
+        _DEFAULT_ANALYZER.append(Analyzer(synonyms_file=DATA_DIR / SYNONYMS_FILE))
+    return _DEFAULT_ANALYZER[0]
+
+
+def set_default_analyzer(analyzer):
+    """Plug in a different Analyzer (e.g. with bigrams); loaded indexes are dropped"""
+    _DEFAULT_ANALYZER[:] = [analyzer]
+    clear_caches()
+
+
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """
+    BM25F ranking over an inverted index.
+
+    Documents are lists of fields (a plain string is a single field). Each
+    field's term frequency is length-normalised against that field's average
+    length and scaled by its weight; the weighted sum is saturated once per
+    term. With one field of weight 1 this is classic BM25.
+    """
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, analyzer=None):
         self.k1 = k1
         self.b = b
+        self.analyzer = analyzer or default_analyzer()
         self.corpus = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        self.field_weights = []
+        self.field_lengths = []
+        self.avg_field_lengths = []
+        self.deleted = set()
         self.N = 0
+        self._idf_n = 0         # N the idf table was computed for
+        self._touched = set()   # terms whose idf is stale
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        """Analyze document text into index tokens"""
+        return self.analyzer.analyze(text)
 
-    def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
+    def analyze_query(self, query):
+        """Analyze a query into (token, weight) pairs (cached by the analyzer)"""
+        return self.analyzer.analyze_query(query)
+
+    def fit(self, documents, field_weights=None):
+        """Build BM25F index from documents (strings or lists of field strings)"""
+        fielded = [[doc] if isinstance(doc, str) else list(doc) for doc in documents]
+        n_fields = len(fielded[0]) if fielded else 0
+        self.field_weights = list(field_weights) if field_weights else [1.0] * n_fields
+        field_tokens = [[self.tokenize(text) for text in doc] for doc in fielded]
+        self.corpus = [[word for tokens in doc for word in tokens] for doc in field_tokens]
+        self.deleted = set()
         self.N = len(self.corpus)
         if self.N == 0:
             return
         self.doc_lengths = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
+        self.field_lengths = [[len(tokens) for tokens in doc] for doc in field_tokens]
+        self.avg_field_lengths = [sum(lengths[f] for lengths in self.field_lengths) / self.N for f in range(n_fields)]
+
+        # Postings: term -> [(doc_idx, weighted tf), ...] in ascending doc order
+        postings = defaultdict(list)
+        for idx, doc in enumerate(field_tokens):
+            for word, tf in self._weighted_tfs(doc).items():
+                postings[word].append((idx, tf))
+        self.postings = dict(postings)
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+        for word, plist in self.postings.items():
+            self.doc_freqs[word] = len(plist)
 
         for word, freq in self.doc_freqs.items():
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+        self._idf_n = self.N
+
+    def _weighted_tfs(self, field_tokens):
+        """BM25F pseudo term frequency: sum over fields of w_f * tf_f / B_f"""
+        weighted = defaultdict(float)
+        for f, tokens in enumerate(field_tokens):
+            if not tokens:
+                continue
+            avg = self.avg_field_lengths[f] or 1
+            scale = self.field_weights[f] / (1 - self.b + self.b * len(tokens) / avg)
+            for word in tokens:
+                weighted[word] += scale
+        return weighted
+
+    # ---- Incremental updates ----
+    # N, avgdl, doc_freqs, postings and idf stay exact. Field lengths of added
+    # or updated documents are normalised against the averages of the last
+    # fit(); a later fit() (the background merge) re-normalises everything.
+    # Removed documents leave an empty slot so other document indexes are stable.
+
+    def add_document(self, doc, refresh=True):
+        """Append a document (string or list of field strings); returns its index"""
+        idx = len(self.corpus)
+        self.corpus.append([])
+        self.doc_lengths.append(0)
+        self.field_lengths.append([0] * len(self.field_weights))
+        self._index_document(idx, doc)
+        if refresh:
+            self.refresh_idf()
+        return idx
+
+    def update_document(self, idx, doc, refresh=True):
+        """Replace the document at idx in place"""
+        self._unindex_document(idx)
+        self._index_document(idx, doc)
+        if refresh:
+            self.refresh_idf()
+
+    def remove_document(self, idx, refresh=True):
+        """Remove the document at idx from the index"""
+        self._unindex_document(idx)
+        self.deleted.add(idx)
+        if refresh:
+            self.refresh_idf()
+
+    def refresh_idf(self):
+        """Recompute idf for terms touched since the last refresh (all terms if N changed)"""
+        terms = self._touched | set(self.doc_freqs) if self.N != self._idf_n else self._touched
+        for word in terms:
+            freq = self.doc_freqs.get(word, 0)
+            if freq:
+                self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+            else:
+                self.idf.pop(word, None)
+        self._idf_n = self.N
+        self._touched = set()
+        self._sparse = None
+
+    def _index_document(self, idx, doc):
+        fields = [doc] if isinstance(doc, str) else list(doc)
+        field_tokens = [self.tokenize(text) for text in fields]
+        self.corpus[idx] = [word for tokens in field_tokens for word in tokens]
+        self.doc_lengths[idx] = len(self.corpus[idx])
+        self.field_lengths[idx] = [len(tokens) for tokens in field_tokens]
+        self.deleted.discard(idx)
+        self.N += 1
+        self.avgdl += (self.doc_lengths[idx] - self.avgdl) / self.N
+
+        for word, tf in self._weighted_tfs(field_tokens).items():
+            plist = self.postings.setdefault(word, [])
+            if not plist or plist[-1][0] < idx:
+                plist.append((idx, tf))
+            else:
+                bisect.insort(plist, (idx, tf))
+            self.doc_freqs[word] += 1
+            self._touched.add(word)
+
+    def _unindex_document(self, idx):
+        if idx in self.deleted or not 0 <= idx < len(self.corpus):
+            raise IndexError(f"No document at index {idx}")
+        for word in set(self.corpus[idx]):
+            plist = self.postings[word]
+            del plist[bisect.bisect_left(plist, (idx,))]
+            self.doc_freqs[word] -= 1
+            if not plist:
+                del self.postings[word]
+                del self.doc_freqs[word]
+            self._touched.add(word)
+        self.N -= 1
+        self.avgdl = (self.avgdl * (self.N + 1) - self.doc_lengths[idx]) / self.N if self.N else 0
+        self.corpus[idx] = []
+        self.doc_lengths[idx] = 0
+        self.field_lengths[idx] = [0] * len(self.field_weights)
+
+    def term_weight(self, idf, tf):
+        """Saturated contribution of one term to a document's score"""
+        return idf * (tf * (self.k1 + 1)) / (tf + self.k1)
+
+    def _accumulate(self, query):
+        """Sum BM25F contributions for documents sharing a term with the query"""
+        scores = {}
+        numerator_scale = self.k1 + 1
+        k1 = self.k1
+        for token, query_weight in self.analyze_query(query):
+            plist = self.postings.get(token)
+            if not plist:
+                continue
+            idf = self.idf[token]
+            for idx, tf in plist:
+                # Inlined term_weight(); keep the two expressions identical
+                scores[idx] = scores.get(idx, 0) + idf * (tf * numerator_scale) / (tf + k1) * query_weight
+        return scores
 
     def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+        """Score documents matching the query, best first"""
+        scores = self._accumulate(query)
+        return sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+
+    def top_k(self, query, k):
+        """Return the k best (doc_idx, score) pairs without sorting the corpus"""
+        if _ACTIVE_TRACE:
+            return self._traced_top_k(query, k)
+        scores = self._accumulate(query)
+        return heapq.nsmallest(k, scores.items(), key=lambda x: (-x[1], x[0]))
+
+    def _traced_top_k(self, query, k):
+        """top_k() split into analyze/score/sort spans, with posting counters (profiling only)"""
+        with span("analyze"):
+            tokens = self.analyze_query(query)
+        with span("score"):
+            scores = self._accumulate(query)
+        count("postings_traversed", sum(len(self.postings.get(token, ())) for token, _ in tokens))
+        count("docs_scored", len(scores))
+        with span("sort"):
+            return heapq.nsmallest(k, scores.items(), key=lambda x: (-x[1], x[0]))
+
+    def top_k_batch(self, queries, k):
+        """top_k() for many queries, vectorized when the sparse backend is available"""
+        backend = self.sparse_backend() if _use_sparse(len(queries), self.N) else None
+        if backend is not None:
+            return backend.top_k_batch(queries, k)
+        return [self.top_k(query, k) for query in queries]
+
+    def sparse_backend(self):
+        """Lazily built SparseBM25 for this index, or None without NumPy/SciPy"""
+        backend = getattr(self, "_sparse", None)
+        if backend is None and _sparse_modules() is not None and self.N > 0:
+            backend = self._sparse = SparseBM25(self)
+        return backend
+
+    def get_state(self):
+        """Return the fitted index as plain data for serialization"""
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "corpus": self.corpus,
+            "doc_lengths": self.doc_lengths,
+            "avgdl": self.avgdl,
+            "idf": self.idf,
+            "doc_freqs": dict(self.doc_freqs),
+            "postings": self.postings,
+            "field_weights": self.field_weights,
+            "field_lengths": self.field_lengths,
+            "avg_field_lengths": self.avg_field_lengths,
+            "deleted": sorted(self.deleted),
+            "N": self.N
+        }
+
+    @classmethod
+    def from_state(cls, state, analyzer=None):
+        """Restore a fitted index produced by get_state()"""
+        bm25 = cls(state["k1"], state["b"], analyzer)
+        bm25.corpus = state["corpus"]
+        bm25.doc_lengths = state["doc_lengths"]
+        bm25.avgdl = state["avgdl"]
+        bm25.idf = state["idf"]
+        bm25.doc_freqs = defaultdict(int, state["doc_freqs"])
+        bm25.postings = state["postings"]
+        bm25.field_weights = state["field_weights"]
+        bm25.field_lengths = state["field_lengths"]
+        bm25.avg_field_lengths = state["avg_field_lengths"]
+        bm25.deleted = set(state.get("deleted", ()))
+        bm25.N = bm25._idf_n = state["N"]
+        return bm25
+
+
+# ============ SPARSE BACKEND (optional NumPy/SciPy) ============
+_SPARSE_MODULES = []
+
+
+def _sparse_modules():
+    """Import (numpy, scipy.sparse) once; None when either is missing"""
+    if not _SPARSE_MODULES:
+        try:
+            import numpy
+            from scipy import sparse
+            _SPARSE_MODULES.append((numpy, sparse))
+        except ImportError:
+            _SPARSE_MODULES.append(None)
+    return _SPARSE_MODULES[0]
+
+
+def _use_sparse(batch_size, n_docs):
+    if SCORING_BACKEND == "python":
+        return False
+    if SCORING_BACKEND == "sparse":
+        return True
+    return batch_size >= SPARSE_MIN_BATCH and n_docs >= SPARSE_MIN_DOCS
+
+
+class SparseBM25:
+    """
+    Vectorized BM25: the corpus is a CSR term x document matrix of precomputed
+    BM25 weights, and a batch of queries is scored with one sparse product.
+
+    The matrix product sums contributions in a different order than BM25, so
+    candidates within a tiny tolerance of the k-th score are re-summed in query
+    order from the same weights. Rankings are therefore identical to BM25.
+    """
+
+    def __init__(self, bm25):
+        np, sparse = _sparse_modules()
+        self._np = np
+        self._sparse = sparse
+        self.bm25 = bm25
+        self.vocab = {term: i for i, term in enumerate(bm25.postings)}
+
+        rows, cols, data = [], [], []
+        for term, plist in bm25.postings.items():
+            row = self.vocab[term]
+            idf = bm25.idf[term]
+            for idx, tf in plist:
+                rows.append(row)
+                cols.append(idx)
+                # Same expression as BM25._accumulate so each weight is bit-identical
+                data.append(bm25.term_weight(idf, tf))
+        self.matrix = sparse.csr_matrix((data, (rows, cols)), shape=(len(self.vocab), len(bm25.corpus)), dtype=np.float64)
+        self.matrix.sort_indices()
+
+    def _query_matrix(self, token_lists):
+        rows, cols, data = [], [], []
+        for i, tokens in enumerate(token_lists):
+            for token, query_weight in tokens:
+                col = self.vocab.get(token)
+                if col is not None:
+                    rows.append(i)
+                    cols.append(col)
+                    data.append(query_weight)
+        # Duplicate (row, col) entries are summed, so repeated tokens count twice as in BM25
+        return self._sparse.csr_matrix((data, (rows, cols)), shape=(len(token_lists), len(self.vocab)), dtype=self._np.float64)
+
+    def _exact_scores(self, tokens, docs):
+        """Re-sum candidate scores in query-token order"""
+        np = self._np
+        matrix = self.matrix
+        scores = {}
+        for token, query_weight in tokens:
+            row = self.vocab.get(token)
+            if row is None:
+                continue
+            start, end = matrix.indptr[row], matrix.indptr[row + 1]
+            row_docs = matrix.indices[start:end]
+            pos = np.searchsorted(row_docs, docs)
+            pos[pos >= len(row_docs)] = 0
+            hit = row_docs[pos] == docs
+            for idx, weight in zip(docs[hit].tolist(), matrix.data[start:end][pos[hit]].tolist()):
+                scores[idx] = scores.get(idx, 0) + weight * query_weight
+        return scores
+
+    def top_k_batch(self, queries, k):
+        """Return BM25.top_k(query, k) for every query"""
+        np = self._np
+        token_lists = [self.bm25.analyze_query(query) for query in queries]
+        if k <= 0:
+            return [[] for _ in queries]
+        product = (self._query_matrix(token_lists) @ self.matrix).tocsr()
+        results = []
+        for i, tokens in enumerate(token_lists):
+            start, end = product.indptr[i], product.indptr[i + 1]
+            docs = product.indices[start:end]
+            values = product.data[start:end]
+            if len(docs) > k:
+                kth = np.partition(values, len(values) - k)[len(values) - k]
+                docs = docs[values >= kth - 1e-9 * max(1.0, abs(kth))]
+            exact = self._exact_scores(tokens, np.sort(docs))
+            results.append(heapq.nsmallest(k, exact.items(), key=lambda x: (-x[1], x[0])))
+        return results
+
+
+# ============ ROW STORE ============
+class RowStore:
+    """
+    Column-oriented storage for the rows of a CSV.
+
+    Every cell is UTF-8 encoded into one contiguous buffer, row-major, with a
+    32-bit end offset per cell; column names are interned once. Rows behave
+    like a list of dicts (rows[idx], iteration, len) but a dict is only built
+    when a row is read, and row(idx, cols) decodes just the requested cells,
+    so search results never materialize the columns they don't return.
+
+    Rows replaced or deleted by incremental updates (None marks a deleted row)
+    live in a small overlay until the index is rebuilt.
+    """
+
+    def __init__(self, columns=(), rows=()):
+        self.columns = [sys.intern(col) for col in columns]
+        self._col_index = {col: i for i, col in enumerate(self.columns)}
+        self._buffer = bytearray()
+        self._offsets = array('I', [0])
+        self._length = 0
+        self._overrides = {}
+        for row in rows:
+            self.append(row)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError("row index out of range")
+        if idx in self._overrides:
+            return self._overrides[idx]
+        return {col: self._cell(idx, i) for i, col in enumerate(self.columns)}
+
+    def __setitem__(self, idx, row):
+        if not 0 <= idx < self._length:
+            raise IndexError("row index out of range")
+        self._overrides[idx] = row
+
+    def __iter__(self):
+        for idx in range(self._length):
+            yield self[idx]
+
+    def _cell(self, idx, col):
+        i = idx * len(self.columns) + col
+        return self._buffer[self._offsets[i]:self._offsets[i + 1]].decode('utf-8')
+
+    def append(self, row):
+        """Add a row (a dict, or None for a deleted row) at the end"""
+        idx = self._length
+        self._length += 1
+        if row is None or any(col is not None and col not in self._col_index for col in row):
+            self._overrides[idx] = row
+            row = {}
+        # Overlay rows still get (empty) cells so offsets stay aligned with row numbers
+        for col in self.columns:
+            self._buffer += (row.get(col) or "").encode('utf-8')
+            self._offsets.append(len(self._buffer))
+
+    def get(self, idx, col, default=""):
+        """One cell of a row"""
+        if idx in self._overrides:
+            row = self._overrides[idx]
+            return row.get(col, default) if row is not None else default
+        i = self._col_index.get(col)
+        return default if i is None else self._cell(idx, i)
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+    def row(self, idx, cols):
+        """Dict of the cols present in this store for one row (skipping unknown columns)"""
+        if idx in self._overrides:
+            row = self._overrides[idx] or {}
+            return {col: row.get(col, "") for col in cols if col in row}
+        return {col: self._cell(idx, self._col_index[col]) for col in cols if col in self._col_index}
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def column(self, col):
+        """All values of one column, None for deleted rows"""
+        i = self._col_index.get(col)
+        values = [self._cell(idx, i) if i is not None else None for idx in range(self._length)]
+        for idx, row in self._overrides.items():
+            values[idx] = row.get(col) if row is not None else None
+        return values
 
-            scores.append((idx, score))
+    def fingerprint(self):
+        """SHA-256 of the rows in order (changes whenever a row's value or position does)"""
+        import hashlib
+        digest = hashlib.sha256(json.dumps(self.columns).encode('utf-8'))
+        digest.update(self._offsets.tobytes())
+        digest.update(self._buffer)
+        digest.update(json.dumps(sorted(self._overrides.items()), sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    def get_state(self):
+        """Return the store as plain data for serialization"""
+        return {
+            "columns": self.columns,
+            "buffer": bytes(self._buffer),
+            "offsets": self._offsets.tobytes(),
+            "length": self._length,
+            "overrides": self._overrides
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Restore a store produced by get_state()"""
+        store = cls(state["columns"])
+        store._buffer = bytearray(state["buffer"])
+        store._offsets = array('I')
+        store._offsets.frombytes(state["offsets"])
+        store._length = state["length"]
+        store._overrides = state["overrides"]
+        return store
+
+
+# ============ INDEX CACHE ============
+# Binary layout: MAGIC | u32 header length | JSON header | pickled body.
+# The header is validated before the body is unpickled from the memory map.
+_INDEX_MAGIC = b"UUPMIDX\x00"
+_HEADER_LEN = struct.Struct("<I")
+
+
+def _file_hash(filepath):
+    """SHA-256 of a file's contents"""
+    import hashlib  # only needed once a CSV's mtime changed; keeps it off the startup path
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _data_relpath(filepath):
+    """Path of a CSV relative to DATA_DIR (just its name when outside it)"""
+    try:
+        return Path(filepath).resolve().relative_to(DATA_DIR.resolve()).as_posix()
+    except ValueError:
+        return Path(filepath).name
+
+
+def _index_path(filepath):
+    """Location of the cached index for a CSV under DATA_DIR"""
+    return INDEX_DIR / (_data_relpath(filepath).replace("/", "__") + ".idx")
+
+
+def _delta_path(index_path):
+    """Delta segment stored next to a base index"""
+    return index_path.with_suffix(".delta")
+
+
+def _id_column(filepath):
+    """Row identity column configured for a data CSV, or None"""
+    rel = _data_relpath(filepath)
+    for config in CSV_CONFIG.values():
+        if config["file"] == rel:
+            return config.get("id_col")
+    if any(config["file"] == rel for config in STACK_CONFIG.values()):
+        return _STACK_COLS.get("id_col")
+    return None
+
+
+def _read_index(index_path):
+    """Read (header, mmap, body offset) from an index file, or None"""
+    try:
+        with open(index_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    start = len(_INDEX_MAGIC) + _HEADER_LEN.size
+    if mm[:len(_INDEX_MAGIC)] != _INDEX_MAGIC or len(mm) < start:
+        mm.close()
+        return None
+    (header_len,) = _HEADER_LEN.unpack_from(mm, len(_INDEX_MAGIC))
+    try:
+        header = json.loads(mm[start:start + header_len].decode('utf-8'))
+    except ValueError:
+        mm.close()
+        return None
+    return header, mm, start + header_len
+
+
+def _write_index(index_path, header, body):
+    """Atomically write an index file; failures leave the cache untouched"""
+    header_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+    tmp_path = index_path.with_name(index_path.name + f".{os.getpid()}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(_INDEX_MAGIC)
+            f.write(_HEADER_LEN.pack(len(header_bytes)))
+            f.write(header_bytes)
+            pickle.dump(body, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _row_document(row, fields):
+    """The BM25F document (one string per search column) for a CSV row"""
+    return [str(row.get(col, "")) for col, _ in fields]
+
+
+def _build_index(filepath, fields):
+    """Parse a CSV into a RowStore and fit BM25F over its weighted search columns"""
+    documents = []
+    with span("csv.parse"), open(filepath, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        data = RowStore(reader.fieldnames or [])
+        for row in reader:
+            documents.append(_row_document(row, fields))
+            data.append(row)
+    with span("bm25.fit", docs=len(documents)):
+        bm25 = BM25()
+        bm25.fit(documents, [weight for _, weight in fields])
+    return data, bm25
+
+
+def _index_header(filepath, stat, digest, fields):
+    return {
+        "version": INDEX_VERSION,
+        "file": Path(filepath).name,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "fields": [list(f) for f in fields],
+        "analyzer": default_analyzer().signature()
+    }
+
+
+# ============ INCREMENTAL UPDATES ============
+# A changed CSV is diffed against the cached rows by its id column. Only the
+# added, updated and deleted rows are re-indexed; the accumulated changes
+# (id -> row, or None when deleted) are persisted as a delta segment next to the
+# base index, so later processes replay them instead of rebuilding. Deleted rows
+# leave None in the row list until the next merge.
+
+def _diff_rows(old_rows, new_rows, id_col):
+    """Changes turning old_rows into new_rows, or None when ids are missing or duplicated"""
+    old = {row[id_col]: row for row in old_rows if row is not None}
+    changes = {}
+    seen = set()
+    for row in new_rows:
+        # Same shape as a RowStore row: no stray None keys, "" for missing cells
+        row = {col: value or "" for col, value in row.items() if col is not None}
+        key = row.get(id_col)
+        if not key or key in seen:
+            return None
+        seen.add(key)
+        if old.get(key) != row:
+            changes[key] = row
+    for key in old:
+        if key not in seen:
+            changes[key] = None
+    return changes
+
+
+def _apply_changes(rows, bm25, changes, id_col, fields):
+    """Apply changes to rows and bm25 in place"""
+    positions = {key: idx for idx, key in enumerate(rows.column(id_col)) if key is not None}
+    for key, row in changes.items():
+        idx = positions.get(key)
+        if row is None:
+            if idx is not None:
+                bm25.remove_document(idx, refresh=False)
+                rows[idx] = None
+                del positions[key]
+        elif idx is not None:
+            bm25.update_document(idx, _row_document(row, fields), refresh=False)
+            rows[idx] = row
+        else:
+            positions[key] = bm25.add_document(_row_document(row, fields), refresh=False)
+            rows.append(row)
+    bm25.refresh_idf()
+
+
+def _patch_index(filepath, fields, id_col, base_header, body, stat, digest):
+    """
+    Bring a stale cached index up to date from its delta segment and a row
+    diff. Returns (rows, bm25), or None when a full rebuild is needed.
+    """
+    rows, bm25 = RowStore.from_state(body["rows"]), BM25.from_state(body["bm25"])
+    if bm25.N == 0:
+        return None
+    delta_path = _delta_path(_index_path(filepath))
+    changes = {}
+    cached = _read_index(delta_path)
+    if cached is not None:
+        header, mm, offset = cached
+        try:
+            if header.get("version") == INDEX_VERSION and header.get("base_sha256") == base_header.get("sha256"):
+                with memoryview(mm) as view:
+                    changes = pickle.loads(view[offset:])["changes"]
+                if header.get("sha256") == digest:
+                    _apply_changes(rows, bm25, changes, id_col, fields)
+                    if header.get("mtime_ns") != stat.st_mtime_ns:
+                        header.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                        _write_index(delta_path, header, {"changes": changes})
+                    return rows, bm25
+        except (pickle.UnpicklingError, EOFError, KeyError, ValueError):
+            changes = {}
+        finally:
+            mm.close()
+
+    _apply_changes(rows, bm25, changes, id_col, fields)
+    new_changes = _diff_rows(rows, _load_csv(filepath), id_col)
+    if new_changes is None:
+        return None
+    _apply_changes(rows, bm25, new_changes, id_col, fields)
+    changes.update(new_changes)
+
+    header = _index_header(filepath, stat, digest, fields)
+    header["base_sha256"] = base_header.get("sha256")
+    _write_index(delta_path, header, {"changes": changes})
+    if len(changes) > max(DELTA_MERGE_MIN, DELTA_MERGE_FRACTION * bm25.N):
+        _schedule_merge(filepath, fields)
+    return rows, bm25
+
+
+_merge_lock = threading.Lock()
+_merges_running = set()
+
+
+def _merge_index(filepath, fields):
+    """Rebuild the base index from the CSV and drop its delta segment"""
+    filepath = Path(filepath)
+    stat = filepath.stat()
+    digest = _file_hash(filepath)
+    data, bm25 = _build_index(filepath, fields)
+    if filepath.stat().st_mtime_ns != stat.st_mtime_ns:
+        return  # edited while merging; the next load starts over
+    index_path = _index_path(filepath)
+    _write_index(index_path, _index_header(filepath, stat, digest, fields), {"rows": data.get_state(), "bm25": bm25.get_state()})
+    try:
+        os.unlink(_delta_path(index_path))
+    except OSError:
+        pass
+    # Swap the exact index into the registry if it still holds this version
+    key = (str(filepath), fields)
+    with _registry_lock:
+        entry = _index_registry.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns:
+            _index_registry[key] = (stat.st_mtime_ns, data, bm25)
+
+
+def _schedule_merge(filepath, fields):
+    """Merge the delta segment on a background thread (at most one per file)"""
+    key = (str(filepath), fields)
+    with _merge_lock:
+        if key in _merges_running:
+            return
+        _merges_running.add(key)
+
+    def run():
+        try:
+            _merge_index(filepath, fields)
+        finally:
+            with _merge_lock:
+                _merges_running.discard(key)
+
+    # Not a daemon thread: a short-lived CLI process finishes the merge before exiting
+    threading.Thread(target=run, name=f"merge-{Path(filepath).name}").start()
+
+
+def update_rows(filepath, upserts=(), deletes=(), id_col=None):
+    """
+    Add or update rows (dicts, matched on the id column) and delete rows by id
+    in a data CSV. The file is rewritten atomically; the next get_index()
+    applies just these rows to the cached index instead of rebuilding it.
+    """
+    filepath = Path(filepath)
+    id_col = id_col or _id_column(filepath)
+    if not id_col:
+        raise ValueError(f"No id column configured for {filepath}")
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        columns = list(reader.fieldnames or [])
+        rows = list(reader)
+
+    positions = {row[id_col]: idx for idx, row in enumerate(rows)}
+    for row in upserts:
+        row = {col: str(value) for col, value in row.items()}
+        columns += [col for col in row if col not in columns]
+        idx = positions.get(row[id_col])
+        if idx is None:
+            positions[row[id_col]] = len(rows)
+            rows.append(row)
+        else:
+            rows[idx] = {**rows[idx], **row}
+    removed = {str(key) for key in deletes}
+    rows = [row for row in rows if row[id_col] not in removed]
+
+    tmp_path = filepath.with_name(filepath.name + f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, filepath)
+
+
+def load_index(filepath, fields, use_cache=True, id_col=None):
+    """
+    Return (rows, bm25) for a CSV, using the on-disk index when it is fresh.
+
+    fields are column names or (column, weight) pairs. The cache is keyed by
+    the CSV's mtime/size (fast path) and SHA-256 (so a touched but unchanged
+    file is still a hit), the weighted fields, the analyzer signature and
+    INDEX_VERSION. When the content changed and the file has an id column
+    (id_col, or the one in its config), only the changed rows are re-indexed
+    (see INCREMENTAL UPDATES); otherwise the index is rebuilt and rewritten.
+    """
+    filepath = Path(filepath)
+    fields = _normalize_fields(fields)
+    if not use_cache:
+        return _build_index(filepath, fields)
+    id_col = id_col or _id_column(filepath)
+
+    stat = filepath.stat()
+    index_path = _index_path(filepath)
+    digest = None
+    cached = _read_index(index_path)
+    if cached is not None:
+        header, mm, offset = cached
+        try:
+            valid = (header.get("version") == INDEX_VERSION and header.get("fields") == [list(f) for f in fields]
+                     and header.get("analyzer") == default_analyzer().signature())
+            touched = header.get("mtime_ns") != stat.st_mtime_ns or header.get("size") != stat.st_size
+            if valid and touched:
+                digest = _file_hash(filepath)
+                if header.get("sha256") != digest:
+                    patched = None
+                    if id_col:
+                        with span("index.patch"), memoryview(mm) as view:
+                            body = pickle.loads(view[offset:])
+                            patched = _patch_index(filepath, fields, id_col, header, body, stat, digest)
+                    if patched is not None:
+                        count("index_cache.patched")
+                        return patched
+                    valid = False
+            if valid:
+                with span("index.read"):
+                    with memoryview(mm) as view:
+                        body = pickle.loads(view[offset:])
+                    if touched:
+                        # Same content, new mtime: refresh the header so the next load skips hashing
+                        header.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                        _write_index(index_path, header, body)
+                    loaded = RowStore.from_state(body["rows"]), BM25.from_state(body["bm25"])
+                count("index_cache.hit")
+                return loaded
+        except (pickle.UnpicklingError, EOFError, KeyError, ValueError):
+            pass
+        finally:
+            mm.close()
+
+    count("index_cache.miss")
+    data, bm25 = _build_index(filepath, fields)
+    with span("index.write"):
+        header = _index_header(filepath, stat, digest or _file_hash(filepath), fields)
+        _write_index(index_path, header, {"rows": data.get_state(), "bm25": bm25.get_state()})
+    try:
+        os.unlink(_delta_path(index_path))
+    except OSError:
+        pass
+    return data, bm25
+
+
+def build_indexes():
+    """Build (or refresh) the on-disk index for every domain and stack CSV, merging deltas"""
+    built = []
+    targets = [(cfg["file"], search_fields(cfg)) for cfg in CSV_CONFIG.values()]
+    targets += [(cfg["file"], search_fields(_STACK_COLS)) for cfg in STACK_CONFIG.values()]
+    for filename, fields in targets:
+        filepath = DATA_DIR / filename
+        if filepath.exists():
+            load_index(filepath, fields)
+            if _delta_path(_index_path(filepath)).exists():
+                _merge_index(filepath, _normalize_fields(fields))
+            built.append(filename)
+    return built
 
 
 # ============ SEARCH FUNCTIONS ============
@@ -166,29 +1254,86 @@ def _load_csv(filepath):
         return list(csv.DictReader(f))
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
+# ============ PROCESS-WIDE REGISTRY ============
+# Each CSV is loaded and indexed once per process; later calls only stat() the
+# file to notice edits. Recent query results are kept in a bounded LRU.
+_registry_lock = threading.RLock()
+_index_registry = {}
+_query_cache = OrderedDict()
+
+
+def get_index(filepath, fields):
+    """Return the shared (rows, bm25) for a CSV, reloading it if the file changed"""
+    filepath = Path(filepath)
+    fields = _normalize_fields(fields)
+    key = (str(filepath), fields)
+    mtime_ns = filepath.stat().st_mtime_ns
+    with _registry_lock:
+        entry = _index_registry.get(key)
+        if entry is None or entry[0] != mtime_ns:
+            count("registry.miss")
+            with span("index.load", file=_data_relpath(filepath)):
+                entry = (mtime_ns,) + load_index(filepath, fields)
+            _index_registry[key] = entry
+        else:
+            count("registry.hit")
+        return entry[1], entry[2]
+
+
+def clear_caches():
+    """Drop every loaded index and cached query result in this process"""
+    with _registry_lock:
+        _index_registry.clear()
+        _query_cache.clear()
+        _federated_cache.clear()
+
+
+def _search_csv(filepath, fields, output_cols, query, max_results):
+    """Core search function using BM25F"""
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
+    data, bm25 = get_index(filepath, fields)
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    cache_key = (id(bm25), tuple(output_cols), query, max_results)
+    with _registry_lock:
+        cached = _query_cache.get(cache_key)
+        if cached is not None and cached[0] is bm25:
+            _query_cache.move_to_end(cache_key)
+            count("query_cache.hit")
+            return [dict(row) for row in cached[1]]
+    count("query_cache.miss")
 
     # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    ranked = bm25.top_k(query, max_results)
 
     # Get top results with score > 0
     results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+    with span("materialize"):
+        for idx, score in ranked:
+            if score > 0:
+                results.append(data.row(idx, output_cols))
+
+    with _registry_lock:
+        # Holding bm25 in the entry keeps id(bm25) from being reused while cached
+        _query_cache[cache_key] = (bm25, results)
+        if len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
 
-    return results
+    return [dict(row) for row in results]
+
+
+def _search_csv_batch(filepath, fields, output_cols, queries, max_results):
+    """_search_csv for many queries against one file, scored as a single batch"""
+    if not filepath.exists():
+        return [[] for _ in queries]
+
+    with span("search_batch", file=_data_relpath(filepath), queries=len(queries)):
+        data, bm25 = get_index(filepath, fields)
+        batch_results = []
+        for ranked in bm25.top_k_batch(queries, max_results):
+            batch_results.append([data.row(idx, output_cols) for idx, score in ranked if score > 0])
+    return batch_results
 
 
 def detect_domain(query):
@@ -225,7 +1370,8 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    with span("search", domain=domain):
+        results = _search_csv(filepath, search_fields(config), config["output_cols"], query, max_results)
 
     return {
         "domain": domain,
@@ -246,7 +1392,8 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    with span("search", stack=stack):
+        results = _search_csv(filepath, search_fields(_STACK_COLS), _STACK_COLS["output_cols"], query, max_results)
 
     return {
         "domain": "stack",
@@ -256,3 +1403,192 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def search_batch(queries, domain=None, max_results=MAX_RESULTS):
+    """search() for a list of queries; queries sharing a domain are scored together"""
+    domains = [domain or detect_domain(query) for query in queries]
+    responses = [None] * len(queries)
+    by_domain = defaultdict(list)
+    for i, d in enumerate(domains):
+        by_domain[d].append(i)
+
+    for d, positions in by_domain.items():
+        config = CSV_CONFIG.get(d, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            for i in positions:
+                responses[i] = {"error": f"File not found: {filepath}", "domain": d}
+            continue
+        batch = _search_csv_batch(filepath, search_fields(config), config["output_cols"],
+                                  [queries[i] for i in positions], max_results)
+        for i, results in zip(positions, batch):
+            responses[i] = {"domain": d, "query": queries[i], "file": config["file"], "count": len(results), "results": results}
+    return responses
+
+
+def search_stack_batch(queries, stack, max_results=MAX_RESULTS):
+    """search_stack() for a list of queries against one stack"""
+    if stack not in STACK_CONFIG:
+        return [{"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"} for _ in queries]
+
+    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+
+    if not filepath.exists():
+        return [{"error": f"Stack file not found: {filepath}", "stack": stack} for _ in queries]
+
+    batch = _search_csv_batch(filepath, search_fields(_STACK_COLS), _STACK_COLS["output_cols"], queries, max_results)
+    return [{"domain": "stack", "stack": stack, "query": query, "file": STACK_CONFIG[stack]["file"],
+             "count": len(results), "results": results} for query, results in zip(queries, batch)]
+
+
+# ============ FEDERATED SEARCH ============
+def _federated_sources(domains=None):
+    """(label, file, fields, output_cols) for domains; stacks are labelled "stack:<name>" """
+    if domains is None:
+        domains = list(CSV_CONFIG) + [f"stack:{stack}" for stack in STACK_CONFIG]
+    sources = []
+    for label in domains:
+        if label.startswith("stack:") and label[6:] in STACK_CONFIG:
+            sources.append((label, STACK_CONFIG[label[6:]]["file"], search_fields(_STACK_COLS), _STACK_COLS["output_cols"]))
+        elif label in CSV_CONFIG:
+            config = CSV_CONFIG[label]
+            sources.append((label, config["file"], search_fields(config), config["output_cols"]))
+    return [src for src in sources if (DATA_DIR / src[1]).exists()]
+
+
+class FederatedIndex:
+    """
+    One inverted index over several domain/stack CSVs.
+
+    Postings map a term to (global_doc_id, weight) pairs where the weight is
+    the BM25 contribution computed with that document's own domain statistics,
+    so per-domain scores equal search() exactly while a query walks the merged
+    postings only once.
+    """
+
+    def __init__(self, sources):
+        self.labels = []
+        self.files = []
+        self.output_cols = []
+        self.rows = []
+        self.bases = []
+        self.indexes = []
+        self.analyze_query = default_analyzer().analyze_query
+        postings = defaultdict(list)
+        total = 0
+        for label, filename, fields, output_cols in sources:
+            rows, bm25 = get_index(DATA_DIR / filename, fields)
+            self.labels.append(label)
+            self.files.append(filename)
+            self.output_cols.append(output_cols)
+            self.rows.append(rows)
+            self.bases.append(total)
+            self.indexes.append(bm25)
+            for term, plist in bm25.postings.items():
+                idf = bm25.idf[term]
+                merged = postings[term]
+                for idx, tf in plist:
+                    merged.append((total + idx, bm25.term_weight(idf, tf)))
+            total += len(bm25.corpus)
+        self.postings = dict(postings)
+
+    def is_current(self, sources):
+        """True while every underlying index is still the registry's current one"""
+        return len(sources) == len(self.indexes) and all(
+            get_index(DATA_DIR / filename, fields)[1] is bm25
+            for (_, filename, fields, _), bm25 in zip(sources, self.indexes))
+
+    def _row(self, source, idx):
+        return self.rows[source].row(idx, self.output_cols[source])
+
+    def query(self, query, max_results=MAX_RESULTS, per_domain=None):
+        """
+        Score query against every source in one pass.
+
+        Returns (merged, by_domain): merged is the top max_results across all
+        sources ranked by normalized score; by_domain
+        maps a label to its own raw-score top-k when per_domain (an int or a
+        {label: k} dict) asks for it.
+        """
+        with span("analyze"):
+            tokens = self.analyze_query(query)
+        scores = {}
+        traversed = 0
+        with span("score"):
+            for token, query_weight in tokens:
+                plist = self.postings.get(token, ())
+                traversed += len(plist)
+                for gid, weight in plist:
+                    scores[gid] = scores.get(gid, 0) + weight * query_weight
+        count("postings_traversed", traversed)
+        count("docs_scored", len(scores))
+
+        per_source = defaultdict(list)
+        for gid, score in scores.items():
+            source = bisect.bisect_right(self.bases, gid) - 1
+            per_source[source].append((gid - self.bases[source], score))
+
+        # Normalize to the domain's best hit, scaled by how many distinct query
+        # terms the domain knows, so a domain matching one word of four does not
+        # tie with one matching all of them.
+        distinct = {token for token, query_weight in tokens if query_weight == 1.0}
+        candidates = []
+        for source, hits in per_source.items():
+            best = max(score for _, score in hits)
+            coverage = sum(1 for t in distinct if t in self.indexes[source].postings) / max(1, len(distinct))
+            candidates.extend((score / best * coverage, source, idx) for idx, score in hits)
+        merged = []
+        for norm, source, idx in heapq.nsmallest(max_results, candidates, key=lambda x: (-x[0], x[1], x[2])):
+            merged.append({"_domain": self.labels[source], "_score": round(norm, 4), **self._row(source, idx)})
+
+        by_domain = {}
+        if per_domain is not None:
+            for source, label in enumerate(self.labels):
+                k = per_domain.get(label, 0) if isinstance(per_domain, dict) else per_domain
+                if k <= 0:
+                    continue
+                ranked = heapq.nsmallest(k, per_source.get(source, []), key=lambda x: (-x[1], x[0]))
+                results = [self._row(source, idx) for idx, score in ranked if score > 0]
+                by_domain[label] = {"domain": label, "query": query, "file": self.files[source],
+                                    "count": len(results), "results": results}
+        return merged, by_domain
+
+
+_federated_cache = {}
+
+
+def get_federated_index(domains=None):
+    """Shared FederatedIndex over the given domains (all domains and stacks by default)"""
+    sources = _federated_sources(domains)
+    key = tuple(src[0] for src in sources)
+    with _registry_lock:
+        index = _federated_cache.get(key)
+        if index is None or not index.is_current(sources):
+            index = _federated_cache[key] = FederatedIndex(sources)
+        return index
+
+
+def search_all(query, max_results=MAX_RESULTS, domains=None, per_domain=None):
+    """
+    Federated search: one query against many domains (and stacks) at once.
+
+    Each hit carries "_domain" and "_score" (normalized to its domain's best
+    hit and scaled by the domain's query-term coverage). With per_domain, "by_domain" also holds search()-shaped results for
+    each domain, identical to calling search() per domain.
+    """
+    with span("search_all"):
+        with span("federated.load"):
+            index = get_federated_index(domains)
+        merged, by_domain = index.query(query, max_results, per_domain)
+    response = {
+        "domain": "all",
+        "query": query,
+        "file": f"{len(index.files)} files",
+        "domains": list(index.labels),
+        "count": len(merged),
+        "results": merged
+    }
+    if per_domain is not None:
+        response["by_domain"] = by_domain
+    return response
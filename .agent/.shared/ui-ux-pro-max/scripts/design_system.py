@@ -11,14 +11,29 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+    result = generate_design_system("SaaS dashboard", "My Project", persist=True, pages=["dashboard", "checkout"])
+    
+    # Repeated queries are served from a SQLite result cache (data/.index/design-systems.sqlite)
+    result = generate_design_system("SaaS dashboard", "My Project", use_cache=False)
+    
+    # Many projects at once; files whose content is unchanged are not rewritten
+    persist_design_systems([{"design_system": ds, "pages": ["dashboard"]} for ds in systems])
 """
 
+import bisect
 import csv
+import hashlib
 import json
 import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, search_all, span, count, DATA_DIR, INDEX_DIR, _NON_WORD, _file_hash
 
 
 # ============ CONFIGURATION ============
@@ -32,64 +47,276 @@ SEARCH_CONFIG = {
     "typography": {"max_results": 2}
 }
 
+# Query-term repetitions for the top style priority in the style search
+STYLE_PRIORITY_BOOST = 3
+
+# Threads generating page overrides for persist_design_system(pages=[...])
+PAGE_WORKERS = 8
+
+# Projects persisted at the same time by persist_design_systems()
+PROJECT_WORKERS = 4
+
+# Persistent cache of generated design systems (see RESULT CACHE); UIPRO_RESULT_CACHE=0 disables it
+RESULT_CACHE_ENABLED = os.environ.get("UIPRO_RESULT_CACHE", "1") != "0"
+RESULT_CACHE_FILE = "design-systems.sqlite"
+RESULT_CACHE_SIZE = 256      # entries kept before least recently used ones are evicted
+RESULT_CACHE_VERSION = 1     # bump when generate() output changes for the same inputs
+
+# Compiled reasoning rules keyed by file path -> (mtime_ns, ReasoningIndex); shared by all generators
+_REASONING_CACHE = {}
+
+
+# ============ REASONING RULES ============
+class ReasoningIndex:
+    """
+    ui-reasoning.csv compiled for lookup by product category.
+
+    Matching is the same three-step cascade as scanning the rules in file
+    order (exact name, then substring either way, then any word of the name
+    inside the category; the earliest rule wins), answered from hash maps:
+    names and name words map to their first rule, and the category is probed
+    only with substrings of the lengths that occur in the table. Decision_Rules
+    JSON and Style_Priority are parsed once here.
+    """
+
+    def __init__(self, rows: list):
+        self.rows = rows
+        self.reasoning = [self._compile(row) for row in rows]
+        self.exact = {}      # lowercased UI_Category -> first rule index
+        self.keywords = {}   # word of a UI_Category -> first rule index
+        for idx, row in enumerate(rows):
+            ui_cat = row.get("UI_Category", "").lower()
+            self.exact.setdefault(ui_cat, idx)
+            for keyword in ui_cat.replace("/", " ").replace("-", " ").split():
+                self.keywords.setdefault(keyword, idx)
+        self.exact_lengths = sorted({len(name) for name in self.exact})
+        self.keyword_lengths = sorted({len(keyword) for keyword in self.keywords})
+        # All names in rule order, NUL-separated, for "category inside a name"
+        self._names = "\0".join(row.get("UI_Category", "").lower() for row in rows)
+        self._name_starts = []
+        pos = 0
+        for row in rows:
+            self._name_starts.append(pos)
+            pos += len(row.get("UI_Category", "")) + 1
+
+    @staticmethod
+    def _compile(rule: dict) -> dict:
+        decision_rules = {}
+        try:
+            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
+        except json.JSONDecodeError:
+            pass
+        return {
+            "pattern": rule.get("Recommended_Pattern", ""),
+            "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
+            "color_mood": rule.get("Color_Mood", ""),
+            "typography_mood": rule.get("Typography_Mood", ""),
+            "key_effects": rule.get("Key_Effects", ""),
+            "anti_patterns": rule.get("Anti_Patterns", ""),
+            "decision_rules": decision_rules,
+            "severity": rule.get("Severity", "MEDIUM")
+        }
+
+    @staticmethod
+    def _first_substring(text: str, table: dict, lengths: list):
+        """Lowest rule index among table keys that occur in text, or None."""
+        best = None
+        for n in lengths:
+            if n > len(text):
+                break
+            for i in range(len(text) - n + 1):
+                idx = table.get(text[i:i + n])
+                if idx is not None and (best is None or idx < best):
+                    best = idx
+        return best
+
+    def find(self, category: str):
+        """Index of the rule for a category, or None."""
+        category_lower = category.lower()
+        idx = self.exact.get(category_lower)
+        if idx is not None:
+            return idx
+
+        # A name inside the category, or the category inside a name
+        candidates = [self._first_substring(category_lower, self.exact, self.exact_lengths)]
+        pos = self._names.find(category_lower) if self.rows else -1
+        if pos >= 0:
+            candidates.append(bisect.bisect_right(self._name_starts, pos) - 1)
+        candidates = [c for c in candidates if c is not None]
+        if candidates:
+            return min(candidates)
+
+        return self._first_substring(category_lower, self.keywords, self.keyword_lengths)
+
+
+# ============ RESULT CACHE ============
+# DATA_DIR -> (CSV stat signature, data fingerprint) from the last lookup in this process
+_DATA_HASH_MEMO = {}
+
+
+def _data_files(directory: Path = None, prefix: str = "") -> list:
+    """Sorted (relative path, mtime_ns, size) of every CSV under DATA_DIR, skipping dot directories."""
+    files = []
+    with os.scandir(directory or DATA_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                files += _data_files(Path(entry.path), f"{prefix}{entry.name}/")
+            elif entry.name.endswith(".csv"):
+                stat = entry.stat()
+                files.append((prefix + entry.name, stat.st_mtime_ns, stat.st_size))
+    return sorted(files)
+
+
+class ResultCache:
+    """
+    SQLite store of generated design systems, shared by every process using DATA_DIR.
+
+    Entries are keyed by the normalized query, the project name and a
+    fingerprint of every CSV under DATA_DIR: the SHA-256 of each file's
+    contents, remembered by path, mtime and size so unchanged files are not
+    re-read. Storing a result drops entries made from other data, and the
+    least recently used entries beyond max_entries are evicted. Any SQLite
+    or filesystem error is treated as a miss.
+    """
+
+    def __init__(self, path=None, max_entries: int = RESULT_CACHE_SIZE):
+        self.path = Path(path) if path else INDEX_DIR / RESULT_CACHE_FILE
+        self.max_entries = max_entries
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=5.0)
+        conn.execute("PRAGMA synchronous = OFF")  # a lost write is just a future miss
+        conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, data_hash TEXT NOT NULL, "
+                     "value TEXT NOT NULL, last_used REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        conn.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+                     "size INTEGER NOT NULL, sha256 TEXT NOT NULL)")
+        return conn
+
+    def _data_hash(self, conn: sqlite3.Connection) -> str:
+        """Fingerprint of the contents of every CSV under DATA_DIR."""
+        files = _data_files()
+        signature = tuple(files)
+        memo = _DATA_HASH_MEMO.get(str(DATA_DIR))
+        if memo and memo[0] == signature:
+            return memo[1]
+        known = {path: (mtime_ns, size, sha) for path, mtime_ns, size, sha in conn.execute("SELECT * FROM files")}
+        digest = hashlib.sha256()
+        for rel, mtime_ns, size in files:
+            entry = known.get(rel)
+            if entry and entry[:2] == (mtime_ns, size):
+                sha = entry[2]
+            else:
+                sha = _file_hash(DATA_DIR / rel)
+                conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (rel, mtime_ns, size, sha))
+            digest.update(f"{rel}\0{sha}\n".encode('utf-8'))
+        _DATA_HASH_MEMO[str(DATA_DIR)] = (signature, digest.hexdigest())
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(query: str, project_name: str = None) -> str:
+        """Entry key: the query as the search analyzer sees it, plus everything else that shapes the result."""
+        normalized = " ".join(_NON_WORD.sub(" ", query.lower()).split())
+        parts = [RESULT_CACHE_VERSION, normalized, project_name or "", SEARCH_CONFIG, STYLE_PRIORITY_BOOST]
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def lookup(self, query: str, project_name: str = None):
+        """(key, data fingerprint, stored design system or None); (None, None, None) if the cache is unusable."""
+        key = self.key(query, project_name)
+        try:
+            with closing(self._connect()) as conn, conn:
+                data_hash = self._data_hash(conn)
+                row = conn.execute("SELECT value FROM results WHERE key = ? AND data_hash = ?", (key, data_hash)).fetchone()
+                if row is None:
+                    return key, data_hash, None
+                conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+                return key, data_hash, json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError):
+            return None, None, None
+
+    def store(self, key: str, data_hash: str, design_system: dict):
+        """Save a result, dropping entries for other data and the least recently used overflow."""
+        if key is None:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM results WHERE data_hash != ?", (data_hash,))
+                conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                             (key, data_hash, json.dumps(design_system, ensure_ascii=False), time.time()))
+                conn.execute("DELETE FROM results WHERE key IN "
+                             "(SELECT key FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def clear(self):
+        """Remove every stored result."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM results")
+        except (sqlite3.Error, OSError):
+            pass
+
 
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
-    def __init__(self):
-        self.reasoning_data = self._load_reasoning()
+    def __init__(self, cache: ResultCache = None):
+        self.cache = cache if cache is not None else (ResultCache() if RESULT_CACHE_ENABLED else None)
+        self._reasoning_index = None
 
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
+    @property
+    def reasoning_index(self) -> ReasoningIndex:
+        # Loaded on first use, so a result-cache hit never reads the reasoning rules
+        if self._reasoning_index is None:
+            self._reasoning_index = self._load_reasoning()
+        return self._reasoning_index
+
+    @property
+    def reasoning_data(self) -> list:
+        return self.reasoning_index.rows
+
+    def _load_reasoning(self) -> ReasoningIndex:
+        """Load and compile reasoning rules (once per process, reloaded if the file changes)."""
         filepath = DATA_DIR / REASONING_FILE
         if not filepath.exists():
-            return []
+            return ReasoningIndex([])
+        mtime_ns = filepath.stat().st_mtime_ns
+        cached = _REASONING_CACHE.get(str(filepath))
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
         with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+            index = ReasoningIndex(list(csv.DictReader(f)))
+        _REASONING_CACHE[str(filepath)] = (mtime_ns, index)
+        return index
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
+    def _multi_domain_search(self, query: str, style_priority: list = None, skip: tuple = ()) -> dict:
+        """Execute searches across multiple domains (one federated query for the shared text)."""
+        per_domain = {domain: config["max_results"] for domain, config in SEARCH_CONFIG.items() if domain not in skip}
         results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
+        if "style" in per_domain and style_priority:
+            # For style, also search with priority keywords. Repeating a query term
+            # adds its BM25F contribution again, so the first priority style is
+            # boosted over the second and BM25F ranks the best match first.
+            priority_terms = [style_priority[0]] * STYLE_PRIORITY_BOOST + style_priority[1:2]
+            results["style"] = search(f"{query} {' '.join(priority_terms)}", "style", per_domain.pop("style"))
+        if per_domain:
+            results.update(search_all(query, domains=list(per_domain), per_domain=per_domain)["by_domain"])
         return results
 
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
-
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
+        idx = self.reasoning_index.find(category)
+        return self.reasoning_data[idx] if idx is not None else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+        idx = self.reasoning_index.find(category)
 
-        if not rule:
+        if idx is None:
             return {
                 "pattern": "Hero + Features + CTA",
                 "style_priority": ["Minimalism", "Flat Design"],
@@ -101,89 +328,59 @@ class DesignSystemGenerator:
                 "severity": "MEDIUM"
             }
 
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
-
-        return {
-            "pattern": rule.get("Recommended_Pattern", ""),
-            "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
-            "color_mood": rule.get("Color_Mood", ""),
-            "typography_mood": rule.get("Typography_Mood", ""),
-            "key_effects": rule.get("Key_Effects", ""),
-            "anti_patterns": rule.get("Anti_Patterns", ""),
-            "decision_rules": decision_rules,
-            "severity": rule.get("Severity", "MEDIUM")
-        }
-
-    def _select_best_match(self, results: list, priority_keywords: list) -> dict:
-        """Select best matching result based on priority keywords."""
-        if not results:
-            return {}
-
-        if not priority_keywords:
-            return results[0]
-
-        # First: try exact style name match
-        for priority in priority_keywords:
-            priority_lower = priority.lower().strip()
-            for result in results:
-                style_name = result.get("Style Category", "").lower()
-                if priority_lower in style_name or style_name in priority_lower:
-                    return result
-
-        # Second: score by keyword match in all fields
-        scored = []
-        for result in results:
-            result_str = str(result).lower()
-            score = 0
-            for kw in priority_keywords:
-                kw_lower = kw.lower().strip()
-                # Higher score for style name match
-                if kw_lower in result.get("Style Category", "").lower():
-                    score += 10
-                # Lower score for keyword field match
-                elif kw_lower in result.get("Keywords", "").lower():
-                    score += 3
-                # Even lower for other field matches
-                elif kw_lower in result_str:
-                    score += 1
-            scored.append((score, result))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return scored[0][1] if scored and scored[0][0] > 0 else results[0]
+        # Pre-compiled at load time; copy the mutable parts so callers can't alter the cache
+        reasoning = self.reasoning_index.reasoning[idx]
+        return {**reasoning, "style_priority": list(reasoning["style_priority"]),
+                "decision_rules": dict(reasoning["decision_rules"])}
 
     def _extract_results(self, search_result: dict) -> list:
         """Extract results list from search result dict."""
         return search_result.get("results", [])
 
-    def generate(self, query: str, project_name: str = None) -> dict:
-        """Generate complete design system recommendation."""
+    def generate(self, query: str, project_name: str = None, use_cache: bool = True) -> dict:
+        """Generate complete design system recommendation (served from the result cache when possible)."""
+        cache = self.cache if use_cache else None
+        with span("design_system.generate", query=query):
+            if cache is None:
+                return self._generate(query, project_name)
+            with span("design_system.cache_lookup"):
+                key, data_hash, design_system = cache.lookup(query, project_name)
+            count("result_cache.hit" if design_system is not None else "result_cache.miss")
+            if design_system is None:
+                design_system = self._generate(query, project_name)
+                with span("design_system.cache_store"):
+                    cache.store(key, data_hash, design_system)
+            # The key ignores case and punctuation, but the default project name echoes the raw query
+            design_system["project_name"] = project_name or query.upper()
+            return design_system
+
+    def _generate(self, query: str, project_name: str = None) -> dict:
+        """Run the searches and reasoning behind generate()."""
         # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+        with span("design_system.product_search"):
+            product_result = search(query, "product", 1)
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
             category = product_results[0].get("Product Type", "General")
 
         # Step 2: Get reasoning rules for this category
-        reasoning = self._apply_reasoning(category, {})
+        with span("design_system.reasoning", category=category):
+            reasoning = self._apply_reasoning(category, {})
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
+        with span("design_system.domain_search"):
+            search_results = self._multi_domain_search(query, style_priority, skip=("product",))
         search_results["product"] = product_result  # Reuse product search
 
-        # Step 4: Select best matches from each domain using priority
+        # Step 4: Take the best match from each domain (BM25F already ranked style priority)
         style_results = self._extract_results(search_results.get("style", {}))
         color_results = self._extract_results(search_results.get("color", {}))
         typography_results = self._extract_results(search_results.get("typography", {}))
         landing_results = self._extract_results(search_results.get("landing", {}))
 
-        best_style = self._select_best_match(style_results, reasoning.get("style_priority", []))
+        best_style = style_results[0] if style_results else {}
         best_color = color_results[0] if color_results else {}
         best_typography = typography_results[0] if typography_results else {}
         best_landing = landing_results[0] if landing_results else {}
@@ -460,7 +657,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           pages: list = None, use_cache: bool = True) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,76 +669,185 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        pages: Optional list of page names; overrides for all of them are generated
+               from one master (implies persist)
+        use_cache: If False, bypass the persistent result cache
 
     Returns:
         Formatted design system string
     """
     generator = DesignSystemGenerator()
-    design_system = generator.generate(query, project_name)
+    design_system = generator.generate(query, project_name, use_cache=use_cache)
     
     # Persist to files if requested
-    if persist:
-        persist_design_system(design_system, page, output_dir, query)
+    if persist or pages:
+        with span("design_system.persist"):
+            persist_design_system(design_system, page, output_dir, query, pages=pages)
 
-    if output_format == "markdown":
-        return format_markdown(design_system)
-    return format_ascii_box(design_system)
+    with span("design_system.format", format=output_format):
+        if output_format == "markdown":
+            return format_markdown(design_system)
+        return format_ascii_box(design_system)
 
 
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+# Lines that change on every run without changing the design system itself
+_VOLATILE_LINE = re.compile(r"^(> )?\*\*Generated:\*\* ")
+
+
+def _content_hash(lines) -> str:
+    """sha256 of the lines of a persisted file, ignoring the generation timestamp."""
+    digest = hashlib.sha256()
+    for line in lines:
+        if not _VOLATILE_LINE.match(line):
+            digest.update(line.encode('utf-8'))
+            digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _persisted_file_hash(path: Path):
+    """_content_hash of an existing file, or None when it cannot be read."""
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return _content_hash(f.read().split("\n"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_if_changed(path: Path, lines) -> bool:
+    """
+    Stream lines into path atomically, leaving it untouched when nothing changed.
+
+    Lines are written to a temporary file in the same directory as they are
+    produced and hashed on the way; the temporary file then replaces path
+    only if its hash differs from the current file's. Returns True when path
+    was (re)written.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    digest = hashlib.sha256()
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            for i, line in enumerate(lines):
+                if i:
+                    f.write("\n")
+                f.write(line)
+                if not _VOLATILE_LINE.match(line):
+                    digest.update(line.encode('utf-8'))
+                    digest.update(b"\n")
+        if digest.hexdigest() == _persisted_file_hash(path):
+            os.remove(tmp_path)
+            count("files.unchanged")
+            return False
+        os.replace(tmp_path, path)
+        count("files.written")
+        return True
+    except BaseException:
+        if tmp_path.exists():
+            os.remove(tmp_path)
+        raise
+
+
+def _slug(name: str, kind: str) -> str:
+    """Lowercased, dash-separated file or folder name; rejects names that could leave the output folder."""
+    if '/' in name or '\\' in name or '..' in name or '\0' in name:
+        raise ValueError(f"Invalid {kind} name (no path separators or '..'): {name!r}")
+    return name.lower().replace(' ', '-')
+
+
+def page_slug(page: str) -> str:
+    """File name (without .md) of a page override."""
+    return _slug(page, "page")
+
+
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          pages: list = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
+    Files are streamed to disk with write_if_changed, so a file whose content
+    is unchanged (apart from its timestamp) keeps its old version and mtime.
+    
     Args:
         design_system: The generated design system dictionary
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        pages: Optional list of page names. Their overrides are generated and
+               written concurrently (threads share the loaded search indexes).
     
     Returns:
-        dict with created file paths and status
+        dict with created file paths, which of them were written or unchanged, and status
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
     # Use project name for project-specific folder
     project_name = design_system.get("project_name", "default")
-    project_slug = project_name.lower().replace(' ', '-')
+    project_slug = _slug(project_name, "project")
+    # One override per distinct page slug; names are checked before anything is created
+    page_names = list({page_slug(name): name for name in ([page] if page else []) + list(pages or [])}.values())
     
     design_system_dir = base_dir / "design-system" / project_slug
     pages_dir = design_system_dir / "pages"
     
-    created_files = []
-    
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
     
     master_file = design_system_dir / "MASTER.md"
     
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
+    # Stream MASTER.md
+    with span("design_system.write", file="MASTER.md"):
+        results = [(master_file, write_if_changed(master_file, iter_master_md(design_system)))]
     
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+    # Page override files with intelligent content (page_names)
+    if page_names:
+        def write_page(name):
+            page_file = pages_dir / f"{page_slug(name)}.md"
+            with span("design_system.write", file=f"pages/{page_file.name}"):
+                return page_file, write_if_changed(page_file, iter_page_override_md(design_system, name, page_query))
+        with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, len(page_names))) as pool:
+            results += list(pool.map(write_page, page_names))
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": [str(path) for path, _ in results],
+        "written": [str(path) for path, written in results if written],
+        "unchanged": [str(path) for path, written in results if not written]
     }
 
 
+def persist_design_systems(jobs: list, output_dir: str = None, workers: int = PROJECT_WORKERS) -> list:
+    """
+    Persist several projects' design systems concurrently.
+    
+    Args:
+        jobs: dicts with "design_system" and optionally "page", "pages" and "page_query"
+        output_dir: Optional output directory shared by all projects
+        workers: Number of projects written at the same time
+    
+    Returns:
+        persist_design_system() results, in the order of jobs
+    """
+    if not jobs:
+        return []
+    
+    def persist(job):
+        return persist_design_system(job["design_system"], job.get("page"), output_dir,
+                                     job.get("page_query"), pages=job.get("pages"))
+    
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(persist, jobs))
+
+
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
+    return "\n".join(iter_master_md(design_system))
+
+
+def iter_master_md(design_system: dict):
+    """Lines of MASTER.md, produced section by section."""
     project = design_system.get("project_name", "PROJECT")
     pattern = design_system.get("pattern", {})
     style = design_system.get("style", {})
@@ -551,259 +858,260 @@ def format_master_md(design_system: dict) -> str:
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    lines = []
-    
     # Logic header
-    lines.append("# Design System Master File")
-    lines.append("")
-    lines.append("> **LOGIC:** When building a specific page, first check `design-system/pages/[page-name].md`.")
-    lines.append("> If that file exists, its rules **override** this Master file.")
-    lines.append("> If not, strictly follow the rules below.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append(f"**Project:** {project}")
-    lines.append(f"**Generated:** {timestamp}")
-    lines.append(f"**Category:** {design_system.get('category', 'General')}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield "# Design System Master File"
+    yield ""
+    yield "> **LOGIC:** When building a specific page, first check `design-system/pages/[page-name].md`."
+    yield "> If that file exists, its rules **override** this Master file."
+    yield "> If not, strictly follow the rules below."
+    yield ""
+    yield "---"
+    yield ""
+    yield f"**Project:** {project}"
+    yield f"**Generated:** {timestamp}"
+    yield f"**Category:** {design_system.get('category', 'General')}"
+    yield ""
+    yield "---"
+    yield ""
     
     # Global Rules section
-    lines.append("## Global Rules")
-    lines.append("")
+    yield "## Global Rules"
+    yield ""
     
     # Color Palette
-    lines.append("### Color Palette")
-    lines.append("")
-    lines.append("| Role | Hex | CSS Variable |")
-    lines.append("|------|-----|--------------|")
-    lines.append(f"| Primary | `{colors.get('primary', '#2563EB')}` | `--color-primary` |")
-    lines.append(f"| Secondary | `{colors.get('secondary', '#3B82F6')}` | `--color-secondary` |")
-    lines.append(f"| CTA/Accent | `{colors.get('cta', '#F97316')}` | `--color-cta` |")
-    lines.append(f"| Background | `{colors.get('background', '#F8FAFC')}` | `--color-background` |")
-    lines.append(f"| Text | `{colors.get('text', '#1E293B')}` | `--color-text` |")
-    lines.append("")
+    yield "### Color Palette"
+    yield ""
+    yield "| Role | Hex | CSS Variable |"
+    yield "|------|-----|--------------|"
+    yield f"| Primary | `{colors.get('primary', '#2563EB')}` | `--color-primary` |"
+    yield f"| Secondary | `{colors.get('secondary', '#3B82F6')}` | `--color-secondary` |"
+    yield f"| CTA/Accent | `{colors.get('cta', '#F97316')}` | `--color-cta` |"
+    yield f"| Background | `{colors.get('background', '#F8FAFC')}` | `--color-background` |"
+    yield f"| Text | `{colors.get('text', '#1E293B')}` | `--color-text` |"
+    yield ""
     if colors.get("notes"):
-        lines.append(f"**Color Notes:** {colors.get('notes', '')}")
-        lines.append("")
+        yield f"**Color Notes:** {colors.get('notes', '')}"
+        yield ""
     
     # Typography
-    lines.append("### Typography")
-    lines.append("")
-    lines.append(f"- **Heading Font:** {typography.get('heading', 'Inter')}")
-    lines.append(f"- **Body Font:** {typography.get('body', 'Inter')}")
+    yield "### Typography"
+    yield ""
+    yield f"- **Heading Font:** {typography.get('heading', 'Inter')}"
+    yield f"- **Body Font:** {typography.get('body', 'Inter')}"
     if typography.get("mood"):
-        lines.append(f"- **Mood:** {typography.get('mood', '')}")
+        yield f"- **Mood:** {typography.get('mood', '')}"
     if typography.get("google_fonts_url"):
-        lines.append(f"- **Google Fonts:** [{typography.get('heading', '')} + {typography.get('body', '')}]({typography.get('google_fonts_url', '')})")
-    lines.append("")
+        yield f"- **Google Fonts:** [{typography.get('heading', '')} + {typography.get('body', '')}]({typography.get('google_fonts_url', '')})"
+    yield ""
     if typography.get("css_import"):
-        lines.append("**CSS Import:**")
-        lines.append("```css")
-        lines.append(typography.get("css_import", ""))
-        lines.append("```")
-        lines.append("")
+        yield "**CSS Import:**"
+        yield "```css"
+        yield typography.get("css_import", "")
+        yield "```"
+        yield ""
     
     # Spacing Variables
-    lines.append("### Spacing Variables")
-    lines.append("")
-    lines.append("| Token | Value | Usage |")
-    lines.append("|-------|-------|-------|")
-    lines.append("| `--space-xs` | `4px` / `0.25rem` | Tight gaps |")
-    lines.append("| `--space-sm` | `8px` / `0.5rem` | Icon gaps, inline spacing |")
-    lines.append("| `--space-md` | `16px` / `1rem` | Standard padding |")
-    lines.append("| `--space-lg` | `24px` / `1.5rem` | Section padding |")
-    lines.append("| `--space-xl` | `32px` / `2rem` | Large gaps |")
-    lines.append("| `--space-2xl` | `48px` / `3rem` | Section margins |")
-    lines.append("| `--space-3xl` | `64px` / `4rem` | Hero padding |")
-    lines.append("")
+    yield "### Spacing Variables"
+    yield ""
+    yield "| Token | Value | Usage |"
+    yield "|-------|-------|-------|"
+    yield "| `--space-xs` | `4px` / `0.25rem` | Tight gaps |"
+    yield "| `--space-sm` | `8px` / `0.5rem` | Icon gaps, inline spacing |"
+    yield "| `--space-md` | `16px` / `1rem` | Standard padding |"
+    yield "| `--space-lg` | `24px` / `1.5rem` | Section padding |"
+    yield "| `--space-xl` | `32px` / `2rem` | Large gaps |"
+    yield "| `--space-2xl` | `48px` / `3rem` | Section margins |"
+    yield "| `--space-3xl` | `64px` / `4rem` | Hero padding |"
+    yield ""
     
     # Shadow Depths
-    lines.append("### Shadow Depths")
-    lines.append("")
-    lines.append("| Level | Value | Usage |")
-    lines.append("|-------|-------|-------|")
-    lines.append("| `--shadow-sm` | `0 1px 2px rgba(0,0,0,0.05)` | Subtle lift |")
-    lines.append("| `--shadow-md` | `0 4px 6px rgba(0,0,0,0.1)` | Cards, buttons |")
-    lines.append("| `--shadow-lg` | `0 10px 15px rgba(0,0,0,0.1)` | Modals, dropdowns |")
-    lines.append("| `--shadow-xl` | `0 20px 25px rgba(0,0,0,0.15)` | Hero images, featured cards |")
-    lines.append("")
+    yield "### Shadow Depths"
+    yield ""
+    yield "| Level | Value | Usage |"
+    yield "|-------|-------|-------|"
+    yield "| `--shadow-sm` | `0 1px 2px rgba(0,0,0,0.05)` | Subtle lift |"
+    yield "| `--shadow-md` | `0 4px 6px rgba(0,0,0,0.1)` | Cards, buttons |"
+    yield "| `--shadow-lg` | `0 10px 15px rgba(0,0,0,0.1)` | Modals, dropdowns |"
+    yield "| `--shadow-xl` | `0 20px 25px rgba(0,0,0,0.15)` | Hero images, featured cards |"
+    yield ""
     
     # Component Specs section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Component Specs")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Component Specs"
+    yield ""
     
     # Buttons
-    lines.append("### Buttons")
-    lines.append("")
-    lines.append("```css")
-    lines.append("/* Primary Button */")
-    lines.append(".btn-primary {")
-    lines.append(f"  background: {colors.get('cta', '#F97316')};")
-    lines.append("  color: white;")
-    lines.append("  padding: 12px 24px;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-weight: 600;")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".btn-primary:hover {")
-    lines.append("  opacity: 0.9;")
-    lines.append("  transform: translateY(-1px);")
-    lines.append("}")
-    lines.append("")
-    lines.append("/* Secondary Button */")
-    lines.append(".btn-secondary {")
-    lines.append(f"  background: transparent;")
-    lines.append(f"  color: {colors.get('primary', '#2563EB')};")
-    lines.append(f"  border: 2px solid {colors.get('primary', '#2563EB')};")
-    lines.append("  padding: 12px 24px;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-weight: 600;")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Buttons"
+    yield ""
+    yield "```css"
+    yield "/* Primary Button */"
+    yield ".btn-primary {"
+    yield f"  background: {colors.get('cta', '#F97316')};"
+    yield "  color: white;"
+    yield "  padding: 12px 24px;"
+    yield "  border-radius: 8px;"
+    yield "  font-weight: 600;"
+    yield "  transition: all 200ms ease;"
+    yield "  cursor: pointer;"
+    yield "}"
+    yield ""
+    yield ".btn-primary:hover {"
+    yield "  opacity: 0.9;"
+    yield "  transform: translateY(-1px);"
+    yield "}"
+    yield ""
+    yield "/* Secondary Button */"
+    yield ".btn-secondary {"
+    yield f"  background: transparent;"
+    yield f"  color: {colors.get('primary', '#2563EB')};"
+    yield f"  border: 2px solid {colors.get('primary', '#2563EB')};"
+    yield "  padding: 12px 24px;"
+    yield "  border-radius: 8px;"
+    yield "  font-weight: 600;"
+    yield "  transition: all 200ms ease;"
+    yield "  cursor: pointer;"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Cards
-    lines.append("### Cards")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".card {")
-    lines.append(f"  background: {colors.get('background', '#FFFFFF')};")
-    lines.append("  border-radius: 12px;")
-    lines.append("  padding: 24px;")
-    lines.append("  box-shadow: var(--shadow-md);")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".card:hover {")
-    lines.append("  box-shadow: var(--shadow-lg);")
-    lines.append("  transform: translateY(-2px);")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Cards"
+    yield ""
+    yield "```css"
+    yield ".card {"
+    yield f"  background: {colors.get('background', '#FFFFFF')};"
+    yield "  border-radius: 12px;"
+    yield "  padding: 24px;"
+    yield "  box-shadow: var(--shadow-md);"
+    yield "  transition: all 200ms ease;"
+    yield "  cursor: pointer;"
+    yield "}"
+    yield ""
+    yield ".card:hover {"
+    yield "  box-shadow: var(--shadow-lg);"
+    yield "  transform: translateY(-2px);"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Inputs
-    lines.append("### Inputs")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".input {")
-    lines.append("  padding: 12px 16px;")
-    lines.append("  border: 1px solid #E2E8F0;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-size: 16px;")
-    lines.append("  transition: border-color 200ms ease;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".input:focus {")
-    lines.append(f"  border-color: {colors.get('primary', '#2563EB')};")
-    lines.append("  outline: none;")
-    lines.append(f"  box-shadow: 0 0 0 3px {colors.get('primary', '#2563EB')}20;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Inputs"
+    yield ""
+    yield "```css"
+    yield ".input {"
+    yield "  padding: 12px 16px;"
+    yield "  border: 1px solid #E2E8F0;"
+    yield "  border-radius: 8px;"
+    yield "  font-size: 16px;"
+    yield "  transition: border-color 200ms ease;"
+    yield "}"
+    yield ""
+    yield ".input:focus {"
+    yield f"  border-color: {colors.get('primary', '#2563EB')};"
+    yield "  outline: none;"
+    yield f"  box-shadow: 0 0 0 3px {colors.get('primary', '#2563EB')}20;"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Modals
-    lines.append("### Modals")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".modal-overlay {")
-    lines.append("  background: rgba(0, 0, 0, 0.5);")
-    lines.append("  backdrop-filter: blur(4px);")
-    lines.append("}")
-    lines.append("")
-    lines.append(".modal {")
-    lines.append("  background: white;")
-    lines.append("  border-radius: 16px;")
-    lines.append("  padding: 32px;")
-    lines.append("  box-shadow: var(--shadow-xl);")
-    lines.append("  max-width: 500px;")
-    lines.append("  width: 90%;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Modals"
+    yield ""
+    yield "```css"
+    yield ".modal-overlay {"
+    yield "  background: rgba(0, 0, 0, 0.5);"
+    yield "  backdrop-filter: blur(4px);"
+    yield "}"
+    yield ""
+    yield ".modal {"
+    yield "  background: white;"
+    yield "  border-radius: 16px;"
+    yield "  padding: 32px;"
+    yield "  box-shadow: var(--shadow-xl);"
+    yield "  max-width: 500px;"
+    yield "  width: 90%;"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Style section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Style Guidelines")
-    lines.append("")
-    lines.append(f"**Style:** {style.get('name', 'Minimalism')}")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Style Guidelines"
+    yield ""
+    yield f"**Style:** {style.get('name', 'Minimalism')}"
+    yield ""
     if style.get("keywords"):
-        lines.append(f"**Keywords:** {style.get('keywords', '')}")
-        lines.append("")
+        yield f"**Keywords:** {style.get('keywords', '')}"
+        yield ""
     if style.get("best_for"):
-        lines.append(f"**Best For:** {style.get('best_for', '')}")
-        lines.append("")
+        yield f"**Best For:** {style.get('best_for', '')}"
+        yield ""
     if effects:
-        lines.append(f"**Key Effects:** {effects}")
-        lines.append("")
+        yield f"**Key Effects:** {effects}"
+        yield ""
     
     # Layout Pattern
-    lines.append("### Page Pattern")
-    lines.append("")
-    lines.append(f"**Pattern Name:** {pattern.get('name', '')}")
-    lines.append("")
+    yield "### Page Pattern"
+    yield ""
+    yield f"**Pattern Name:** {pattern.get('name', '')}"
+    yield ""
     if pattern.get('conversion'):
-        lines.append(f"- **Conversion Strategy:** {pattern.get('conversion', '')}")
+        yield f"- **Conversion Strategy:** {pattern.get('conversion', '')}"
     if pattern.get('cta_placement'):
-        lines.append(f"- **CTA Placement:** {pattern.get('cta_placement', '')}")
-    lines.append(f"- **Section Order:** {pattern.get('sections', '')}")
-    lines.append("")
+        yield f"- **CTA Placement:** {pattern.get('cta_placement', '')}"
+    yield f"- **Section Order:** {pattern.get('sections', '')}"
+    yield ""
     
     # Anti-Patterns section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Anti-Patterns (Do NOT Use)")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Anti-Patterns (Do NOT Use)"
+    yield ""
     if anti_patterns:
         anti_list = [a.strip() for a in anti_patterns.split("+")]
         for anti in anti_list:
             if anti:
-                lines.append(f"- ❌ {anti}")
-    lines.append("")
-    lines.append("### Additional Forbidden Patterns")
-    lines.append("")
-    lines.append("- ❌ **Emojis as icons** — Use SVG icons (Heroicons, Lucide, Simple Icons)")
-    lines.append("- ❌ **Missing cursor:pointer** — All clickable elements must have cursor:pointer")
-    lines.append("- ❌ **Layout-shifting hovers** — Avoid scale transforms that shift layout")
-    lines.append("- ❌ **Low contrast text** — Maintain 4.5:1 minimum contrast ratio")
-    lines.append("- ❌ **Instant state changes** — Always use transitions (150-300ms)")
-    lines.append("- ❌ **Invisible focus states** — Focus states must be visible for a11y")
-    lines.append("")
+                yield f"- ❌ {anti}"
+    yield ""
+    yield "### Additional Forbidden Patterns"
+    yield ""
+    yield "- ❌ **Emojis as icons** — Use SVG icons (Heroicons, Lucide, Simple Icons)"
+    yield "- ❌ **Missing cursor:pointer** — All clickable elements must have cursor:pointer"
+    yield "- ❌ **Layout-shifting hovers** — Avoid scale transforms that shift layout"
+    yield "- ❌ **Low contrast text** — Maintain 4.5:1 minimum contrast ratio"
+    yield "- ❌ **Instant state changes** — Always use transitions (150-300ms)"
+    yield "- ❌ **Invisible focus states** — Focus states must be visible for a11y"
+    yield ""
     
     # Pre-Delivery Checklist
-    lines.append("---")
-    lines.append("")
-    lines.append("## Pre-Delivery Checklist")
-    lines.append("")
-    lines.append("Before delivering any UI code, verify:")
-    lines.append("")
-    lines.append("- [ ] No emojis used as icons (use SVG instead)")
-    lines.append("- [ ] All icons from consistent icon set (Heroicons/Lucide)")
-    lines.append("- [ ] `cursor-pointer` on all clickable elements")
-    lines.append("- [ ] Hover states with smooth transitions (150-300ms)")
-    lines.append("- [ ] Light mode: text contrast 4.5:1 minimum")
-    lines.append("- [ ] Focus states visible for keyboard navigation")
-    lines.append("- [ ] `prefers-reduced-motion` respected")
-    lines.append("- [ ] Responsive: 375px, 768px, 1024px, 1440px")
-    lines.append("- [ ] No content hidden behind fixed navbars")
-    lines.append("- [ ] No horizontal scroll on mobile")
-    lines.append("")
-    
-    return "\n".join(lines)
+    yield "---"
+    yield ""
+    yield "## Pre-Delivery Checklist"
+    yield ""
+    yield "Before delivering any UI code, verify:"
+    yield ""
+    yield "- [ ] No emojis used as icons (use SVG instead)"
+    yield "- [ ] All icons from consistent icon set (Heroicons/Lucide)"
+    yield "- [ ] `cursor-pointer` on all clickable elements"
+    yield "- [ ] Hover states with smooth transitions (150-300ms)"
+    yield "- [ ] Light mode: text contrast 4.5:1 minimum"
+    yield "- [ ] Focus states visible for keyboard navigation"
+    yield "- [ ] `prefers-reduced-motion` respected"
+    yield "- [ ] Responsive: 375px, 768px, 1024px, 1440px"
+    yield "- [ ] No content hidden behind fixed navbars"
+    yield "- [ ] No horizontal scroll on mobile"
+    yield ""
 
 
 def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
     """Format a page-specific override file with intelligent AI-generated content."""
+    return "\n".join(iter_page_override_md(design_system, page_name, page_query))
+
+
+def iter_page_override_md(design_system: dict, page_name: str, page_query: str = None):
+    """Lines of a page override file, produced section by section."""
     project = design_system.get("project_name", "PROJECT")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     page_title = page_name.replace("-", " ").replace("_", " ").title()
@@ -811,104 +1119,100 @@ def format_page_override_md(design_system: dict, page_name: str, page_query: str
     # Detect page type and generate intelligent overrides
     page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
     
-    lines = []
-    
-    lines.append(f"# {page_title} Page Overrides")
-    lines.append("")
-    lines.append(f"> **PROJECT:** {project}")
-    lines.append(f"> **Generated:** {timestamp}")
-    lines.append(f"> **Page Type:** {page_overrides.get('page_type', 'General')}")
-    lines.append("")
-    lines.append("> ⚠️ **IMPORTANT:** Rules in this file **override** the Master file (`design-system/MASTER.md`).")
-    lines.append("> Only deviations from the Master are documented here. For all other rules, refer to the Master.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield f"# {page_title} Page Overrides"
+    yield ""
+    yield f"> **PROJECT:** {project}"
+    yield f"> **Generated:** {timestamp}"
+    yield f"> **Page Type:** {page_overrides.get('page_type', 'General')}"
+    yield ""
+    yield "> ⚠️ **IMPORTANT:** Rules in this file **override** the Master file (`design-system/MASTER.md`)."
+    yield "> Only deviations from the Master are documented here. For all other rules, refer to the Master."
+    yield ""
+    yield "---"
+    yield ""
     
     # Page-specific rules with actual content
-    lines.append("## Page-Specific Rules")
-    lines.append("")
+    yield "## Page-Specific Rules"
+    yield ""
     
     # Layout Overrides
-    lines.append("### Layout Overrides")
-    lines.append("")
+    yield "### Layout Overrides"
+    yield ""
     layout = page_overrides.get("layout", {})
     if layout:
         for key, value in layout.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master layout")
-    lines.append("")
+        yield "- No overrides — use Master layout"
+    yield ""
     
     # Spacing Overrides
-    lines.append("### Spacing Overrides")
-    lines.append("")
+    yield "### Spacing Overrides"
+    yield ""
     spacing = page_overrides.get("spacing", {})
     if spacing:
         for key, value in spacing.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master spacing")
-    lines.append("")
+        yield "- No overrides — use Master spacing"
+    yield ""
     
     # Typography Overrides
-    lines.append("### Typography Overrides")
-    lines.append("")
+    yield "### Typography Overrides"
+    yield ""
     typography = page_overrides.get("typography", {})
     if typography:
         for key, value in typography.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master typography")
-    lines.append("")
+        yield "- No overrides — use Master typography"
+    yield ""
     
     # Color Overrides
-    lines.append("### Color Overrides")
-    lines.append("")
+    yield "### Color Overrides"
+    yield ""
     colors = page_overrides.get("colors", {})
     if colors:
         for key, value in colors.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master colors")
-    lines.append("")
+        yield "- No overrides — use Master colors"
+    yield ""
     
     # Component Overrides
-    lines.append("### Component Overrides")
-    lines.append("")
+    yield "### Component Overrides"
+    yield ""
     components = page_overrides.get("components", [])
     if components:
         for comp in components:
-            lines.append(f"- {comp}")
+            yield f"- {comp}"
     else:
-        lines.append("- No overrides — use Master component specs")
-    lines.append("")
+        yield "- No overrides — use Master component specs"
+    yield ""
     
     # Page-Specific Components
-    lines.append("---")
-    lines.append("")
-    lines.append("## Page-Specific Components")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Page-Specific Components"
+    yield ""
     unique_components = page_overrides.get("unique_components", [])
     if unique_components:
         for comp in unique_components:
-            lines.append(f"- {comp}")
+            yield f"- {comp}"
     else:
-        lines.append("- No unique components for this page")
-    lines.append("")
+        yield "- No unique components for this page"
+    yield ""
     
     # Recommendations
-    lines.append("---")
-    lines.append("")
-    lines.append("## Recommendations")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Recommendations"
+    yield ""
     recommendations = page_overrides.get("recommendations", [])
     if recommendations:
         for rec in recommendations:
-            lines.append(f"- {rec}")
-    lines.append("")
-    
-    return "\n".join(lines)
+            yield f"- {rec}"
+    yield ""
 
 
 def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict) -> dict:
@@ -918,16 +1222,16 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
-    # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    # One federated query across the domains used for page-specific guidance
+    page_search = search_all(combined_context, domains=["style", "ux", "landing"],
+                             per_domain={"style": 1, "ux": 3, "landing": 1})["by_domain"]
+    style_search = page_search.get("style", {})
+    ux_search = page_search.get("ux", {})
+    landing_search = page_search.get("landing", {})
     
     # Extract results from search response
     style_results = style_search.get("results", [])
@@ -3,8 +3,12 @@
 """
 UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
+       python search.py "<query>" --all [--max-results 5]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py "<query>" --design-system --pages dashboard,checkout,settings [-p "Project Name"]
+       python search.py --build-index
+       python search.py --batch [queries.txt|queries.jsonl] [--domain <domain>] [--stack <stack>]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +16,65 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+  --pages      Comma-separated pages: one master, all page overrides generated
+               concurrently and written together (implies --persist)
+
+Index cache:
+  Parsed CSVs and their BM25 indexes are cached in data/.index/ and rebuilt
+  automatically when a CSV changes. --build-index refreshes all of them up front,
+  along with the row embeddings used by --mode.
+
+Retrieval mode:
+  --mode hybrid fuses BM25 with embedding similarity (reciprocal rank fusion);
+  --mode semantic ranks by embeddings alone. See semantic.py.
+
+Batch mode:
+  --batch reads one query per line from a file (or stdin when no file is given)
+  and writes one JSON result per line. A line may also be a JSON object such as
+  {"id": 7, "query": "dark mode", "domain": "color", "stack": null, "max_results": 5};
+  missing fields fall back to the command-line options. Lines are scored
+  --batch-chunk at a time (default 256); pass --batch-chunk 1 when a tool
+  waits for each answer before writing the next query.
+
+Daemon:
+  python server.py keeps every index in memory and serves the same calls over
+  localhost HTTP; python client.py uses it when running and falls back to
+  in-process search otherwise.
+
+Profiling:
+  --profile prints where the time went (index load/read/build, analyze, score,
+  sort, materialize, design-system steps) and counters (postings traversed,
+  documents scored, cache hits/misses) to stderr; --trace FILE appends every
+  span as JSON lines. Other code can use core.start_trace()/span()/count().
+
+Startup:
+  Plain searches (query plus --domain/--stack/--all/--max-results/--json) are
+  parsed without argparse and never import design_system; anything else goes
+  through the full parser. --build-index also byte-compiles these scripts.
+  python benchmark.py startup checks the import-time budget.
 """
 
-import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import json
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack, search_all, search_batch, search_stack_batch, build_indexes, start_trace, stop_trace
+
+BATCH_CHUNK = 256
+
+# Options of a plain search that _fast_args() handles; any other argument
+# falls back to build_parser()
+_FAST_OPTIONS = {"--domain": "domain", "-d": "domain", "--stack": "stack", "-s": "stack",
+                 "--max-results": "max_results", "-n": "max_results", "--trace": "trace"}
+_FAST_FLAGS = {"--json": "json", "--all": "all", "-a": "all", "--profile": "profile"}
+
+
+def format_profile(summary):
+    """Per-stage timings and counters of a profiled run"""
+    output = [f"## Profile ({summary['elapsed_ms']:.2f} ms)", f"{'stage':<32}{'calls':>6}{'total ms':>11}"]
+    for name, stage in summary["stages"].items():
+        output.append(f"{name:<32}{stage['calls']:>6}{stage['total_ms']:>11.3f}")
+    if summary["counters"]:
+        output.append("counters: " + ", ".join(f"{name}={value}" for name, value in sorted(summary["counters"].items())))
+    return "\n".join(output)
 
 
 def format_output(result):
@@ -45,44 +103,200 @@ def format_output(result):
     return "\n".join(output)
 
 
-if __name__ == "__main__":
+def _parse_batch_line(line_no, line, domain, stack, max_results):
+    """Turn one batch line into (request, error)."""
+    request = {"query": line}
+    if line.startswith("{"):
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {}, f"Invalid JSON on line {line_no}: {e}"
+
+    query = request.get("query")
+    if not isinstance(query, str) or not query.strip():
+        return request, f"Missing query on line {line_no}"
+    if not isinstance(request.get("max_results", max_results), int):
+        return request, f"max_results must be an integer on line {line_no}"
+    request.setdefault("stack", stack)
+    request.setdefault("domain", domain)
+    request.setdefault("max_results", max_results)
+    return request, None
+
+
+def _run_batch_chunk(chunk, out):
+    """Score a chunk grouped by (stack, domain, max_results), then emit in input order."""
+    groups = {}
+    for pos, (line_no, request, error) in enumerate(chunk):
+        if error is None:
+            key = (request["stack"], None if request["stack"] else request["domain"], request["max_results"])
+            groups.setdefault(key, []).append(pos)
+
+    results = {}
+    for (q_stack, q_domain, q_max), positions in groups.items():
+        queries = [chunk[pos][1]["query"] for pos in positions]
+        if q_stack:
+            batch = search_stack_batch(queries, q_stack, q_max)
+        else:
+            batch = search_batch(queries, q_domain, q_max)
+        results.update(zip(positions, batch))
+
+    for pos, (line_no, request, error) in enumerate(chunk):
+        result = {"error": error} if error else results[pos]
+        if "id" in request:
+            result = {"id": request["id"], **result}
+        result["line"] = line_no
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    out.flush()
+
+
+def run_batch(lines, domain=None, stack=None, max_results=MAX_RESULTS, out=sys.stdout, chunk_size=BATCH_CHUNK):
+    """Run newline-delimited (plain or JSONL) queries, streaming JSONL results.
+
+    Lines are scored chunk_size at a time so queries against the same file share
+    one vectorized pass; use chunk_size=1 for strict request/response over a pipe.
+    """
+    count = 0
+    chunk = []
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        request, error = _parse_batch_line(line_no, line, domain, stack, max_results)
+        chunk.append((line_no, request, error))
+        count += 1
+        if len(chunk) >= chunk_size:
+            _run_batch_chunk(chunk, out)
+            chunk = []
+    if chunk:
+        _run_batch_chunk(chunk, out)
+    return count
+
+
+class _Args:
+    """Parsed options with the same defaults as build_parser()"""
+
+    def __init__(self, **values):
+        self.query = None
+        self.domain = None
+        self.stack = None
+        self.all = False
+        self.max_results = MAX_RESULTS
+        self.json = False
+        self.design_system = False
+        self.build_index = False
+        self.batch = None
+        self.mode = "bm25"
+        self.profile = False
+        self.trace = None
+        self.__dict__.update(values)
+
+
+def _fast_args(argv):
+    """Parse a plain search without argparse; None when argv needs the full parser."""
+    values = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _FAST_FLAGS:
+            values[_FAST_FLAGS[arg]] = True
+        elif arg in _FAST_OPTIONS and i + 1 < len(argv):
+            i += 1
+            values[_FAST_OPTIONS[arg]] = argv[i]
+        elif not arg.startswith("-") and "query" not in values:
+            values["query"] = arg
+        else:
+            return None
+        i += 1
+    if "query" not in values or values.get("domain", "style") not in CSV_CONFIG \
+            or values.get("stack", "react") not in AVAILABLE_STACKS:
+        return None
+    if "max_results" in values:
+        if not values["max_results"].lstrip("-").isdigit():
+            return None
+        values["max_results"] = int(values["max_results"])
+    return _Args(**values)
+
+
+def build_parser():
+    """The full command-line parser (argparse is imported only when this is needed)"""
+    import argparse
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+    parser.add_argument("--all", "-a", action="store_true", help="Federated search across every domain and stack, merged by normalized score")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--mode", "-m", choices=["bm25", "hybrid", "semantic"], default="bm25",
+                        help="Ranking for domain/stack search: BM25 (default), embeddings, or both fused (see semantic.py)")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    parser.add_argument("--no-cache", action="store_true", help="Regenerate the design system instead of using the result cache")
     # Persistence (Master + Overrides pattern)
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
+    parser.add_argument("--pages", type=str, default=None, help="Comma-separated page names; generates every override from one master (implies --persist)")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Index cache
+    parser.add_argument("--build-index", action="store_true", help="Build the on-disk index cache for every domain and stack, then exit")
+    # Batch mode
+    parser.add_argument("--batch", nargs="?", const="-", default=None, metavar="FILE", help="Read queries (text or JSONL) from FILE or stdin and stream JSONL results")
+    parser.add_argument("--batch-chunk", type=int, default=BATCH_CHUNK, help=f"Queries scored together in --batch mode (default: {BATCH_CHUNK})")
+    # Profiling
+    parser.add_argument("--profile", action="store_true", help="Print per-stage timings and counters to stderr")
+    parser.add_argument("--trace", metavar="FILE", default=None, help="Append a JSON-lines trace of this run to FILE")
+    return parser
+
 
-    args = parser.parse_args()
+if __name__ == "__main__":
+    args = _fast_args(sys.argv[1:])
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args()
+
+    trace = start_trace() if args.profile or args.trace else None
 
+    if args.build_index:
+        import compileall
+        from pathlib import Path
+        built = build_indexes()
+        from semantic import build_vectors
+        build_vectors()
+        compileall.compile_dir(str(Path(__file__).parent), maxlevels=0, quiet=1)
+        print(f"Indexed {len(built)} files into data/.index/")
+    elif args.batch is not None:
+        if args.batch == "-":
+            run_batch(sys.stdin, args.domain, args.stack, args.max_results, chunk_size=max(1, args.batch_chunk))
+        else:
+            with open(args.batch, 'r', encoding='utf-8') as f:
+                run_batch(f, args.domain, args.stack, args.max_results, chunk_size=max(1, args.batch_chunk))
+    elif args.query is None:
+        parser.error("the following arguments are required: query")
     # Design system takes priority
-    if args.design_system:
+    elif args.design_system:
+        from design_system import generate_design_system, page_slug
+        pages = [name.strip() for name in args.pages.split(",") if name.strip()] if args.pages else []
         result = generate_design_system(
             args.query, 
             args.project_name, 
             args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            pages=pages,
+            use_cache=not args.no_cache
         )
         print(result)
         
         # Print persistence confirmation
-        if args.persist:
+        if args.persist or pages:
             project_slug = args.project_name.lower().replace(' ', '-') if args.project_name else "default"
             print("\n" + "=" * 60)
             print(f"✅ Design system persisted to design-system/{project_slug}/")
             print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
-            if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
+            for page_filename in dict.fromkeys(page_slug(name) for name in ([args.page] if args.page else []) + pages):
                 print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
             print("")
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
@@ -90,17 +304,37 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        if args.mode == "bm25":
+            result = search_stack(args.query, args.stack, args.max_results)
+        else:
+            import semantic
+            result = semantic.search_stack(args.query, args.stack, args.max_results, args.mode)
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print(format_output(result))
+    # Federated search
+    elif args.all:
+        result = search_all(args.query, args.max_results)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        if args.mode == "bm25":
+            result = search(args.query, args.domain, args.max_results)
+        else:
+            import semantic
+            result = semantic.search(args.query, args.domain, args.max_results, args.mode)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
+
+    if trace is not None:
+        stop_trace()
+        if args.profile:
+            print(format_profile(trace.summary()), file=sys.stderr)
+        if args.trace:
+            trace.write_jsonl(args.trace)
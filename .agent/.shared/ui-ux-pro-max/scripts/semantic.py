@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Semantic Search - embedding retrieval fused with BM25
+Usage: python semantic.py "<query>" [--domain <domain>] [--stack <stack>] [--mode hybrid|semantic] [--max-results 3]
+       python semantic.py --build
+
+Every row of a domain/stack CSV is embedded once per data version and stored
+in data/.index/<file>.vec: MAGIC | u32 header length | JSON header | padding |
+native float32 row-major matrix, memory-mapped at query time (as a NumPy array
+for large files when NumPy is installed, otherwise a plain memoryview). The file is keyed by the rows' fingerprint, the
+weighted search fields and the embedder, so it is recomputed only when one of
+them changes. Queries are scored brute force against the matrix; hybrid mode
+fuses the vector and BM25 rankings with reciprocal rank fusion.
+
+Embedders:
+  The default HashedEmbedder needs no model: analyzed words, their synonyms
+  (data/synonyms.csv, applied to rows as well as queries) and character
+  trigrams are hashed into a fixed-size signed vector, so "trustworthy" meets
+  "trust" and "calm" meets "serene". Set UIPRO_EMBED_MODEL to a local
+  sentence-transformers model directory to embed with that model instead
+  (nothing is downloaded; without the package the hashed embedder is used).
+"""
+
+import argparse
+import heapq
+import json
+import mmap
+import os
+import sys
+import threading
+import zlib
+from array import array
+from pathlib import Path
+
+from core import (CSV_CONFIG, STACK_CONFIG, AVAILABLE_STACKS, DATA_DIR, MAX_RESULTS, SYNONYM_WEIGHT, _STACK_COLS,
+                  _data_relpath, _index_path, _normalize_fields, count, default_analyzer, detect_domain, get_index,
+                  search_fields, span)
+
+# ============ CONFIGURATION ============
+VECTOR_VERSION = 1
+EMBED_DIM = 256            # HashedEmbedder dimensions
+CHAR_NGRAM = 3
+CHAR_NGRAM_WEIGHT = 0.25   # weight of each character n-gram relative to its word
+RRF_K = 60                 # reciprocal rank fusion constant: score = sum 1 / (RRF_K + rank)
+RRF_CANDIDATES = 50        # depth of each ranking fused in hybrid mode
+EMBED_MODEL = os.environ.get("UIPRO_EMBED_MODEL")
+MODES = ("hybrid", "semantic")
+# Below this many rows the pure-Python scorer beats the cost of importing NumPy
+NUMPY_MIN_ROWS = 2000
+
+_VECTOR_MAGIC = b"UUPMVEC\x00"
+_HEADER_LEN = 4
+_ALIGN = 16
+
+
+# ============ EMBEDDERS ============
+class HashedEmbedder:
+    """
+    Feature-hashing embedder over analyzed words, synonyms and character n-grams.
+
+    Each feature is hashed (CRC-32) to a dimension and a sign; vectors are
+    L2-normalized, so a dot product is the cosine similarity.
+    """
+
+    def __init__(self, dim: int = EMBED_DIM, analyzer=None):
+        self.dim = dim
+        self.analyzer = analyzer or default_analyzer()
+        synonyms = json.dumps(self.analyzer.synonyms, sort_keys=True).encode('utf-8')
+        self.name = f"hashed-{dim}-n{CHAR_NGRAM}-{self.analyzer.signature()}-syn{zlib.crc32(synonyms):08x}"
+        self._features = {}
+
+    def _token_features(self, token):
+        """(dimension, signed weight) pairs of one token: the word and its character n-grams"""
+        features = self._features.get(token)
+        if features is None:
+            padded = f"<{token}>"
+            grams = [padded[i:i + CHAR_NGRAM] for i in range(max(1, len(padded) - CHAR_NGRAM + 1))]
+            features = []
+            for feature, weight in [("w:" + token, 1.0)] + [("c:" + g, CHAR_NGRAM_WEIGHT) for g in grams]:
+                h = zlib.crc32(feature.encode('utf-8'))
+                features.append((h % self.dim, weight if (h // self.dim) & 1 else -weight))
+            self._features[token] = features
+        return features
+
+    def _vector(self, weighted_texts):
+        vec = [0.0] * self.dim
+        synonyms = self.analyzer.synonyms
+        for text, weight in weighted_texts:
+            for token in self.analyzer.analyze(text):
+                expansions = [(token, weight)] + [(s, weight * SYNONYM_WEIGHT) for s in synonyms.get(token, ())]
+                for term, term_weight in expansions:
+                    for dim, value in self._token_features(term):
+                        vec[dim] += value * term_weight
+        norm = sum(v * v for v in vec) ** 0.5
+        return [v / norm for v in vec] if norm else vec
+
+    def embed_documents(self, documents):
+        """Vectors for documents given as [(field text, field weight), ...]"""
+        return [self._vector(doc) for doc in documents]
+
+    def embed_query(self, query):
+        return self._vector([(query, 1.0)])
+
+
+class ModelEmbedder:
+    """A local sentence-transformers model (loaded from disk, never downloaded)."""
+
+    def __init__(self, path):
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(str(path), device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f"model-{Path(path).resolve().name}-{self.dim}"
+
+    def _encode(self, texts):
+        return self.model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).tolist()
+
+    def embed_documents(self, documents):
+        return self._encode(". ".join(text for text, _ in doc if text) for doc in documents)
+
+    def embed_query(self, query):
+        return self._encode([query])[0]
+
+
+_EMBEDDER = []
+
+
+def default_embedder():
+    """Process-wide embedder: the UIPRO_EMBED_MODEL model when it loads, else HashedEmbedder"""
+    if not _EMBEDDER:
+        embedder = None
+        if EMBED_MODEL:
+            try:
+                embedder = ModelEmbedder(EMBED_MODEL)
+            except (ImportError, OSError, ValueError):
+                embedder = None
+        _EMBEDDER.append(embedder or HashedEmbedder())
+    return _EMBEDDER[0]
+
+
+def set_default_embedder(embedder):
+    """Plug in a different embedder; loaded vector indexes are dropped"""
+    _EMBEDDER[:] = [embedder]
+    with _vector_lock:
+        _vector_registry.clear()
+
+
+# ============ VECTOR INDEX ============
+_NUMPY = []
+
+
+def _numpy():
+    """The numpy module, or None when it is not installed"""
+    if not _NUMPY:
+        try:
+            import numpy
+            _NUMPY.append(numpy)
+        except ImportError:
+            _NUMPY.append(None)
+    return _NUMPY[0]
+
+
+def _vector_path(filepath):
+    """Location of the embedding matrix for a CSV, next to its BM25 index"""
+    return _index_path(filepath).with_suffix(".vec")
+
+
+class VectorIndex:
+    """Memory-mapped float32 matrix with one L2-normalized row per document."""
+
+    def __init__(self, header, mm, offset):
+        self.header = header
+        self.count = header["count"]
+        self.dim = header["dim"]
+        self._mm = mm
+        np = _numpy() if self.count >= NUMPY_MIN_ROWS else None
+        if np is not None:
+            self.matrix = np.frombuffer(mm, dtype=np.float32, count=self.count * self.dim, offset=offset)
+            self.matrix = self.matrix.reshape(self.count, self.dim)
+        else:
+            self.matrix = memoryview(mm)[offset:offset + self.count * self.dim * 4].cast('f')
+
+    @classmethod
+    def open(cls, path, expected):
+        """Open a vector file whose header matches every key in expected, else None"""
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            if mm[:len(_VECTOR_MAGIC)] != _VECTOR_MAGIC:
+                raise ValueError("bad magic")
+            start = len(_VECTOR_MAGIC) + _HEADER_LEN
+            header_len = int.from_bytes(mm[len(_VECTOR_MAGIC):start], "little")
+            header = json.loads(mm[start:start + header_len])
+            offset = -(-(start + header_len) // _ALIGN) * _ALIGN
+            if any(header.get(key) != value for key, value in expected.items()) \
+                    or len(mm) < offset + header["count"] * header["dim"] * 4:
+                raise ValueError("stale vector file")
+            return cls(header, mm, offset)
+        except (ValueError, KeyError, TypeError):
+            mm.close()
+            return None
+
+    @staticmethod
+    def write(path, header, vectors):
+        """Atomically write header and vectors (a list of equal-length float lists)"""
+        header_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+        start = len(_VECTOR_MAGIC) + _HEADER_LEN
+        padding = -(start + len(header_bytes)) % _ALIGN
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_VECTOR_MAGIC)
+                f.write(len(header_bytes).to_bytes(_HEADER_LEN, "little"))
+                f.write(header_bytes)
+                f.write(b"\0" * padding)
+                for vec in vectors:
+                    array('f', vec).tofile(f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def top_k(self, query_vec, k, exclude=()):
+        """The k best (row, cosine) pairs with a positive score, best first"""
+        if k <= 0:
+            return []
+        if not isinstance(self.matrix, memoryview):
+            np = _numpy()
+            scores = self.matrix @ np.asarray(query_vec, dtype=np.float32)
+            if exclude:
+                scores[list(exclude)] = 0
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > k:
+                candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+            hits = zip(candidates.tolist(), scores[candidates].tolist())
+        else:
+            # Column-wise accumulation touches only the query's non-zero dimensions
+            totals = [0.0] * self.count
+            for d, weight in enumerate(query_vec):
+                if weight:
+                    for idx, value in enumerate(self.matrix[d::self.dim].tolist()):
+                        totals[idx] += value * weight
+            hits = ((idx, score) for idx, score in enumerate(totals) if score > 0 and idx not in exclude)
+        return heapq.nsmallest(k, hits, key=lambda x: (-x[1], x[0]))
+
+
+# ============ PROCESS-WIDE REGISTRY ============
+_vector_lock = threading.Lock()
+_vector_registry = {}
+
+
+def _documents(rows, fields):
+    """[(field text, weight), ...] for every row (empty for deleted rows)"""
+    columns = [col for col, _ in fields]
+    documents = []
+    for idx in range(len(rows)):
+        row = rows.row(idx, columns)
+        documents.append([(row[col], weight) for col, weight in fields if row.get(col)])
+    return documents
+
+
+def get_vectors(filepath, fields, embedder=None):
+    """
+    Return (rows, bm25, VectorIndex) for a CSV, embedding its rows only when
+    the cached matrix does not match the current rows, fields and embedder.
+    """
+    filepath = Path(filepath)
+    fields = _normalize_fields(fields)
+    embedder = embedder or default_embedder()
+    rows, bm25 = get_index(filepath, fields)
+    key = (str(filepath), fields, embedder.name)
+    with _vector_lock:
+        entry = _vector_registry.get(key)
+        if entry is not None and entry[0] is rows:
+            return rows, bm25, entry[1]
+
+        path = _vector_path(filepath)
+        expected = {
+            "version": VECTOR_VERSION,
+            "file": _data_relpath(filepath),
+            "fields": [list(f) for f in fields],
+            "embedder": embedder.name,
+            "rows": rows.fingerprint(),
+            "count": len(rows),
+            "byteorder": sys.byteorder  # the matrix is stored in native float32
+        }
+        with span("vectors.load", file=expected["file"]):
+            index = VectorIndex.open(path, expected)
+            count("vector_cache.hit" if index is not None else "vector_cache.miss")
+            if index is None:
+                with span("vectors.embed", rows=len(rows)):
+                    vectors = embedder.embed_documents(_documents(rows, fields))
+                VectorIndex.write(path, {**expected, "dim": embedder.dim}, vectors)
+                index = VectorIndex.open(path, expected)
+        if index is None:
+            raise OSError(f"Could not write vector index {path}")
+        _vector_registry[key] = (rows, index)
+        return rows, bm25, index
+
+
+def build_vectors() -> list:
+    """Embed every domain and stack CSV whose vector file is missing or stale"""
+    built = []
+    targets = [(cfg["file"], search_fields(cfg)) for cfg in CSV_CONFIG.values()]
+    targets += [(cfg["file"], search_fields(_STACK_COLS)) for cfg in STACK_CONFIG.values()]
+    for filename, fields in targets:
+        filepath = DATA_DIR / filename
+        if filepath.exists():
+            get_vectors(filepath, fields)
+            built.append(filename)
+    return built
+
+
+# ============ SEARCH ============
+def reciprocal_rank_fusion(rankings, k: int = RRF_K) -> list:
+    """Fuse ranked lists of document ids into (id, score) pairs, best first"""
+    scores = {}
+    for ranking in rankings:
+        for rank, idx in enumerate(ranking, 1):
+            scores[idx] = scores.get(idx, 0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+
+
+def _search_csv(filepath, fields, output_cols, query, max_results, mode):
+    """Vector (semantic) or fused (hybrid) search over one CSV"""
+    embedder = default_embedder()
+    rows, bm25, vectors = get_vectors(filepath, fields, embedder)
+    depth = max(max_results, RRF_CANDIDATES) if mode == "hybrid" else max_results
+    with span("vectors.embed_query"):
+        query_vec = embedder.embed_query(query)
+    with span("vectors.score"):
+        vector_ranked = vectors.top_k(query_vec, depth, exclude=bm25.deleted)
+    count("vectors_scored", vectors.count)
+    if mode == "semantic":
+        ranked = [(idx, round(score, 4)) for idx, score in vector_ranked]
+    else:
+        bm25_ranked = [idx for idx, score in bm25.top_k(query, depth) if score > 0]
+        with span("fuse"):
+            fused = reciprocal_rank_fusion([bm25_ranked, [idx for idx, _ in vector_ranked]])
+        ranked = [(idx, round(score, 6)) for idx, score in fused[:max_results]]
+    with span("materialize"):
+        return [{**rows.row(idx, output_cols), "_score": score} for idx, score in ranked]
+
+
+def search(query, domain=None, max_results=MAX_RESULTS, mode="hybrid"):
+    """core.search() with semantic or hybrid ranking; hits carry "_score" """
+    if domain is None:
+        domain = detect_domain(query)
+    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+    filepath = DATA_DIR / config["file"]
+    if not filepath.exists():
+        return {"error": f"File not found: {filepath}", "domain": domain}
+    with span("search", domain=domain, mode=mode):
+        results = _search_csv(filepath, search_fields(config), config["output_cols"], query, max_results, mode)
+    return {
+        "domain": domain,
+        "query": query,
+        "file": config["file"],
+        "mode": mode,
+        "count": len(results),
+        "results": results
+    }
+
+
+def search_stack(query, stack, max_results=MAX_RESULTS, mode="hybrid"):
+    """core.search_stack() with semantic or hybrid ranking"""
+    if stack not in STACK_CONFIG:
+        return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+    if not filepath.exists():
+        return {"error": f"Stack file not found: {filepath}", "stack": stack}
+    with span("search", stack=stack, mode=mode):
+        results = _search_csv(filepath, search_fields(_STACK_COLS), _STACK_COLS["output_cols"], query, max_results, mode)
+    return {
+        "domain": "stack",
+        "stack": stack,
+        "query": query,
+        "file": STACK_CONFIG[stack]["file"],
+        "mode": mode,
+        "count": len(results),
+        "results": results
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Semantic Search")
+    parser.add_argument("query", nargs="?", help="Search query")
+    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
+    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search")
+    parser.add_argument("--mode", "-m", choices=MODES, default="hybrid", help="Ranking (default: hybrid)")
+    parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
+    parser.add_argument("--build", action="store_true", help="Embed every domain and stack CSV, then exit")
+    args = parser.parse_args()
+
+    if args.build:
+        built = build_vectors()
+        print(f"Embedded {len(built)} files into data/.index/ ({default_embedder().name})")
+    elif args.query is None:
+        parser.error("the following arguments are required: query")
+    elif args.stack:
+        print(json.dumps(search_stack(args.query, args.stack, args.max_results, args.mode), indent=2, ensure_ascii=False))
+    else:
+        print(json.dumps(search(args.query, args.domain, args.max_results, args.mode), indent=2, ensure_ascii=False))
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - keeps every CSV index hot and serves JSON over localhost HTTP
+
+Usage: python server.py [--host 127.0.0.1] [--port 8765]
+
+Endpoints (JSON body in, JSON out):
+  GET  /health                   -> {"status": "ok", "pid": ..., "indexes": ...}
+  POST /search                   {"query", "domain"?, "max_results"?, "mode"?}
+  POST /search_stack             {"query", "stack", "max_results"?, "mode"?}
+  POST /search_all               {"query", "max_results"?, "domains"?, "per_domain"?}
+  POST /suggest                  {"query", "limit"?, "domains"?}   (typeahead)
+  POST /generate_design_system   {"query", "project_name"?, "output_format"?,
+                                  "persist"?, "page"?, "pages"?, "output_dir"?}
+
+POST requests must be application/json (so a web page cannot send one
+without a CORS preflight, which the daemon never answers) and carry the
+token the daemon writes to TOKEN_FILE at startup in an X-UIPro-Token header.
+
+Use client.py to talk to the daemon; it falls back to in-process execution
+when nothing is listening.
+"""
+
+import argparse
+import hmac
+import json
+import os
+import secrets
+import signal
+import sys
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core import CSV_CONFIG, STACK_CONFIG, DATA_DIR, MAX_RESULTS, _STACK_COLS, get_index, get_federated_index, search_fields, search, search_stack, search_all
+from design_system import generate_design_system
+from typeahead import DEFAULT_LIMIT, get_prefix_index, suggest
+import semantic
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.environ.get("UIPRO_DAEMON_PORT", "8765"))
+
+# Per-user file holding the current daemon's request token ({port} is filled in); readable by the owner only
+TOKEN_FILE = os.environ.get("UIPRO_DAEMON_TOKEN_FILE") or str(Path.home() / ".uipro-daemon-{port}.token")
+TOKEN_HEADER = "X-UIPro-Token"
+
+
+def token_path(port: int) -> Path:
+    return Path(TOKEN_FILE.format(port=port))
+
+
+def write_token(port: int) -> str:
+    """Create a fresh request token and store it in the port's token file (mode 0600)."""
+    token = secrets.token_urlsafe(32)
+    path = token_path(port)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+    return token
+
+
+def warm_indexes() -> int:
+    """Load every domain and stack index into the process-wide registry."""
+    loaded = 0
+    targets = [(cfg["file"], search_fields(cfg)) for cfg in CSV_CONFIG.values()]
+    targets += [(cfg["file"], search_fields(_STACK_COLS)) for cfg in STACK_CONFIG.values()]
+    for filename, fields in targets:
+        filepath = DATA_DIR / filename
+        if filepath.exists():
+            get_index(filepath, fields)
+            loaded += 1
+    get_federated_index()
+    get_prefix_index()
+    return loaded
+
+
+def _handle_search(params: dict):
+    mode = params.get("mode", "bm25")
+    if mode in semantic.MODES:
+        return semantic.search(params["query"], params.get("domain"), params.get("max_results", MAX_RESULTS), mode)
+    return search(params["query"], params.get("domain"), params.get("max_results", MAX_RESULTS))
+
+
+def _handle_search_stack(params: dict):
+    mode = params.get("mode", "bm25")
+    if mode in semantic.MODES:
+        return semantic.search_stack(params["query"], params["stack"], params.get("max_results", MAX_RESULTS), mode)
+    return search_stack(params["query"], params["stack"], params.get("max_results", MAX_RESULTS))
+
+
+def _handle_search_all(params: dict):
+    return search_all(params["query"], params.get("max_results", MAX_RESULTS), params.get("domains"), params.get("per_domain"))
+
+
+def _handle_suggest(params: dict):
+    return suggest(params["query"], params.get("limit", DEFAULT_LIMIT), params.get("domains"))
+
+
+def _handle_design_system(params: dict):
+    output = generate_design_system(
+        params["query"],
+        params.get("project_name"),
+        params.get("output_format", "ascii"),
+        persist=params.get("persist", False),
+        page=params.get("page"),
+        output_dir=params.get("output_dir"),
+        pages=params.get("pages")
+    )
+    return {"output": output}
+
+
+METHODS = {
+    "search": _handle_search,
+    "search_stack": _handle_search_stack,
+    "search_all": _handle_search_all,
+    "suggest": _handle_suggest,
+    "generate_design_system": _handle_design_system
+}
+
+
+class DaemonHandler(BaseHTTPRequestHandler):
+    """Routes /<method> requests to the in-memory search functions."""
+
+    server_version = "UIProMaxDaemon/1.0"
+    indexes_loaded = 0
+    token = None  # set by serve(); requests without it are refused
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/health":
+            self._send_json(200, {"status": "ok", "pid": os.getpid(), "indexes": self.indexes_loaded})
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        handler = METHODS.get(self.path.strip("/"))
+        if handler is None:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+            return
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type != "application/json":
+            self._send_json(415, {"error": "Content-Type must be application/json"})
+            return
+        if not self.token or not hmac.compare_digest(self.headers.get(TOKEN_HEADER, ""), self.token):
+            self._send_json(401, {"error": f"Missing or invalid {TOKEN_HEADER} header"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {"error": f"Invalid JSON body: {e}"})
+            return
+        try:
+            self._send_json(200, handler(params))
+        except KeyError as e:
+            self._send_json(400, {"error": f"Missing parameter: {e.args[0]}"})
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        # Keep stdout/stderr quiet; agents read the client output, not the daemon's
+        pass
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+    """Warm all indexes, then serve requests until interrupted."""
+    DaemonHandler.indexes_loaded = warm_indexes()
+    httpd = ThreadingHTTPServer((host, port), DaemonHandler)
+    httpd.daemon_threads = True
+    DaemonHandler.token = write_token(port)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))  # still remove the token file
+    print(f"UI Pro Max daemon on http://{host}:{port} ({DaemonHandler.indexes_loaded} indexes loaded)", file=sys.stderr)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        token_path(port).unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Search Daemon")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT}, or $UIPRO_DAEMON_PORT)")
+    args = parser.parse_args()
+    serve(args.host, args.port)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Typeahead - prefix and typo-tolerant suggestions for names in the knowledge base
+Usage: python typeahead.py "<partial>" [--limit 8] [--domain style]
+
+Suggests style names, font pairings and fonts, icon names and product types
+(the "suggest_cols" of CSV_CONFIG). Prefix matches come from a sorted array
+searched with bisect, so every word of a name can start a match ("oled" finds
+"Dark Mode (OLED)"). When there are too few prefix matches, a symmetric-delete
+index over name words corrects one typo per word (two for long words), e.g.
+"glasmorphism" -> "Glassmorphism".
+"""
+
+import argparse
+import bisect
+import json
+import re
+import threading
+from collections import defaultdict
+
+from core import CSV_CONFIG, DATA_DIR, get_index, search_fields
+
+DEFAULT_LIMIT = 8
+MIN_FUZZY_LENGTH = 3   # shorter inputs only get prefix matches
+LONG_WORD = 7          # words at least this long may be corrected by two edits
+
+_NORMALIZE = re.compile(r"[^\w]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace into single spaces."""
+    return _NORMALIZE.sub(" ", str(text).lower()).strip()
+
+
+def _edit_distance(a: str, b: str, max_dist: int) -> int:
+    """Optimal string alignment distance, or max_dist + 1 once it is exceeded."""
+    if abs(len(a) - len(b)) > max_dist:
+        return max_dist + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+            row_min = min(row_min, cur[j])
+        if row_min > max_dist:
+            return max_dist + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def _prefix_distance(partial: str, word: str, max_dist: int) -> int:
+    """Distance from partial to the closest prefix of word."""
+    best = max_dist + 1
+    for length in range(max(1, len(partial) - max_dist), min(len(word), len(partial) + max_dist) + 1):
+        best = min(best, _edit_distance(partial, word[:length], max_dist))
+    return best
+
+
+def _deletes(word: str) -> set:
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over names, with a delete-neighbourhood typo index."""
+
+    def __init__(self, entries: list):
+        """entries: (name, domain, column) tuples."""
+        self.names = []
+        keyed = []
+        words = set()
+        unique = set()
+        for name, domain, column in entries:
+            norm = normalize(name)
+            if not norm or (name, domain) in unique:
+                continue
+            unique.add((name, domain))
+            entry_id = len(self.names)
+            self.names.append((name, domain, column))
+            parts = norm.split()
+            words.update(parts)
+            for pos in range(len(parts)):
+                keyed.append((" ".join(parts[pos:]), pos, entry_id))
+        keyed.sort()
+        self.keys = [k for k, _, _ in keyed]
+        self.refs = [(pos, entry_id) for _, pos, entry_id in keyed]
+
+        # Symmetric deletes of every word prefix (length >= MIN_FUZZY_LENGTH):
+        # a one-edit typo in the input shares a delete with the intended prefix.
+        self.words = sorted(words)
+        self.deletes = defaultdict(set)
+        for word in self.words:
+            for length in range(MIN_FUZZY_LENGTH, len(word) + 1):
+                prefix = word[:length]
+                self.deletes[prefix].add(word)
+                for variant in _deletes(prefix):
+                    self.deletes[variant].add(word)
+        self.words_by_initial = defaultdict(list)
+        for word in self.words:
+            self.words_by_initial[word[0]].append(word)
+
+    def _prefix_matches(self, norm: str, domains) -> dict:
+        """entry_id -> word position of the earliest word that starts a match."""
+        matches = {}
+        i = bisect.bisect_left(self.keys, norm)
+        while i < len(self.keys) and self.keys[i].startswith(norm):
+            pos, entry_id = self.refs[i]
+            if domains is None or self.names[entry_id][1] in domains:
+                if pos < matches.get(entry_id, len(self.keys)):
+                    matches[entry_id] = pos
+            i += 1
+        return matches
+
+    def _corrections(self, word: str, as_prefix: bool) -> list:
+        """(distance, word) candidates for one typed word, best first."""
+        candidates = set()
+        for variant in _deletes(word) | {word}:
+            candidates |= self.deletes.get(variant, set())
+        scored = []
+        for cand in candidates:
+            d = _prefix_distance(word, cand, 1) if as_prefix else _edit_distance(word, cand, 1)
+            if d <= 1:
+                scored.append((d, cand))
+        if not scored and len(word) >= LONG_WORD:
+            for cand in self.words_by_initial.get(word[0], ()):
+                d = _prefix_distance(word, cand, 2) if as_prefix else _edit_distance(word, cand, 2)
+                if d <= 2:
+                    scored.append((d, cand))
+        scored.sort(key=lambda x: (x[0], len(x[1]), x[1]))
+        return scored[:3]
+
+    def suggest(self, partial: str, limit: int = DEFAULT_LIMIT, domains=None) -> list:
+        """Best names for a partial input: exact prefixes first, then typo corrections."""
+        norm = normalize(partial)
+        if not norm or limit <= 0:
+            return []
+        domains = set(domains) if domains else None
+
+        # entry_id -> (edit distance, position of the matching word in the name)
+        ranked = {entry_id: (0, pos) for entry_id, pos in self._prefix_matches(norm, domains).items()}
+
+        if len(ranked) < limit and len(norm.replace(" ", "")) >= MIN_FUZZY_LENGTH:
+            words = norm.split()
+            options = [[(0, w)] if len(w) < MIN_FUZZY_LENGTH else self._corrections(w, i == len(words) - 1)
+                       for i, w in enumerate(words)]
+            combos = [(0, [])]
+            for opts in options:
+                combos = [(d + od, ws + [ow]) for d, ws in combos for od, ow in opts][:9]
+            for distance, corrected in combos:
+                if distance == 0:
+                    continue
+                for entry_id, pos in self._prefix_matches(" ".join(corrected), domains).items():
+                    if entry_id not in ranked or (distance, pos) < ranked[entry_id]:
+                        ranked[entry_id] = (distance, pos)
+
+        order = sorted(ranked.items(), key=lambda x: (x[1][0], x[1][1], len(self.names[x[0]][0]), self.names[x[0]][0]))
+        results = []
+        seen = set()
+        for entry_id, (distance, _) in order:
+            name, domain, column = self.names[entry_id]
+            if (name, domain) in seen:
+                continue
+            seen.add((name, domain))
+            results.append({"text": name, "domain": domain, "column": column, "distance": distance})
+            if len(results) >= limit:
+                break
+        return results
+
+
+_index_lock = threading.Lock()
+_prefix_index = []
+
+
+def _suggest_sources() -> list:
+    """(domain, suggest columns, rows) for every domain that declares suggest_cols."""
+    sources = []
+    for domain, config in CSV_CONFIG.items():
+        columns = config.get("suggest_cols")
+        filepath = DATA_DIR / config["file"]
+        if columns and filepath.exists():
+            rows, _ = get_index(filepath, search_fields(config))
+            sources.append((domain, columns, rows))
+    return sources
+
+
+def get_prefix_index() -> PrefixIndex:
+    """Process-wide PrefixIndex, rebuilt when any underlying CSV is reloaded."""
+    sources = _suggest_sources()
+    row_lists = [rows for _, _, rows in sources]
+    with _index_lock:
+        if _prefix_index and len(_prefix_index[1]) == len(row_lists) \
+                and all(a is b for a, b in zip(_prefix_index[1], row_lists)):
+            return _prefix_index[0]
+        entries = [(value, domain, column)
+                   for domain, columns, rows in sources
+                   for column in columns for value in rows.column(column) if value]
+        _prefix_index[:] = [PrefixIndex(entries), row_lists]
+        return _prefix_index[0]
+
+
+def suggest(partial: str, limit: int = DEFAULT_LIMIT, domains=None) -> dict:
+    """Autocomplete names from the knowledge base."""
+    results = get_prefix_index().suggest(partial, limit, domains)
+    return {"query": partial, "count": len(results), "results": results}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Typeahead")
+    parser.add_argument("partial", help="Partial input")
+    parser.add_argument("--limit", "-n", type=int, default=DEFAULT_LIMIT, help=f"Max suggestions (default: {DEFAULT_LIMIT})")
+    parser.add_argument("--domain", "-d", action="append", choices=[d for d, c in CSV_CONFIG.items() if c.get("suggest_cols")],
+                        help="Restrict to a domain (repeatable)")
+    args = parser.parse_args()
+    print(json.dumps(suggest(args.partial, args.limit, args.domain), indent=2, ensure_ascii=False))
@@ -0,0 +1,21 @@
+"""
+Test setup: the scripts run against a private copy of data/, so tests can
+edit CSVs and build indexes without touching the shipped data.
+UIPRO_DATA_DIR must be set before core is first imported.
+"""
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_DATA_COPY = Path(tempfile.mkdtemp(prefix="uipro-data-")) / "data"
+shutil.copytree(ROOT / "data", _DATA_COPY, ignore=shutil.ignore_patterns(".index"))
+atexit.register(shutil.rmtree, _DATA_COPY.parent, True)
+
+os.environ["UIPRO_DATA_DIR"] = str(_DATA_COPY)
+sys.path.insert(0, str(ROOT / "scripts"))
@@ -0,0 +1,70 @@
+"""Incremental index updates: delta segment replay and compaction (core INCREMENTAL UPDATES)."""
+
+import shutil
+import uuid
+
+import pytest
+
+import core
+from core import CSV_CONFIG, DATA_DIR, load_index, search_fields, update_rows
+
+FIELDS = core._normalize_fields(search_fields(CSV_CONFIG["style"]))
+ID_COL = CSV_CONFIG["style"]["id_col"]
+QUERIES = ["minimalism clean", "glassmorphism blur", "dark mode neon", "brutalism bold", "zyxquartz"]
+
+
+@pytest.fixture
+def csv_path():
+    path = DATA_DIR / f"incremental-{uuid.uuid4().hex}.csv"
+    shutil.copy(DATA_DIR / CSV_CONFIG["style"]["file"], path)
+    yield path
+    index_path = core._index_path(path)
+    for p in (path, index_path, core._delta_path(index_path)):
+        p.unlink(missing_ok=True)
+
+
+def ranked_ids(rows, bm25, query, k=10):
+    return [(rows[idx][ID_COL], score) for idx, score in bm25.top_k(query, k)]
+
+
+def test_appended_row_is_searchable_from_the_delta(csv_path):
+    load_index(csv_path, FIELDS, id_col=ID_COL)
+    update_rows(csv_path, upserts=[{ID_COL: "9001", "Style Category": "Zyxquartz Lattice", "Keywords": "zyxquartz, crystalline"}],
+                id_col=ID_COL)
+
+    rows, bm25 = load_index(csv_path, FIELDS, id_col=ID_COL)
+
+    assert core._delta_path(core._index_path(csv_path)).exists()
+    assert ranked_ids(rows, bm25, "zyxquartz")[0][0] == "9001"
+
+
+def test_updates_and_deletes_apply_from_the_delta(csv_path):
+    rows, bm25 = load_index(csv_path, FIELDS, id_col=ID_COL)
+    first_id, second_id = rows[0][ID_COL], rows[1][ID_COL]
+    second_name = rows[1]["Style Category"]
+    assert second_id in [key for key, _ in ranked_ids(rows, bm25, second_name)]
+    update_rows(csv_path, upserts=[{ID_COL: first_id, "Keywords": "zyxquartz"}], deletes=[second_id], id_col=ID_COL)
+
+    rows, bm25 = load_index(csv_path, FIELDS, id_col=ID_COL)
+
+    assert ranked_ids(rows, bm25, "zyxquartz")[0][0] == first_id
+    assert second_id not in [key for key, _ in ranked_ids(rows, bm25, second_name)]
+
+
+def test_scores_after_compaction_match_a_full_rebuild(csv_path):
+    load_index(csv_path, FIELDS, id_col=ID_COL)
+    rows = core._load_csv(csv_path)
+    update_rows(csv_path, upserts=[{ID_COL: "9001", "Style Category": "Zyxquartz Lattice", "Keywords": "zyxquartz, glassmorphism"},
+                                   {ID_COL: rows[3][ID_COL], "Keywords": "neon, dark mode, zyxquartz"}],
+                deletes=[rows[5][ID_COL]], id_col=ID_COL)
+    load_index(csv_path, FIELDS, id_col=ID_COL)  # applies the change through the delta segment
+
+    core._merge_index(csv_path, FIELDS)
+    assert not core._delta_path(core._index_path(csv_path)).exists()
+    merged_rows, merged = load_index(csv_path, FIELDS, id_col=ID_COL)
+    full_rows, full = load_index(csv_path, FIELDS, use_cache=False)
+
+    for query in QUERIES:
+        got, want = ranked_ids(merged_rows, merged, query), ranked_ids(full_rows, full, query)
+        assert [key for key, _ in got] == [key for key, _ in want]
+        assert [score for _, score in got] == pytest.approx([score for _, score in want], rel=1e-9)
@@ -0,0 +1,40 @@
+"""ResultCache: entries are keyed by the SHA-256 of every data CSV."""
+
+import os
+
+import core
+import design_system
+from design_system import DATA_DIR, DesignSystemGenerator, ResultCache
+
+
+def test_fingerprint_uses_file_sha256(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    cache.lookup("saas dashboard")
+    with cache._connect() as conn:
+        rows = dict(conn.execute("SELECT path, sha256 FROM files"))
+    assert rows
+    for rel, sha in rows.items():
+        assert sha == core._file_hash(DATA_DIR / rel)
+
+
+def test_editing_a_csv_invalidates_cached_results(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    generator = DesignSystemGenerator(cache=cache)
+    generator.generate("fintech banking dashboard")
+    key, data_hash, stored = cache.lookup("fintech banking dashboard")
+    assert stored is not None
+
+    csv_path = DATA_DIR / "colors.csv"
+    original = csv_path.read_bytes()
+    stat = csv_path.stat()
+    try:
+        csv_path.write_bytes(original.replace(b",", b", ", 1))
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        new_key, new_hash, stale = cache.lookup("fintech banking dashboard")
+        assert new_key == key
+        assert new_hash != data_hash
+        assert stale is None
+    finally:
+        csv_path.write_bytes(original)
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        design_system._DATA_HASH_MEMO.clear()
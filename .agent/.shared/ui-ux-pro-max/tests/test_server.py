@@ -0,0 +1,66 @@
+"""Daemon request checks: JSON content type, token, and safe output names."""
+
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import server
+from design_system import page_slug, persist_design_system
+
+
+@pytest.fixture
+def daemon():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), server.DaemonHandler)
+    server.DaemonHandler.token = "secret-token"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+    server.DaemonHandler.token = None
+
+
+def post(port, path, body, headers):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    conn.request("POST", path, body=json.dumps(body), headers=headers)
+    response = conn.getresponse()
+    payload = json.loads(response.read() or b"{}")
+    conn.close()
+    return response.status, payload
+
+
+def test_rejects_non_json_content_type(daemon):
+    status, _ = post(daemon, "/suggest", {"query": "das"}, {"Content-Type": "text/plain", server.TOKEN_HEADER: "secret-token"})
+    assert status == 415
+
+
+def test_rejects_missing_or_wrong_token(daemon):
+    assert post(daemon, "/suggest", {"query": "das"}, {"Content-Type": "application/json"})[0] == 401
+    assert post(daemon, "/suggest", {"query": "das"}, {"Content-Type": "application/json", server.TOKEN_HEADER: "nope"})[0] == 401
+
+
+def test_accepts_json_with_token(daemon):
+    status, payload = post(daemon, "/suggest", {"query": "das"},
+                           {"Content-Type": "application/json; charset=utf-8", server.TOKEN_HEADER: "secret-token"})
+    assert status == 200
+    assert "error" not in payload
+
+
+def test_rejects_path_traversal_in_names(daemon, tmp_path):
+    headers = {"Content-Type": "application/json", server.TOKEN_HEADER: "secret-token"}
+    for params in ({"project_name": "../evil"}, {"page": "../../evil"}, {"pages": ["ok", "a/b"]}):
+        status, payload = post(daemon, "/generate_design_system",
+                               {"query": "saas dashboard", "persist": True, "output_dir": str(tmp_path), **params}, headers)
+        assert status == 400, payload
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("name", ["..", "../x", "a/b", "a\\b"])
+def test_slug_rejects_unsafe_names(name, tmp_path):
+    with pytest.raises(ValueError):
+        page_slug(name)
+    with pytest.raises(ValueError):
+        persist_design_system({"project_name": name}, output_dir=str(tmp_path))
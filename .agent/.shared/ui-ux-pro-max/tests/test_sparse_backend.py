@@ -0,0 +1,41 @@
+"""SparseBM25 (NumPy/SciPy backend) ranks exactly like the pure-Python BM25."""
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from core import BM25, CSV_CONFIG, DATA_DIR, SparseBM25, load_index, search_fields
+
+QUERIES = ["minimalism clean white", "glassmorphism blur", "dark mode neon", "saas dashboard", "healthcare calm trust",
+           "e-commerce luxury", "fintech crypto", "accessibility contrast", "animation hover", "form validation error",
+           "playful kids", "zzz-no-match", "dark dark dark"]
+
+
+def assert_same_ranking(bm25, queries, k):
+    expected = [bm25.top_k(query, k) for query in queries]
+    actual = SparseBM25(bm25).top_k_batch(queries, k)
+    for query, want, got in zip(queries, expected, actual):
+        assert [idx for idx, _ in got] == [idx for idx, _ in want], query
+        assert [score for _, score in got] == pytest.approx([score for _, score in want], rel=1e-9, abs=1e-12), query
+
+
+@pytest.mark.parametrize("domain", ["style", "product", "color", "ux", "typography"])
+@pytest.mark.parametrize("k", [1, 5, 20])
+def test_data_csvs(domain, k):
+    config = CSV_CONFIG[domain]
+    _, bm25 = load_index(DATA_DIR / config["file"], search_fields(config), use_cache=False)
+    assert_same_ranking(bm25, QUERIES, k)
+
+
+def test_tie_heavy_corpus():
+    # Few distinct words, so many documents tie and the k-th score boundary matters
+    rng = random.Random(7)
+    words = ["alpha", "beta", "gamma", "delta", "omega"]
+    documents = [[" ".join(rng.choices(words, k=rng.randint(1, 4))), rng.choice(words)] for _ in range(3000)]
+    bm25 = BM25()
+    bm25.fit(documents, field_weights=[2.0, 1.0])
+    queries = [" ".join(rng.choices(words, k=rng.randint(1, 3))) for _ in range(40)]
+    assert_same_ranking(bm25, queries, 10)
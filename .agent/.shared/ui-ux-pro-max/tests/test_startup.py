@@ -0,0 +1,14 @@
+"""Import-time budget of the plain search path (benchmark.py startup)."""
+
+import os
+
+from benchmark import STARTUP_BUDGET_MS, check_startup
+
+# Headroom over STARTUP_BUDGET_MS for slow or noisy CI machines
+STARTUP_MARGIN = float(os.environ.get("UIPRO_STARTUP_MARGIN", "1.5"))
+
+
+def test_plain_search_stays_within_import_budget():
+    result = check_startup(budget_ms=STARTUP_BUDGET_MS * STARTUP_MARGIN)
+    assert not result["forbidden"], f"imported on the plain-search path: {result['forbidden']}"
+    assert result["ok"], f"imports took {result['import_ms']}ms (budget {result['budget_ms']}ms): {result['heaviest']}"
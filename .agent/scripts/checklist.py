@@ -9,6 +9,21 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --jobs 1           # One check at a time
+    python scripts/checklist.py . --runner fork      # Checks in a process pool
+    python scripts/checklist.py . --incremental      # Re-audit changed files only
+
+Checks form a dependency graph (see CORE_CHECKS): a check starts as soon as
+the checks it depends on have finished and a worker is free (--jobs, default
+one per CPU core), and results are printed as each check finishes. A failed
+required check skips its dependents and stops new checks from starting; the
+checklist then exits with a failure as before.
+
+Check scripts that define run_check() are imported and called in-process
+(--runner inprocess, the default) or in a forked process pool (--runner fork),
+returning their result dicts directly; --runner subprocess launches
+`python <script> <project>` per check (see .agent/.shared/check_runner.py).
+Every check, whatever the runner, is reported as a timeout after CHECK_TIMEOUT.
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -20,12 +35,20 @@ Priority Order:
     P6: Performance (lighthouse - requires URL)
 """
 
+import os
 import sys
+import time
 import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+SHARED_DIR = Path(__file__).resolve().parent.parent / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from check_runner import CHECK_ENTRY_POINT, DEFAULT_RUNNER, RUNNERS, CheckPool, exit_run, load_plugin, run_plugin, share_inventory
+from file_inventory import INCREMENTAL_ENV
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -54,37 +77,60 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
-# Define priority-ordered checks
+CHECK_TIMEOUT = 300  # seconds per check
+DEFAULT_JOBS = os.cpu_count() or 1
+
+# Define priority-ordered checks: (name, script, required, depends_on).
+# A check waits for the checks named in depends_on; when one of those is
+# required and fails, the check is skipped.
 CORE_CHECKS = [
-    ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
-    ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True),
-    ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False),
-    ("Test Runner", ".agent/skills/testing-patterns/scripts/test_runner.py", False),
-    ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False),
-    ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
+    ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True, []),
+    ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True, []),
+    ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False, []),
+    ("Test Runner", ".agent/skills/testing-patterns/scripts/test_runner.py", False, ["Lint Check"]),
+    ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False, []),
+    ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False, []),
 ]
 
 PERFORMANCE_CHECKS = [
-    ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
-    ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
+    ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True, []),
+    ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False, []),
 ]
 
+# Checks sharing a resource class run one at a time, in priority order. Unlike
+# depends_on this never skips a check: Playwright still runs after a failed
+# Lighthouse, just not beside it (a second browser would skew its measurements)
+RESOURCE_CLASSES = {
+    "Lighthouse Audit": "browser",
+    "Playwright E2E": "browser",
+}
+
 def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               runner: str = DEFAULT_RUNNER) -> dict:
     """
-    Run a validation script and capture results
+    Run a validation script and capture results (prints nothing, so it can
+    run on a worker thread or process; see print_result)
     
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, error, skipped, duration
+        (plus report, the script's own result dict, when run in-process)
     """
     if not check_script_exists(script_path):
-        print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "output": "", "skipped": True}
+        return {"name": name, "passed": True, "output": "", "skipped": True, "reason": "Script not found", "duration": 0.0}
     
-    print_step(f"Running: {name}")
+    start = time.perf_counter()
+    if runner != "subprocess":
+        try:
+            entry_point = load_plugin(script_path)
+        except (Exception, SystemExit) as e:
+            return {"name": name, "passed": False, "output": "", "error": f"Import failed: {type(e).__name__}: {e}",
+                    "skipped": False, "duration": time.perf_counter() - start}
+        if entry_point is not None:
+            return run_plugin(name, entry_point, project_path, url, start)
     
     # Build command
     cmd = ["python", str(script_path), project_path]
@@ -97,33 +143,132 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
             cmd,
             capture_output=True,
             text=True,
-            timeout=300  # 5 minute timeout
+            timeout=CHECK_TIMEOUT
         )
         
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED")
-        else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
-        
         return {
             "name": name,
-            "passed": passed,
+            "passed": result.returncode == 0,
             "output": result.stdout,
             "error": result.stderr,
-            "skipped": False
+            "skipped": False,
+            "duration": time.perf_counter() - start
         }
     
     except subprocess.TimeoutExpired:
-        print_error(f"{name}: TIMEOUT (>5 minutes)")
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
+        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False,
+                "duration": time.perf_counter() - start}
     
     except Exception as e:
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
+        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False,
+                "duration": time.perf_counter() - start}
+
+def print_result(result: dict):
+    """Print the outcome of one finished check"""
+    name = result["name"]
+    if result.get("skipped"):
+        print_warning(f"{name}: {result.get('reason', 'Skipped')}, skipping")
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({result['duration']:.1f}s)")
+    elif result.get("error") == "Timeout":
+        print_error(f"{name}: TIMEOUT (>{CHECK_TIMEOUT // 60} minutes)")
+    else:
+        print_error(f"{name}: FAILED ({result['duration']:.1f}s)")
+        if result.get("error"):
+            print(f"  Error: {result['error'][:200]}")
+
+def run_checks(checks: list, project_path: Path, url: Optional[str] = None, jobs: int = DEFAULT_JOBS,
+               stop_on_critical: bool = True, runner: str = DEFAULT_RUNNER) -> Tuple[List[dict], Optional[str]]:
+    """
+    Run checks as a dependency DAG on up to `jobs` concurrent workers.
+    
+    A check is started (in priority order) once all of its dependencies have
+    finished and no other check of its RESOURCE_CLASSES class is running;
+    results are printed as checks complete. A failed required check
+    skips its dependents and, with stop_on_critical, stops any further check
+    from starting (checks already running are allowed to finish).
+    
+    Returns:
+        (results in priority order, name of the failed required check or None)
+    """
+    known = {check[0] for check in checks}
+    order = {check[0]: i for i, check in enumerate(checks)}
+    required = {check[0] for check in checks if check[2]}
+    pending = list(checks)
+    running = {}
+    done = {}
+    busy = set()
+    critical = None
+    
+    def gating_failure(depends_on):
+        for dep in depends_on:
+            result = done.get(dep)
+            if dep in required and result and not result["passed"] and not result.get("skipped"):
+                return dep
+        return None
+    
+    if runner == "fork":
+        share_inventory(project_path)
+    
+    with CheckPool(runner, max(1, jobs), CHECK_TIMEOUT) as pool:
+        while pending or running:
+            # Start (or skip) every check whose dependencies are settled
+            progressed = critical is None
+            while progressed:
+                progressed = False
+                for check in pending:
+                    name, script_path, _, depends_on = check
+                    deps = [dep for dep in depends_on if dep in known]
+                    if any(dep not in done for dep in deps):
+                        continue
+                    failed_dep = gating_failure(deps)
+                    if failed_dep:
+                        done[name] = {"name": name, "passed": True, "output": "", "skipped": True,
+                                      "reason": f"{failed_dep} failed", "duration": 0.0}
+                        print_result(done[name])
+                    elif len(running) < max(1, jobs) and RESOURCE_CLASSES.get(name) not in busy:
+                        if check_script_exists(project_path / script_path):
+                            print_step(f"Running: {name}")
+                        running[pool.submit(run_script, name, project_path / script_path, str(project_path), url, runner)] = check
+                        if name in RESOURCE_CLASSES:
+                            busy.add(RESOURCE_CLASSES[name])
+                    else:
+                        continue
+                    pending.remove(check)
+                    progressed = True
+                    break
+            
+            if not running:
+                break  # stopped on a critical failure, or nothing left that can start
+            
+            finished, timed_out = pool.wait(running)
+            for future in sorted(finished | timed_out, key=lambda f: order[running[f][0]]):
+                name, _, is_required, _ = running.pop(future)
+                busy.discard(RESOURCE_CLASSES.get(name))
+                if future in timed_out:
+                    result = {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False,
+                              "duration": float(CHECK_TIMEOUT)}
+                else:
+                    result = future.result()
+                done[name] = result
+                print_result(result)
+                if stop_on_critical and is_required and not result["passed"] and not result.get("skipped"):
+                    critical = critical or name
+    
+    # Checks that never started: dependents of a failed required check, then
+    # whatever a critical failure kept from starting, then unmet dependencies
+    for name, _, _, depends_on in pending:
+        failed_dep = gating_failure([dep for dep in depends_on if dep in known])
+        if failed_dep:
+            reason = f"{failed_dep} failed"
+        elif critical is not None:
+            reason = f"Stopped after {critical} failed"
+        else:
+            reason = "Unmet dependencies"
+        done[name] = {"name": name, "passed": True, "output": "", "skipped": True, "reason": reason, "duration": 0.0}
+        print_result(done[name])
+    
+    return sorted(done.values(), key=lambda r: order[r["name"]]), critical
 
 def print_summary(results: List[dict]):
     """Print final summary report"""
@@ -172,6 +317,9 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--runner", choices=RUNNERS, default=DEFAULT_RUNNER, help=f"How checks run (default: {DEFAULT_RUNNER}; see CHECK_ENTRY_POINT)")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Checks run at the same time (default: {DEFAULT_JOBS}, one per CPU core)")
+    parser.add_argument("--incremental", action="store_true", help="Re-audit only files changed since the last incremental run (cache: <project>/.agent/cache)")
     
     args = parser.parse_args()
     
@@ -184,34 +332,33 @@ Examples:
     print_header("🚀 ANTIGRAVITY KIT - MASTER CHECKLIST")
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
+    if args.incremental:
+        os.environ[INCREMENTAL_ENV] = "1"
+        print("Mode: incremental (unchanged files reuse cached findings)")
     
     results = []
     
     # Run core checks
     print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
-        script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
-        
-        # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
-            sys.exit(1)
+    core_results, critical = run_checks(CORE_CHECKS, project_path, jobs=args.jobs, runner=args.runner)
+    results.extend(core_results)
+    
+    # If required check fails, stop
+    if critical:
+        print_error(f"CRITICAL: {critical} failed. Stopping checklist.")
+        print_summary(results)
+        exit_run(1)
     
     # Run performance checks if URL provided
     if args.url and not args.skip_performance:
         print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            results.append(result)
+        perf_results, _ = run_checks(PERFORMANCE_CHECKS, project_path, args.url, jobs=args.jobs, stop_on_critical=False, runner=args.runner)
+        results.extend(perf_results)
     
     # Print summary
     all_passed = print_summary(results)
     
-    sys.exit(0 if all_passed else 1)
+    exit_run(0 if all_passed else 1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,60 @@
+"""checklist.run_checks: skipped checks are still reported."""
+
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+spec = importlib.util.spec_from_file_location("checklist", SCRIPTS_DIR / "checklist.py")
+checklist = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(checklist)
+
+
+def make_check(project: Path, script: str, passed: bool):
+    path = project / script
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"def run_check(project_path, url=None):\n    return {{'passed': {passed}}}\n", encoding="utf-8")
+
+
+def test_failed_lint_reports_dependent_tests_as_skipped(tmp_path):
+    scripts = {name: script for name, script, _, _ in checklist.CORE_CHECKS}
+    make_check(tmp_path, scripts["Security Scan"], True)
+    make_check(tmp_path, scripts["Lint Check"], False)
+    make_check(tmp_path, scripts["Test Runner"], True)
+
+    results, critical = checklist.run_checks(checklist.CORE_CHECKS, tmp_path, jobs=1, runner="inprocess")
+
+    assert critical == "Lint Check"
+    by_name = {r["name"]: r for r in results}
+    assert set(by_name) == {name for name, _, _, _ in checklist.CORE_CHECKS}
+    assert not by_name["Lint Check"]["passed"]
+    assert by_name["Test Runner"]["skipped"]
+    assert by_name["Test Runner"]["reason"] == "Lint Check failed"
+
+
+def make_timed_check(project: Path, script: str, passed: bool, seconds: float = 0.2):
+    path = project / script
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "import time\n\n"
+        "def run_check(project_path, url=None):\n"
+        "    start = time.perf_counter()\n"
+        f"    time.sleep({seconds})\n"
+        f"    return {{'passed': {passed}, 'start': start, 'end': time.perf_counter()}}\n",
+        encoding="utf-8")
+
+
+def test_playwright_still_runs_after_lighthouse_fails(tmp_path):
+    scripts = {name: script for name, script, _, _ in checklist.PERFORMANCE_CHECKS}
+    make_timed_check(tmp_path, scripts["Lighthouse Audit"], False)
+    make_timed_check(tmp_path, scripts["Playwright E2E"], True)
+
+    results, critical = checklist.run_checks(checklist.PERFORMANCE_CHECKS, tmp_path, "http://localhost:3000",
+                                             jobs=2, stop_on_critical=False, runner="inprocess")
+
+    assert critical is None
+    lighthouse, playwright = results
+    assert not lighthouse["passed"]
+    assert playwright["passed"] and not playwright.get("skipped")
+    # One browser at a time: Playwright starts only once Lighthouse is done
+    assert playwright["report"]["start"] >= lighthouse["report"]["end"]
@@ -0,0 +1,175 @@
+"""file_inventory.FindingsCache: incremental runs re-audit exactly the files (and tree-wide inputs) that changed."""
+
+import importlib.util
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(AGENT_DIR / ".shared"))
+
+import file_inventory  # noqa: E402
+
+spec = importlib.util.spec_from_file_location("lint_runner", AGENT_DIR / "skills/lint-and-validate/scripts/lint_runner.py")
+lint_runner = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lint_runner)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+FILES = {"a.html": "<h1>A</h1>\n", "b.html": "<h1>B</h1>\n", "c.html": "<h1>C</h1>\n"}
+
+
+def git(root: Path, *args: str):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=str(root), check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv(file_inventory.INCREMENTAL_ENV, "1")
+    for rel, text in FILES.items():
+        (tmp_path / rel).write_text(text, encoding="utf-8")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def new_run(root: Path):
+    """A fresh inventory with nothing read yet, as in a new checklist process."""
+    file_inventory._CONTENTS.clear()
+    return file_inventory.get_inventory(root, refresh=True)
+
+
+def audit(inventory, version: str = "v1") -> list:
+    """Run a per-file checker over the HTML files; returns the files it actually audited."""
+    audited = []
+
+    def compute(entry):
+        audited.append(entry.rel)
+        return {"length": len(file_inventory.read_text(entry))}
+
+    for entry in inventory.files(".html"):
+        inventory.findings("test_checker", version, entry, compute)
+    return sorted(audited)
+
+
+def test_unchanged_files_are_neither_read_nor_audited(project):
+    assert audit(new_run(project)) == ["a.html", "b.html", "c.html"]
+
+    inventory = new_run(project)
+    assert audit(inventory) == []
+    assert file_inventory.read_stats()["reads"] == 0  # (mtime, size) matched: no re-hash
+    assert inventory.stats()["reused"] == 3
+
+
+def test_only_the_edited_file_is_re_audited(project):
+    audit(new_run(project))
+    (project / "b.html").write_text("<h1>B, edited</h1>\n", encoding="utf-8")
+
+    assert audit(new_run(project)) == ["b.html"]
+
+
+def test_git_catches_an_edit_that_keeps_mtime_and_size(project):
+    audit(new_run(project))
+    path = project / "a.html"
+    stat = path.stat()
+    path.write_text("<h1>Z</h1>\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert (path.stat().st_size, path.stat().st_mtime) == (stat.st_size, stat.st_mtime)
+
+    assert audit(new_run(project)) == ["a.html"]
+
+
+def test_new_checker_version_misses_everything(project):
+    audit(new_run(project), version="v1")
+
+    assert audit(new_run(project), version="v2") == ["a.html", "b.html", "c.html"]
+
+
+def test_findings_come_back_in_stored_form(project):
+    inventory = new_run(project)
+    entry = inventory.named("a.html")[0]
+
+    miss = inventory.findings("stored_form", "v1", entry, lambda e: {"lines": (1, 2)})
+    hit = new_run(project).findings("stored_form", "v1", entry, lambda e: pytest.fail("should be cached"))
+
+    assert miss == hit == {"lines": [1, 2]}
+
+
+def test_cache_off_without_incremental_env(project, monkeypatch):
+    monkeypatch.setenv(file_inventory.INCREMENTAL_ENV, "0")
+    audit(new_run(project))
+
+    assert audit(new_run(project)) == ["a.html", "b.html", "c.html"]
+    assert not (project / ".agent" / "cache").exists()
+
+
+@pytest.fixture
+def python_project(project, monkeypatch):
+    (project / "requirements.txt").write_text("requests\n", encoding="utf-8")
+    (project / "app.py").write_text("print('hi')\n", encoding="utf-8")
+    git(project, "add", ".")
+    git(project, "commit", "-q", "-m", "python")
+    calls = []
+    outcome = {"error": ""}
+
+    def fake_linter(linter, cwd):
+        calls.append(linter["name"])
+        return {"name": linter["name"], "passed": True, "output": "", "error": outcome["error"]}
+
+    monkeypatch.setattr(lint_runner, "run_linter", fake_linter)
+    return project, calls, outcome
+
+
+def lint(project: Path) -> dict:
+    new_run(project)
+    return lint_runner.run_check(str(project))
+
+
+def test_lint_reruns_only_when_its_inputs_change(python_project):
+    project, calls, _ = python_project
+
+    lint(project)
+    lint(project)
+    assert calls == ["ruff"]
+
+    (project / "requirements.txt").write_text("requests\nflask\n", encoding="utf-8")  # a lint config input
+    lint(project)
+    assert calls == ["ruff", "ruff"]
+
+    (project / "a.html").write_text("<h1>not a ruff input</h1>\n", encoding="utf-8")
+    lint(project)
+    assert calls == ["ruff", "ruff"]
+
+    (project / "app.py").write_text("print('hello')\n", encoding="utf-8")
+    lint(project)
+    assert calls == ["ruff", "ruff", "ruff"]
+
+
+def test_missing_tool_and_timeout_results_are_not_cached(python_project):
+    project, calls, outcome = python_project
+
+    for error in ("Command not found: ruff", "Timeout after 120s"):
+        outcome["error"] = error
+        lint(project)
+        lint(project)
+    assert calls == ["ruff"] * 4
+
+
+def test_tree_results_expire(python_project):
+    project, calls, _ = python_project
+    lint(project)
+
+    conn = sqlite3.connect(str(project / ".agent" / "cache" / file_inventory.CACHE_FILE))
+    with conn:
+        conn.execute("UPDATE results SET created = created - ?", (file_inventory.TREE_RESULT_MAX_AGE + 1,))
+    conn.close()
+    lint(project)
+
+    assert calls == ["ruff", "ruff"]
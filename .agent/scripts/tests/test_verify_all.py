@@ -0,0 +1,96 @@
+"""verify_all.run_checks: resource limits, stop-on-fail and the critical path report."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+spec = importlib.util.spec_from_file_location("verify_all", SCRIPTS_DIR / "verify_all.py")
+verify_all = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(verify_all)
+
+
+def make_check(project: Path, name: str, seconds: float, passed: bool = True) -> str:
+    """A run_check() stub that sleeps and reports when it ran; returns its path relative to the project."""
+    rel = f"checks/{name}.py"
+    path = project / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "import time\n\n"
+        "def run_check(project_path, url=None):\n"
+        "    start = time.perf_counter()\n"
+        f"    time.sleep({seconds})\n"
+        f"    return {{'passed': {passed}, 'start': start, 'end': time.perf_counter()}}\n",
+        encoding="utf-8")
+    return rel
+
+
+def overlaps(a: dict, b: dict) -> bool:
+    return a["report"]["start"] < b["report"]["end"] and b["report"]["start"] < a["report"]["end"]
+
+
+def test_one_browser_check_at_a_time(tmp_path):
+    checks = [
+        ("Performance", "Lighthouse", make_check(tmp_path, "lighthouse", 0.3), False, "browser"),
+        ("Performance", "Bundle", make_check(tmp_path, "bundle", 0.3), False, "static"),
+        ("E2E Testing", "Playwright", make_check(tmp_path, "playwright", 0.3), False, "browser"),
+    ]
+
+    results, _ = verify_all.run_checks(checks, tmp_path, jobs=4)
+
+    by_name = {r["name"]: r for r in results}
+    assert not overlaps(by_name["Lighthouse"], by_name["Playwright"])
+    assert overlaps(by_name["Lighthouse"], by_name["Bundle"])  # other classes still run alongside
+    assert by_name["Playwright"]["after"] == "Lighthouse"
+
+
+def test_critical_path_is_the_chain_that_set_the_wall_time(tmp_path):
+    checks = [
+        ("Security", "Scan", make_check(tmp_path, "scan", 0.1), False, "static"),
+        ("Performance", "Lighthouse", make_check(tmp_path, "lighthouse", 0.3), False, "browser"),
+        ("E2E Testing", "Playwright", make_check(tmp_path, "playwright", 0.3), False, "browser"),
+        ("Mobile", "Mobile", make_check(tmp_path, "mobile", 0.1), False, "static"),
+    ]
+
+    results, _ = verify_all.run_checks(checks, tmp_path, jobs=4)
+    duration, path = verify_all.critical_path(results)
+
+    assert path == ["Lighthouse", "Playwright"]
+    last = max(results, key=lambda r: r["start"] + r["duration"])
+    assert duration == pytest.approx(last["start"] + last["duration"], abs=0.1)
+
+
+def test_stop_on_fail_lets_running_checks_finish(tmp_path):
+    checks = [
+        ("Security", "Scan", make_check(tmp_path, "scan", 0.05, passed=False), True, "static"),
+        ("Testing", "Tests", make_check(tmp_path, "tests", 0.3), False, "toolchain"),
+        ("Mobile", "Mobile", make_check(tmp_path, "mobile", 0.05), False, "static"),
+    ]
+
+    results, critical = verify_all.run_checks(checks, tmp_path, jobs=2, stop_on_fail=True)
+
+    assert critical == "Scan"
+    by_name = {r["name"]: r for r in results}
+    assert by_name["Tests"]["passed"]  # already running when Scan failed
+    assert "Mobile" not in by_name     # never started
+
+
+def test_single_job_keeps_serial_per_category_output(tmp_path, capsys):
+    checks = [
+        ("Security", "Scan", make_check(tmp_path, "scan", 0.05), False, "static"),
+        ("Security", "Deps", make_check(tmp_path, "deps", 0.05), False, "static"),
+        ("Testing", "Tests", make_check(tmp_path, "tests", 0.05), False, "toolchain"),
+    ]
+
+    results, _ = verify_all.run_checks(checks, tmp_path, jobs=1)
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.strip() and "====" not in line]
+    expected = ["SECURITY", "Running: Scan", "Scan: PASSED", "Running: Deps", "Deps: PASSED",
+                "TESTING", "Running: Tests", "Tests: PASSED"]
+    assert len(lines) == len(expected)
+    for line, text in zip(lines, expected):
+        assert text in line
+    for a, b in zip(results, results[1:]):
+        assert a["report"]["end"] <= b["report"]["start"]
@@ -8,6 +8,20 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --jobs 4
+    python scripts/verify_all.py . --url <URL> --incremental
+
+With --jobs N, up to N checks from all categories run at the same time,
+limited per resource class (see RESOURCE_LIMITS): one browser-based check at
+a time, CPU-heavy toolchains up to one per core, static scans unlimited.
+The report lists each check's duration and the critical path, the chain of
+checks that waited on each other and set the total wall time.
+
+Check scripts that define run_check() are imported and called in-process
+(--runner inprocess, the default) or in a forked process pool (--runner fork),
+returning their result dicts directly; --runner subprocess launches
+`python <script> <project>` per check (see .agent/.shared/check_runner.py).
+Every check, whatever the runner, is reported as a timeout after CHECK_TIMEOUT.
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -22,13 +36,21 @@ Includes ALL checks:
     ✅ Mobile Audit (if applicable)
 """
 
+import os
 import sys
+import time
 import subprocess
 import argparse
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+SHARED_DIR = Path(__file__).resolve().parent.parent / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from check_runner import CHECK_ENTRY_POINT, DEFAULT_RUNNER, RUNNERS, CheckPool, exit_run, load_plugin, run_plugin, share_inventory
+from file_inventory import INCREMENTAL_ENV
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -57,14 +79,26 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
-# Complete verification suite
+CHECK_TIMEOUT = 600  # 10 minute timeout for slow checks
+DEFAULT_JOBS = 1  # checks run one at a time unless --jobs is given
+
+# How many checks of each resource class may run at once (None: only --jobs
+# limits it). Browser checks share one slot so Lighthouse and Playwright do not
+# skew each other; toolchain checks spawn linters, compilers and test runners.
+RESOURCE_LIMITS = {
+    "browser": 1,
+    "toolchain": os.cpu_count() or 1,
+    "static": None,
+}
+
+# Complete verification suite: (name, script, required, resource class)
 VERIFICATION_SUITE = [
     # P0: Security (CRITICAL)
     {
         "category": "Security",
         "checks": [
-            ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
-            ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False),
+            ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True, "static"),
+            ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False, "static"),
         ]
     },
     
@@ -72,8 +106,8 @@ VERIFICATION_SUITE = [
     {
         "category": "Code Quality",
         "checks": [
-            ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True),
-            ("Type Coverage", ".agent/skills/lint-and-validate/scripts/type_coverage.py", False),
+            ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True, "toolchain"),
+            ("Type Coverage", ".agent/skills/lint-and-validate/scripts/type_coverage.py", False, "static"),
         ]
     },
     
@@ -81,7 +115,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Data Layer",
         "checks": [
-            ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False),
+            ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False, "static"),
         ]
     },
     
@@ -89,7 +123,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Testing",
         "checks": [
-            ("Test Suite", ".agent/skills/testing-patterns/scripts/test_runner.py", False),
+            ("Test Suite", ".agent/skills/testing-patterns/scripts/test_runner.py", False, "toolchain"),
         ]
     },
     
@@ -97,8 +131,8 @@ VERIFICATION_SUITE = [
     {
         "category": "UX & Accessibility",
         "checks": [
-            ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False),
-            ("Accessibility Check", ".agent/skills/frontend-design/scripts/accessibility_checker.py", False),
+            ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False, "static"),
+            ("Accessibility Check", ".agent/skills/frontend-design/scripts/accessibility_checker.py", False, "static"),
         ]
     },
     
@@ -106,8 +140,8 @@ VERIFICATION_SUITE = [
     {
         "category": "SEO & Content",
         "checks": [
-            ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
-            ("GEO Check", ".agent/skills/geo-fundamentals/scripts/geo_checker.py", False),
+            ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False, "static"),
+            ("GEO Check", ".agent/skills/geo-fundamentals/scripts/geo_checker.py", False, "static"),
         ]
     },
     
@@ -116,8 +150,8 @@ VERIFICATION_SUITE = [
         "category": "Performance",
         "requires_url": True,
         "checks": [
-            ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
-            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
+            ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True, "browser"),
+            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False, "static"),
         ]
     },
     
@@ -126,7 +160,7 @@ VERIFICATION_SUITE = [
         "category": "E2E Testing",
         "requires_url": True,
         "checks": [
-            ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
+            ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False, "browser"),
         ]
     },
     
@@ -134,7 +168,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Mobile",
         "checks": [
-            ("Mobile Audit", ".agent/skills/mobile-design/scripts/mobile_audit.py", False),
+            ("Mobile Audit", ".agent/skills/mobile-design/scripts/mobile_audit.py", False, "static"),
         ]
     },
     
@@ -142,19 +176,41 @@ VERIFICATION_SUITE = [
     {
         "category": "Internationalization",
         "checks": [
-            ("i18n Check", ".agent/skills/i18n-localization/scripts/i18n_checker.py", False),
+            ("i18n Check", ".agent/skills/i18n-localization/scripts/i18n_checker.py", False, "static"),
         ]
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
-    if not script_path.exists():
-        print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "skipped": True, "duration": 0}
-    
-    print_step(f"Running: {name}")
-    start_time = datetime.now()
+def plan_checks(url: Optional[str] = None, no_e2e: bool = False) -> List[tuple]:
+    """Flatten VERIFICATION_SUITE into (category, name, script, required, resource) in priority order"""
+    checks = []
+    for suite in VERIFICATION_SUITE:
+        category = suite["category"]
+        
+        # Skip if requires URL and not provided
+        if suite.get("requires_url", False) and not url:
+            continue
+        
+        # Skip E2E if flag set
+        if no_e2e and category == "E2E Testing":
+            continue
+        
+        for name, script_path, required, resource in suite["checks"]:
+            checks.append((category, name, script_path, required, resource))
+    return checks
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               runner: str = DEFAULT_RUNNER) -> dict:
+    """Run validation script (prints nothing, so it can run on a worker thread or process; see print_result)"""
+    start = time.perf_counter()
+    if runner != "subprocess":
+        try:
+            entry_point = load_plugin(script_path)
+        except (Exception, SystemExit) as e:
+            return {"name": name, "passed": False, "skipped": False, "duration": time.perf_counter() - start,
+                    "error": f"Import failed: {type(e).__name__}: {e}"}
+        if entry_point is not None:
+            return run_plugin(name, entry_point, project_path, url, start)
     
     # Build command
     cmd = ["python", str(script_path), project_path]
@@ -167,37 +223,143 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
             cmd,
             capture_output=True,
             text=True,
-            timeout=600  # 10 minute timeout for slow checks
+            timeout=CHECK_TIMEOUT
         )
         
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
-        
         return {
             "name": name,
-            "passed": passed,
+            "passed": result.returncode == 0,
             "output": result.stdout,
             "error": result.stderr,
             "skipped": False,
-            "duration": duration
+            "duration": time.perf_counter() - start
         }
     
     except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
+        return {"name": name, "passed": False, "skipped": False, "duration": time.perf_counter() - start, "error": "Timeout"}
     
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+        return {"name": name, "passed": False, "skipped": False, "duration": time.perf_counter() - start,
+                "error": str(e), "exception": True}
+
+def print_result(result: dict):
+    """Print the outcome of one finished check"""
+    name = result["name"]
+    duration = result.get("duration", 0)
+    if result.get("skipped"):
+        print_warning(f"{name}: Script not found, skipping")
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({duration:.1f}s)")
+    elif result.get("error") == "Timeout":
+        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
+    elif result.get("exception"):
+        print_error(f"{name}: ERROR - {result['error']}")
+    else:
+        print_error(f"{name}: FAILED ({duration:.1f}s)")
+        if result.get("error"):
+            print(f"  {result['error'][:300]}")
+
+def run_checks(checks: List[tuple], project_path: Path, url: Optional[str] = None, jobs: int = DEFAULT_JOBS,
+               stop_on_fail: bool = False, runner: str = DEFAULT_RUNNER) -> Tuple[List[dict], Optional[str]]:
+    """
+    Run checks on up to `jobs` workers, respecting RESOURCE_LIMITS.
+    
+    Checks start in priority order as soon as a worker and a slot in their
+    resource class are free; results are printed as checks finish. Each result
+    records when it started and which finished check it waited for ("after"),
+    so the report can reconstruct the critical path. With stop_on_fail, a
+    failed required check stops new checks from starting (running ones finish).
+    
+    Returns:
+        (results in priority order, name of the failed required check or None)
+    """
+    jobs = max(1, jobs)
+    order = {check[1]: i for i, check in enumerate(checks)}
+    pending = list(checks)
+    running = {}
+    in_use = {resource: 0 for resource in RESOURCE_LIMITS}
+    done = []
+    last_batch = []
+    critical = None
+    last_category = None
+    run_start = time.perf_counter()
+    
+    def has_slot(resource: str) -> bool:
+        limit = RESOURCE_LIMITS.get(resource)
+        return limit is None or in_use.get(resource, 0) < limit
+    
+    def waited_for(resource: str) -> Optional[str]:
+        # Everything that can start is started right away, so a check starting
+        # now was held back by a check in the batch that just finished
+        for name, finished_resource in last_batch:
+            if finished_resource == resource and RESOURCE_LIMITS.get(resource) is not None:
+                return name
+        return last_batch[-1][0] if last_batch else None
+    
+    if runner == "fork":
+        share_inventory(project_path)
+    
+    with CheckPool(runner, jobs, CHECK_TIMEOUT) as pool:
+        while pending or running:
+            for check in list(pending):
+                category, name, script_path, _, resource = check
+                if critical is not None or len(running) >= jobs:
+                    break
+                script = project_path / script_path
+                if script.exists() and not has_slot(resource):
+                    continue
+                
+                if jobs == 1 and category != last_category:
+                    print_header(f"📋 {category.upper()}")
+                    last_category = category
+                pending.remove(check)
+                
+                if not script.exists():
+                    result = {"name": name, "category": category, "passed": True, "skipped": True, "duration": 0}
+                    print_result(result)
+                    done.append(result)
+                    continue
+                
+                print_step(f"Running: {name}")
+                in_use[resource] = in_use.get(resource, 0) + 1
+                future = pool.submit(run_script, name, script, str(project_path), url, runner)
+                running[future] = (check, time.perf_counter() - run_start, waited_for(resource))
+            
+            if not running:
+                break  # stopped on a critical failure
+            
+            finished, timed_out = pool.wait(running)
+            last_batch = []
+            for future in sorted(finished | timed_out, key=lambda f: order[running[f][0][1]]):
+                (category, name, _, required, resource), started, after = running.pop(future)
+                in_use[resource] -= 1
+                if future in timed_out:
+                    result = {"name": name, "passed": False, "skipped": False, "duration": float(CHECK_TIMEOUT), "error": "Timeout"}
+                else:
+                    result = future.result()
+                result.update(category=category, start=started, after=after)
+                print_result(result)
+                done.append(result)
+                last_batch.append((name, resource))
+                
+                # Stop on critical failure if flag set
+                if stop_on_fail and required and not result["passed"] and not result.get("skipped"):
+                    critical = critical or name
+    
+    return sorted(done, key=lambda r: order[r["name"]]), critical
+
+def critical_path(results: List[dict]) -> Tuple[float, List[str]]:
+    """Longest chain of checks that waited on each other, ending at the last check to finish"""
+    by_name = {r["name"]: r for r in results if "start" in r}
+    if not by_name:
+        return 0.0, []
+    current = max(by_name.values(), key=lambda r: r["start"] + r["duration"])
+    chain = []
+    while current is not None:
+        chain.append(current)
+        current = by_name.get(current.get("after"))
+    chain.reverse()
+    return sum(r["duration"] for r in chain), [r["name"] for r in chain]
 
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
@@ -211,7 +373,13 @@ def print_final_report(results: List[dict], start_time: datetime):
     failed = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped = sum(1 for r in results if r.get("skipped"))
     
+    path_duration, path = critical_path(results)
+    check_time = sum(r.get("duration", 0) for r in results)
+    
     print(f"Total Duration: {total_duration:.1f}s")
+    print(f"Check Time: {check_time:.1f}s (sum of all checks)")
+    if path:
+        print(f"Critical Path: {path_duration:.1f}s ({' → '.join(path)})")
     print(f"Total Checks: {total}")
     print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
@@ -268,12 +436,16 @@ def main():
 Examples:
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --url http://localhost:3000 --jobs 4
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--runner", choices=RUNNERS, default=DEFAULT_RUNNER, help=f"How checks run (default: {DEFAULT_RUNNER}; see CHECK_ENTRY_POINT)")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Checks run at the same time, within RESOURCE_LIMITS (default: {DEFAULT_JOBS})")
+    parser.add_argument("--incremental", action="store_true", help="Re-audit only files changed since the last incremental run (cache: <project>/.agent/cache)")
     
     args = parser.parse_args()
     
@@ -287,41 +459,27 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url}")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if args.incremental:
+        os.environ[INCREMENTAL_ENV] = "1"
+        print("Mode: incremental (unchanged files reuse cached findings)")
     
     start_time = datetime.now()
-    results = []
     
     # Run all verification categories
-    for suite in VERIFICATION_SUITE:
-        category = suite["category"]
-        requires_url = suite.get("requires_url", False)
-        
-        # Skip if requires URL and not provided
-        if requires_url and not args.url:
-            continue
-        
-        # Skip E2E if flag set
-        if args.no_e2e and category == "E2E Testing":
-            continue
-        
-        print_header(f"📋 {category.upper()}")
-        
-        for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+    checks = plan_checks(args.url, args.no_e2e)
+    if args.jobs > 1:
+        print_header(f"📋 RUNNING {len(checks)} CHECKS ({args.jobs} JOBS)")
+    results, critical = run_checks(checks, project_path, args.url, args.jobs, args.stop_on_fail, args.runner)
+    
+    if critical:
+        print_error(f"CRITICAL: {critical} failed. Stopping verification.")
+        print_final_report(results, start_time)
+        exit_run(1)
     
     # Print final report
     all_passed = print_final_report(results, start_time)
     
-    sys.exit(0 if all_passed else 1)
+    exit_run(0 if all_passed else 1)
 
 if __name__ == "__main__":
     main()
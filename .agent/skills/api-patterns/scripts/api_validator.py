@@ -6,33 +6,37 @@ Validates OpenAPI specs, response formats, and common issues.
 import sys
 import json
 import re
+import fnmatch
 from pathlib import Path
 
-# Fix Windows console encoding for Unicode output
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass  # Python < 3.7
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import get_inventory, read_text
 
 def find_api_files(project_path: Path) -> list:
     """Find API-related files."""
-    patterns = [
-        "**/*api*.ts", "**/*api*.js", "**/*api*.py",
-        "**/routes/*.ts", "**/routes/*.js", "**/routes/*.py",
-        "**/controllers/*.ts", "**/controllers/*.js",
-        "**/endpoints/*.ts", "**/endpoints/*.py",
-        "**/*.openapi.json", "**/*.openapi.yaml",
-        "**/swagger.json", "**/swagger.yaml",
-        "**/openapi.json", "**/openapi.yaml"
+    patterns = [  # (required parent directory, file name pattern)
+        (None, "*api*.ts"), (None, "*api*.js"), (None, "*api*.py"),
+        ("routes", "*.ts"), ("routes", "*.js"), ("routes", "*.py"),
+        ("controllers", "*.ts"), ("controllers", "*.js"),
+        ("endpoints", "*.ts"), ("endpoints", "*.py"),
+        (None, "*.openapi.json"), (None, "*.openapi.yaml"),
+        (None, "swagger.json"), (None, "swagger.yaml"),
+        (None, "openapi.json"), (None, "openapi.yaml")
     ]
     
+    entries = get_inventory(project_path).files()
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    for folder, name in patterns:
+        for entry in entries:
+            if (folder is None or entry.dirs[-1:] == (folder,)) and fnmatch.fnmatchcase(entry.path.name, name):
+                # Exclude node_modules, etc.
+                if not any(x in entry.rel for x in ['node_modules', '.git', 'dist', 'build', '__pycache__']):
+                    files.append(project_path / entry.rel)
     
-    # Exclude node_modules, etc.
-    return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
+    return files
 
 def check_openapi_spec(file_path: Path) -> dict:
     """Check OpenAPI/Swagger specification."""
@@ -40,7 +44,7 @@ def check_openapi_spec(file_path: Path) -> dict:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = read_text(file_path, errors='strict')
         
         if file_path.suffix == '.json':
             spec = json.loads(content)
@@ -97,7 +101,7 @@ def check_api_code(file_path: Path) -> dict:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = read_text(file_path, errors='strict')
         
         # Check for error handling
         error_patterns = [
@@ -208,4 +212,10 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Fix Windows console encoding for Unicode output
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass  # Python < 3.7
     main()
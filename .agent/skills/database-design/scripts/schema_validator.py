@@ -19,12 +19,6 @@ import re
 from pathlib import Path
 from datetime import datetime
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-except:
-    pass
-
 
 def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
@@ -91,22 +85,13 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    
-    print(f"\n{'='*60}")
-    print(f"[SCHEMA VALIDATOR] Database Schema Validation")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
-    
-    # Find schema files
+def run_check(project_path: str, url: str = None) -> dict:
+    """Validate every schema file and return the structured result (prints nothing)."""
+    project_path = Path(project_path).resolve()
     schemas = find_schema_files(project_path)
-    print(f"Found {len(schemas)} schema files")
     
     if not schemas:
-        output = {
+        return {
             "script": "schema_validator",
             "project": str(project_path),
             "schemas_checked": 0,
@@ -114,15 +99,11 @@ def main():
             "passed": True,
             "message": "No schema files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
     
     # Validate each schema
     all_issues = []
     
     for schema_type, file_path in schemas:
-        print(f"\nValidating: {file_path.name} ({schema_type})")
-        
         if schema_type == 'prisma':
             issues = validate_prisma_schema(file_path)
         else:
@@ -135,13 +116,45 @@ def main():
                 "issues": issues
             })
     
+    # Schema issues are warnings, not failures
+    return {
+        "script": "schema_validator",
+        "project": str(project_path),
+        "schemas_checked": len(schemas),
+        "schemas": [{"file": file_path.name, "type": schema_type} for schema_type, file_path in schemas],
+        "issues_found": sum(len(item["issues"]) for item in all_issues),
+        "passed": True,
+        "issues": all_issues
+    }
+
+
+def main():
+    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    
+    print(f"\n{'='*60}")
+    print(f"[SCHEMA VALIDATOR] Database Schema Validation")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+    
+    output = run_check(str(project_path))
+    print(f"Found {output['schemas_checked']} schema files")
+    
+    if not output["schemas_checked"]:
+        print(json.dumps(output, indent=2))
+        sys.exit(0)
+    
+    for schema in output.pop("schemas"):
+        print(f"\nValidating: {schema['file']} ({schema['type']})")
+    
     # Summary
     print("\n" + "="*60)
     print("SCHEMA ISSUES")
     print("="*60)
     
-    if all_issues:
-        for item in all_issues:
+    if output["issues"]:
+        for item in output["issues"]:
             print(f"\n{item['file']} ({item['type']}):")
             for issue in item["issues"][:5]:  # Limit per file
                 print(f"  - {issue}")
@@ -150,23 +163,15 @@ def main():
     else:
         print("No schema issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Schema issues are warnings, not failures
-    passed = True
-    
-    output = {
-        "script": "schema_validator",
-        "project": str(project_path),
-        "schemas_checked": len(schemas),
-        "issues_found": total_issues,
-        "passed": passed,
-        "issues": all_issues
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
     sys.exit(0)
 
 
 if __name__ == "__main__":
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except:
+        pass
     main()
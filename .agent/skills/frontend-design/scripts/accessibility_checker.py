@@ -20,23 +20,23 @@ import re
 from pathlib import Path
 from datetime import datetime
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-except:
-    pass
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory, read_text
+CHECKER_VERSION = checker_version(__file__)
 
 
 def find_html_files(project_path: Path) -> list:
-    """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
+    """Find all HTML/JSX/TSX files (inventory entries)."""
+    extensions = ['.html', '.jsx', '.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
+    inventory = get_inventory(project_path)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for ext in extensions:
+        files.extend(inventory.files(ext, skip_dirs=skip_dirs))
     
     return files[:50]
 
@@ -46,7 +46,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,22 +108,13 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    
-    print(f"\n{'='*60}")
-    print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
-    
-    # Find HTML files
+def run_check(project_path: str, url: str = None) -> dict:
+    """Check every HTML/JSX/TSX file and return the structured result (prints nothing)."""
+    project_path = Path(project_path).resolve()
     files = find_html_files(project_path)
-    print(f"Found {len(files)} HTML/JSX/TSX files")
     
     if not files:
-        output = {
+        return {
             "script": "accessibility_checker",
             "project": str(project_path),
             "files_checked": 0,
@@ -131,25 +122,56 @@ def main():
             "passed": True,
             "message": "No HTML files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
     
     # Check each file
+    inventory = get_inventory(project_path)
     all_issues = []
     
-    for f in files:
-        issues = check_accessibility(f)
+    for entry in files:
+        issues = inventory.findings("accessibility_checker", CHECKER_VERSION, entry, lambda e: check_accessibility(e.path))
         if issues:
             all_issues.append({
-                "file": str(f.name),
+                "file": str(entry.path.name),
                 "issues": issues
             })
     
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    
+    return {
+        "script": "accessibility_checker",
+        "project": str(project_path),
+        "files_checked": len(files),
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        # Accessibility issues are important but not blocking
+        "passed": total_issues < 5,  # Allow minor issues
+        "issues": all_issues
+    }
+
+
+def main():
+    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    
+    print(f"\n{'='*60}")
+    print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+    
+    output = run_check(str(project_path))
+    print(f"Found {output['files_checked']} HTML/JSX/TSX files")
+    
+    if not output["files_checked"]:
+        print(json.dumps(output, indent=2))
+        sys.exit(0)
+    
     # Summary
     print("\n" + "="*60)
     print("ACCESSIBILITY ISSUES")
     print("="*60)
     
+    all_issues = output.pop("issues")
     if all_issues:
         for item in all_issues[:10]:
             print(f"\n{item['file']}:")
@@ -161,23 +183,15 @@ def main():
     else:
         print("No accessibility issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Accessibility issues are important but not blocking
-    passed = total_issues < 5  # Allow minor issues
-    
-    output = {
-        "script": "accessibility_checker",
-        "project": str(project_path),
-        "files_checked": len(files),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except:
+        pass
     main()
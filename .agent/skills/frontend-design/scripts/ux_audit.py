@@ -95,6 +95,13 @@ import re
 import json
 from pathlib import Path
 
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory, read_text
+CHECKER_VERSION = checker_version(__file__)
+
 class UXAuditor:
     def __init__(self):
         self.issues = []
@@ -102,11 +109,12 @@ class UXAuditor:
         self.passed_count = 0
         self.files_checked = 0
     
-    def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except: return
+    def audit_file(self, filepath: str, content: str = None) -> None:
+        if content is None:
+            try:
+                with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+            except: return
         
         self.files_checked += 1
         filename = os.path.basename(filepath)
@@ -673,11 +681,23 @@ class UXAuditor:
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        inventory = get_inventory(directory)
+        for entry in inventory.files(*extensions, skip_dirs={'node_modules', '.git', 'dist', 'build', '.next'}):
+            try:
+                findings = inventory.findings("ux_audit", CHECKER_VERSION, entry, self.file_findings)
+            except OSError:
+                continue
+            self.files_checked += 1
+            self.issues.extend(findings["issues"])
+            self.warnings.extend(findings["warnings"])
+            self.passed_count += findings["passed_count"]
+
+    @staticmethod
+    def file_findings(entry) -> dict:
+        """Findings for one file, audited on its own so incremental runs can cache them per file."""
+        auditor = UXAuditor()
+        auditor.audit_file(str(entry.path), read_text(entry, errors='replace'))
+        return {"issues": auditor.issues, "warnings": auditor.warnings, "passed_count": auditor.passed_count}
 
     def get_report(self):
         return {
@@ -688,6 +708,16 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+def run_check(project_path: str, url: str = None) -> dict:
+    """Audit a file or directory and return the UX report with a "passed" flag (prints nothing)."""
+    auditor = UXAuditor()
+    if os.path.isfile(project_path):
+        auditor.audit_file(project_path)
+    else:
+        auditor.audit_directory(project_path)
+    report = auditor.get_report()
+    return {"script": "ux_audit", "project": str(project_path), **report, "passed": report["compliant"]}
+
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
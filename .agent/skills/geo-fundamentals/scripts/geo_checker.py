@@ -21,12 +21,12 @@ import re
 import json
 from pathlib import Path
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory, read_text
+CHECKER_VERSION = checker_version(__file__)
 
 
 # Directories to skip (not public content)
@@ -79,19 +79,17 @@ def is_page_file(file_path: Path) -> bool:
 
 
 def find_web_pages(project_path: Path) -> list:
-    """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    """Find public-facing web pages only (inventory entries)."""
+    extensions = ['.html', '.htm', '.jsx', '.tsx']
+    inventory = get_inventory(project_path)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
+    for ext in extensions:
+        # Skip excluded directories
+        for entry in inventory.files(ext, skip_dirs=SKIP_DIRS):
             # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+            if is_page_file(entry.path):
+                files.append(entry)
     
     return files[:30]  # Limit to 30 pages
 
@@ -99,7 +97,7 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
@@ -219,6 +217,28 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run_check(project_path: str, url: str = None) -> dict:
+    """Score every public page and return the structured result (prints nothing)."""
+    target_path = Path(project_path).resolve()
+    pages = find_web_pages(target_path)
+    
+    if not pages:
+        return {"script": "geo_checker", "pages_found": 0, "passed": True}
+    
+    inventory = get_inventory(target_path)
+    results = [inventory.findings("geo_checker", CHECKER_VERSION, page, lambda e: check_page(e.path)) for page in pages]
+    avg_score = sum(r['score'] for r in results) / len(results)
+    
+    return {
+        "script": "geo_checker",
+        "project": str(target_path),
+        "pages_checked": len(results),
+        "average_score": round(avg_score),
+        "passed": avg_score >= 60,
+        "pages": results
+    }
+
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     target_path = Path(target).resolve()
@@ -229,24 +249,17 @@ def main():
     print(f"Project: {target_path}")
     print("-" * 60)
     
-    # Find web pages only
-    pages = find_web_pages(target_path)
+    output = run_check(str(target_path))
     
-    if not pages:
+    if not output.get("pages_checked"):
         print("\n[!] No public web pages found.")
         print("    Looking for: HTML, JSX, TSX files in pages/app directories")
         print("    Skipping: docs, tests, config files, node_modules")
-        output = {"script": "geo_checker", "pages_found": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} public pages to analyze\n")
-    
-    # Check each page
-    results = []
-    for page in pages:
-        result = check_page(page)
-        results.append(result)
+    results = output.pop("pages")
+    print(f"Found {len(results)} public pages to analyze\n")
     
     # Print results
     for result in results:
@@ -257,7 +270,7 @@ def main():
                 print(f"    - {issue}")
     
     # Average score
-    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
+    avg_score = sum(r['score'] for r in results) / len(results)
     
     print("\n" + "=" * 60)
     print(f"AVERAGE GEO SCORE: {avg_score:.0f}%")
@@ -273,17 +286,16 @@ def main():
         print("[X] Poor - Content needs GEO optimization")
     
     # JSON output
-    output = {
-        "script": "geo_checker",
-        "project": str(target_path),
-        "pages_checked": len(results),
-        "average_score": round(avg_score),
-        "passed": avg_score >= 60
-    }
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass
     main()
@@ -8,12 +8,12 @@ import re
 import json
 from pathlib import Path
 
-# Fix Windows console encoding for Unicode output
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass  # Python < 3.7
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory, read_text
+CHECKER_VERSION = checker_version(__file__)
 
 # Patterns that indicate hardcoded strings (should be translated)
 HARDCODED_PATTERNS = {
@@ -52,20 +52,16 @@ I18N_PATTERNS = [
 
 def find_locale_files(project_path: Path) -> list:
     """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
+    inventory = get_inventory(project_path)
+    json_files = inventory.files('.json')
     
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    for folder in ('locales', 'translations', 'lang', 'i18n'):  # <folder>/**/*.json
+        files.extend(entry.path for entry in json_files if folder in entry.dirs)
+    files.extend(entry.path for entry in json_files if entry.dirs[-1:] == ('messages',))  # messages/*.json
+    files.extend(entry.path for entry in inventory.files('.po'))  # gettext
     
-    return [f for f in files if 'node_modules' not in str(f)]
+    return files
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -81,7 +77,7 @@ def check_locale_completeness(locale_files: list) -> dict:
         if f.suffix == '.json':
             try:
                 lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                content = json.loads(read_text(f, errors='strict'))
                 if lang not in locales:
                     locales[lang] = {}
                 locales[lang][f.stem] = set(flatten_keys(content))
@@ -128,24 +124,43 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
+# Code file extensions and the HARDCODED_PATTERNS that apply to them
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+
+def file_strings(entry) -> dict:
+    """i18n usage and hardcoded string examples (first match per pattern) in one code file."""
+    file_path = entry.path
+    content = read_text(file_path)
+    file_type = CODE_EXTENSIONS.get(file_path.suffix, 'jsx')
+    
+    # Check for i18n usage
+    has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
+    
+    # Check for hardcoded strings
+    hardcoded = []
+    if not has_i18n:
+        for pattern in HARDCODED_PATTERNS.get(file_type, []):
+            matches = re.findall(pattern, content)
+            if matches:
+                hardcoded.append(str(matches[0])[:40])
+    
+    return {'has_i18n': has_i18n, 'hardcoded': hardcoded}
+
 def check_hardcoded_strings(project_path: Path) -> dict:
     """Check for hardcoded strings in code files."""
     issues = []
     passed = []
     
     # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
-    
+    inventory = get_inventory(project_path)
     code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    for ext in CODE_EXTENSIONS:
+        code_files.extend(entry for entry in inventory.files(ext) if not any(x in entry.rel for x in
+                          ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec']))
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
@@ -154,29 +169,17 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     files_with_hardcoded = 0
     hardcoded_examples = []
     
-    for file_path in code_files[:50]:  # Limit
+    for entry in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
+            strings = inventory.findings("i18n_checker", CHECKER_VERSION, entry, file_strings)
+            if strings['has_i18n']:
                 files_with_i18n += 1
             
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
+            for example in strings['hardcoded']:
+                if len(hardcoded_examples) < 5:
+                    hardcoded_examples.append(f"{entry.path.name}: {example}...")
             
-            if hardcoded_found:
+            if strings['hardcoded']:
                 files_with_hardcoded += 1
                 
         except:
@@ -196,20 +199,31 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
+def run_check(project_path: str, url: str = None) -> dict:
+    """Check locale files and hardcoded strings, returning the structured result (prints nothing)."""
+    project_path = Path(project_path)
+    locale_result = check_locale_completeness(find_locale_files(project_path))
+    code_result = check_hardcoded_strings(project_path)
+    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
+    return {
+        'script': 'i18n_checker',
+        'project': str(project_path),
+        'locales': locale_result,
+        'code': code_result,
+        'critical_issues': critical_issues,
+        'passed': critical_issues == 0
+    }
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
     
     print("\n" + "=" * 60)
     print("  i18n CHECKER - Internationalization Audit")
     print("=" * 60 + "\n")
     
-    # Check locale files
-    locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
-    
-    # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    output = run_check(target)
+    locale_result = output['locales']
+    code_result = output['code']
     
     # Print results
     print("[LOCALE FILES]")
@@ -227,15 +241,19 @@ def main():
         print(f"  {item}")
     
     # Summary
-    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
-    
     print("\n" + "=" * 60)
-    if critical_issues == 0:
+    if output['passed']:
         print("[OK] i18n CHECK: PASSED")
         sys.exit(0)
     else:
-        print(f"[X] i18n CHECK: {critical_issues} issues found")
+        print(f"[X] i18n CHECK: {output['critical_issues']} issues found")
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Fix Windows console encoding for Unicode output
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass  # Python < 3.7
     main()
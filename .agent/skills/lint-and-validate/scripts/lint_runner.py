@@ -19,11 +19,25 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-except:
-    pass
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory
+CHECKER_VERSION = checker_version(__file__)
+
+# A linter's inputs: these manifests/configs plus its source files. In
+# incremental runs its last result is reused until one of them changes.
+LINT_CONFIG_FILES = [
+    "package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "tsconfig.json",
+    ".eslintrc", ".eslintrc.js", ".eslintrc.cjs", ".eslintrc.json", ".eslintrc.yml", ".eslintrc.yaml",
+    "eslint.config.js", "eslint.config.mjs", "eslint.config.cjs",
+    "pyproject.toml", "requirements.txt", "setup.cfg", "ruff.toml", ".ruff.toml", "mypy.ini",
+]
+NODE_SOURCES = ['.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.vue']
+PYTHON_SOURCES = ['.py', '.pyi']
+# Source extensions per linter; None (npm lint runs an arbitrary script) means every file
+LINT_SOURCES = {"npm lint": None, "eslint": NODE_SOURCES, "tsc": NODE_SOURCES, "ruff": PYTHON_SOURCES, "mypy": PYTHON_SOURCES}
 
 
 def detect_project_type(project_path: Path) -> dict:
@@ -113,6 +127,48 @@ def run_linter(linter: dict, cwd: Path) -> dict:
     return result
 
 
+def lint_inputs(inventory, linter: dict) -> list:
+    """Files whose changes can change a linter's result."""
+    sources = LINT_SOURCES.get(linter["name"])
+    if sources is None:
+        return inventory.entries
+    return inventory.named(*LINT_CONFIG_FILES) + inventory.files(*sources)
+
+
+def linter_ran(result: dict) -> bool:
+    """Whether the linter itself produced the result (a missing tool or a timeout is not worth caching)."""
+    return not result["error"].startswith(("Command not found:", "Timeout after"))
+
+
+def run_check(project_path: str, url: str = None) -> dict:
+    """Run every linter for the project and return the structured result (prints nothing)."""
+    project_path = Path(project_path).resolve()
+    project_info = detect_project_type(project_path)
+    
+    if not project_info["linters"]:
+        return {
+            "script": "lint_runner",
+            "project": str(project_path),
+            "type": project_info["type"],
+            "checks": [],
+            "passed": True,
+            "message": "No linters configured"
+        }
+    
+    inventory = get_inventory(project_path)
+    results = [inventory.result(f"lint_runner.{linter['name']}", CHECKER_VERSION, lint_inputs(inventory, linter),
+                                lambda linter=linter: run_linter(linter, project_path), keep=linter_ran)
+               for linter in project_info["linters"]]
+    
+    return {
+        "script": "lint_runner",
+        "project": str(project_path),
+        "type": project_info["type"],
+        "checks": results,
+        "passed": all(r["passed"] for r in results)
+    }
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -122,63 +178,43 @@ def main():
     print(f"Project: {project_path}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Detect project type
-    project_info = detect_project_type(project_path)
-    print(f"Type: {project_info['type']}")
-    print(f"Linters: {len(project_info['linters'])}")
+    output = run_check(str(project_path))
+    print(f"Type: {output['type']}")
+    print(f"Linters: {len(output['checks'])}")
     print("-"*60)
     
-    if not project_info["linters"]:
+    if not output["checks"]:
         print("No linters found for this project type.")
-        output = {
-            "script": "lint_runner",
-            "project": str(project_path),
-            "type": project_info["type"],
-            "checks": [],
-            "passed": True,
-            "message": "No linters configured"
-        }
         print(json.dumps(output, indent=2))
         sys.exit(0)
     
-    # Run each linter
-    results = []
-    all_passed = True
-    
-    for linter in project_info["linters"]:
-        print(f"\nRunning: {linter['name']}...")
-        result = run_linter(linter, project_path)
-        results.append(result)
-        
+    for result in output["checks"]:
+        print(f"\nRunning: {result['name']}...")
         if result["passed"]:
-            print(f"  [PASS] {linter['name']}")
+            print(f"  [PASS] {result['name']}")
         else:
-            print(f"  [FAIL] {linter['name']}")
+            print(f"  [FAIL] {result['name']}")
             if result["error"]:
                 print(f"  Error: {result['error'][:200]}")
-            all_passed = False
     
     # Summary
     print("\n" + "="*60)
     print("SUMMARY")
     print("="*60)
     
-    for r in results:
+    for r in output["checks"]:
         icon = "[PASS]" if r["passed"] else "[FAIL]"
         print(f"{icon} {r['name']}")
     
-    output = {
-        "script": "lint_runner",
-        "project": str(project_path),
-        "type": project_info["type"],
-        "checks": results,
-        "passed": all_passed
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if all_passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except:
+        pass
     main()
@@ -8,12 +8,47 @@ import re
 import subprocess
 from pathlib import Path
 
-# Fix Windows console encoding for Unicode output
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass  # Python < 3.7
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory, read_text
+CHECKER_VERSION = checker_version(__file__)
+
+def typescript_counts(entry) -> dict:
+    """'any' usage and typed/untyped function counts in one TypeScript file."""
+    content = read_text(entry.path)
+    
+    # Count 'any' usage
+    any_matches = re.findall(r':\s*any\b', content)
+    
+    # Find functions without return types
+    # function name(params) { - no return type
+    untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
+    # Arrow functions without types: const fn = (x) => or (x) =>
+    untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
+    
+    # Count typed functions
+    typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
+    typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
+    
+    return {'any_count': len(any_matches), 'untyped_functions': len(untyped), 'total_functions': len(typed) + len(untyped)}
+
+def python_counts(entry) -> dict:
+    """'Any' usage and typed/untyped function counts in one Python file."""
+    content = read_text(entry.path)
+    
+    # Count Any usage
+    any_matches = re.findall(r':\s*Any\b', content)
+    
+    # Find functions with type hints
+    typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
+    typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
+    
+    # Find functions without type hints
+    all_funcs = re.findall(r'def\s+\w+\s*\(', content)
+    
+    return {'any_count': len(any_matches), 'typed_functions': len(typed_funcs), 'untyped_functions': len(all_funcs) - len(typed_funcs)}
 
 def check_typescript_coverage(project_path: Path) -> dict:
     """Check TypeScript type coverage."""
@@ -21,31 +56,16 @@ def check_typescript_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
+    inventory = get_inventory(project_path)
+    ts_files = [entry for entry in inventory.files('.ts') + inventory.files('.tsx') if '.d.ts' not in entry.rel]
     
     if not ts_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
-    for file_path in ts_files[:30]:  # Limit
+    for entry in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
-            
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
+            for key, count in inventory.findings("type_coverage.typescript", CHECKER_VERSION, entry, typescript_counts).items():
+                stats[key] += count
             
         except Exception:
             continue
@@ -77,28 +97,17 @@ def check_python_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+    inventory = get_inventory(project_path)
+    py_files = [entry for entry in inventory.files('.py')
+                if not any(x in entry.rel for x in ['venv', '__pycache__', '.git', 'node_modules'])]
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
-    for file_path in py_files[:30]:  # Limit
+    for entry in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
+            for key, count in inventory.findings("type_coverage.python", CHECKER_VERSION, entry, python_counts).items():
+                stats[key] += count
             
         except Exception:
             continue
@@ -125,49 +134,58 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
+def run_check(project_path: str, url: str = None) -> dict:
+    """Check TypeScript and Python coverage and return the structured result (prints nothing)."""
+    project_path = Path(project_path)
+    results = []
+    for result in (check_typescript_coverage(project_path), check_python_coverage(project_path)):
+        if result['files'] > 0:
+            results.append(result)
+    
+    critical_issues = sum(1 for result in results for item in result['issues'] if item.startswith("[X]"))
+    return {
+        'script': 'type_coverage',
+        'project': str(project_path),
+        'results': results,
+        'critical_issues': critical_issues,
+        'passed': critical_issues == 0
+    }
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
     
     print("\n" + "=" * 60)
     print("  TYPE COVERAGE CHECKER")
     print("=" * 60 + "\n")
     
-    results = []
-    
-    # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
-    if ts_result['files'] > 0:
-        results.append(ts_result)
-    
-    # Check Python
-    py_result = check_python_coverage(project_path)
-    if py_result['files'] > 0:
-        results.append(py_result)
+    output = run_check(target)
     
-    if not results:
+    if not output['results']:
         print("[!] No TypeScript or Python files found.")
         sys.exit(0)
     
     # Print results
-    critical_issues = 0
-    for result in results:
+    for result in output['results']:
         print(f"\n[{result['type'].upper()}]")
         print("-" * 40)
         for item in result['passed']:
             print(f"  {item}")
         for item in result['issues']:
             print(f"  {item}")
-            if item.startswith("[X]"):
-                critical_issues += 1
     
     print("\n" + "=" * 60)
-    if critical_issues == 0:
+    if output['passed']:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
         sys.exit(0)
     else:
-        print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
+        print(f"[X] TYPE COVERAGE: {output['critical_issues']} critical issues")
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Fix Windows console encoding for Unicode output
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass  # Python < 3.7
     main()
@@ -71,6 +71,14 @@ import re
 import json
 from pathlib import Path
 
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory, read_text
+CHECKER_VERSION = checker_version(__file__)
+
+
 class MobileAuditor:
     def __init__(self):
         self.issues = []
@@ -78,12 +86,13 @@ class MobileAuditor:
         self.passed_count = 0
         self.files_checked = 0
 
-    def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except:
-            return
+    def audit_file(self, filepath: str, content: str = None) -> None:
+        if content is None:
+            try:
+                with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+            except:
+                return
 
         self.files_checked += 1
         filename = os.path.basename(filepath)
@@ -612,11 +621,23 @@ class MobileAuditor:
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        inventory = get_inventory(directory)
+        for entry in inventory.files(*extensions, skip_dirs={'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', '.idea'}):
+            try:
+                findings = inventory.findings("mobile_audit", CHECKER_VERSION, entry, self.file_findings)
+            except OSError:
+                continue
+            self.files_checked += 1
+            self.issues.extend(findings["issues"])
+            self.warnings.extend(findings["warnings"])
+            self.passed_count += findings["passed_count"]
+
+    @staticmethod
+    def file_findings(entry) -> dict:
+        """Findings for one file, audited on its own so incremental runs can cache them per file."""
+        auditor = MobileAuditor()
+        auditor.audit_file(str(entry.path), read_text(entry, errors='replace'))
+        return {"issues": auditor.issues, "warnings": auditor.warnings, "passed_count": auditor.passed_count}
 
     def get_report(self):
         return {
@@ -628,6 +649,17 @@ class MobileAuditor:
         }
 
 
+def run_check(project_path: str, url: str = None) -> dict:
+    """Audit a file or directory and return the mobile report with a "passed" flag (prints nothing)."""
+    auditor = MobileAuditor()
+    if os.path.isfile(project_path):
+        auditor.audit_file(project_path)
+    else:
+        auditor.audit_directory(project_path)
+    report = auditor.get_report()
+    return {"script": "mobile_audit", "project": str(project_path), **report, "passed": report["compliant"]}
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python mobile_audit.py <directory>")
@@ -7,10 +7,17 @@ Based on Vercel Engineering best practices
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import get_inventory, read_text
+
 class PerformanceChecker:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
@@ -18,16 +25,17 @@ class PerformanceChecker:
         self.warnings = []
         self.passed = []
 
+    def source_files(self, *extensions: str) -> List[Path]:
+        """Project files with these extensions, from the shared file inventory"""
+        return [self.project_path / entry.rel for entry in get_inventory(self.project_path).files(*extensions)]
+
     def check_waterfalls(self):
         """Check for sequential await patterns (Section 1)"""
         print("\n[*] Checking for waterfalls (sequential awaits)...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath in self.source_files('.ts', '.tsx', '.js', '.jsx'):
             try:
-                content = filepath.read_text(encoding='utf-8')
+                content = read_text(filepath, errors='strict')
 
                 # Pattern: multiple awaits in sequence without Promise.all
                 sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
@@ -47,12 +55,9 @@ class PerformanceChecker:
         """Check for barrel imports (Section 2)"""
         print("[*] Checking for barrel imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath in self.source_files('.ts', '.tsx', '.js', '.jsx'):
             try:
-                content = filepath.read_text(encoding='utf-8')
+                content = read_text(filepath, errors='strict')
 
                 # Pattern: import from index files or barrel exports
                 barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
@@ -73,12 +78,9 @@ class PerformanceChecker:
         """Check if large components use dynamic imports (Section 2)"""
         print("[*] Checking for missing dynamic imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath in self.source_files('.ts', '.tsx'):
             try:
-                content = filepath.read_text(encoding='utf-8')
+                content = read_text(filepath, errors='strict')
 
                 # Check file size - if > 10KB, should probably use dynamic import
                 if len(content) > 10000:
@@ -86,11 +88,11 @@ class PerformanceChecker:
                     filename = filepath.stem
 
                     # Search for static imports of this component
-                    for check_file in self.project_path.rglob('*.{ts,tsx}'):
-                        if check_file == filepath or 'node_modules' in str(check_file):
+                    for check_file in self.source_files('.ts', '.tsx'):
+                        if check_file == filepath:
                             continue
 
-                        check_content = check_file.read_text(encoding='utf-8')
+                        check_content = read_text(check_file, errors='strict')
                         if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
                             if 'dynamic(' not in check_content:
                                 self.warnings.append({
@@ -108,12 +110,9 @@ class PerformanceChecker:
         """Check for data fetching in useEffect (Section 4)"""
         print("[*] Checking for useEffect data fetching...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath in self.source_files('.ts', '.tsx'):
             try:
-                content = filepath.read_text(encoding='utf-8')
+                content = read_text(filepath, errors='strict')
 
                 # Pattern: fetch or axios in useEffect
                 if 'useEffect' in content:
@@ -132,12 +131,9 @@ class PerformanceChecker:
         """Check for missing React.memo, useMemo, useCallback (Section 5)"""
         print("[*] Checking for missing memoization...")
 
-        for filepath in self.project_path.rglob('*.{tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath in self.source_files('.tsx'):
             try:
-                content = filepath.read_text(encoding='utf-8')
+                content = read_text(filepath, errors='strict')
 
                 # Check for component definitions without memo
                 components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
@@ -159,12 +155,9 @@ class PerformanceChecker:
         """Check for unoptimized images (Section 6)"""
         print("[*] Checking for image optimization...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath in self.source_files('.ts', '.tsx', '.js', '.jsx'):
             try:
-                content = filepath.read_text(encoding='utf-8')
+                content = read_text(filepath, errors='strict')
 
                 # Check for <img> tags instead of next/image
                 if '<img' in content and 'next/image' not in content:
@@ -23,11 +23,12 @@ import re
 from pathlib import Path
 from datetime import datetime
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-except:
-    pass
+# Shared project file inventory (.agent/.shared/file_inventory.py)
+SHARED_DIR = Path(__file__).resolve().parents[3] / ".shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+from file_inventory import checker_version, get_inventory, read_text
+CHECKER_VERSION = checker_version(__file__)
 
 
 # Directories to skip
@@ -76,19 +77,17 @@ def is_page_file(file_path: Path) -> bool:
 
 
 def find_pages(project_path: Path) -> list:
-    """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    """Find page files to check (inventory entries)."""
+    extensions = ['.html', '.htm', '.jsx', '.tsx']
+    inventory = get_inventory(project_path)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
+    for ext in extensions:
+        # Skip excluded directories
+        for entry in inventory.files(ext, skip_dirs=SKIP_DIRS):
             # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+            if is_page_file(entry.path):
+                files.append(entry)
     
     return files[:50]  # Limit to 50 files
 
@@ -98,7 +97,7 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
@@ -145,6 +144,35 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run_check(project_path: str, url: str = None) -> dict:
+    """Check every page file and return the structured result (prints nothing)."""
+    project_path = Path(project_path).resolve()
+    pages = find_pages(project_path)
+    
+    if not pages:
+        return {"script": "seo_checker", "files_checked": 0, "passed": True}
+    
+    # Check each page
+    inventory = get_inventory(project_path)
+    all_issues = []
+    for entry in pages:
+        result = inventory.findings("seo_checker", CHECKER_VERSION, entry, lambda e: check_page(e.path))
+        if result["issues"]:
+            all_issues.append(result)
+    
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    
+    return {
+        "script": "seo_checker",
+        "project": str(project_path),
+        "files_checked": len(pages),
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        "passed": total_issues == 0,
+        "issues": all_issues
+    }
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -155,30 +183,22 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find pages
-    pages = find_pages(project_path)
+    output = run_check(str(project_path))
     
-    if not pages:
+    if not output["files_checked"]:
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
-        output = {"script": "seo_checker", "files_checked": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} page files to analyze\n")
-    
-    # Check each page
-    all_issues = []
-    for f in pages:
-        result = check_page(f)
-        if result["issues"]:
-            all_issues.append(result)
+    print(f"Found {output['files_checked']} page files to analyze\n")
     
     # Summary
     print("=" * 60)
     print("SEO ANALYSIS RESULTS")
     print("=" * 60)
     
+    all_issues = output.pop("issues")
     if all_issues:
         # Group by issue type
         issue_counts = {}
@@ -198,22 +218,15 @@ def main():
     else:
         print("\n[OK] No SEO issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    passed = total_issues == 0
-    
-    output = {
-        "script": "seo_checker",
-        "project": str(project_path),
-        "files_checked": len(pages),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except:
+        pass
     main()